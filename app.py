@@ -6,6 +6,7 @@ Run: python -m streamlit run app.py
 import streamlit as st
 import pandas as pd
 import numpy as np
+import json
 import time
 from datetime import datetime
 import pytz
@@ -21,7 +22,7 @@ st.set_page_config(
 # Persistence: Get last viewed ticker from URL
 if 'ticker' in st.query_params:
     st.session_state['last_ticker'] = st.query_params['ticker']
-from config import MARKETS, INDICES, COLORS, REFRESH_INTERVAL, CURRENCY_SYMBOLS
+from config import MARKETS, INDICES, COLORS, REFRESH_INTERVAL, CURRENCY_SYMBOLS, CACHE_MAX_BYTES
 from core.data_engine import (
     fetch_stock_data, fetch_live_price,
     fetch_performance, fetch_indices_data,
@@ -31,12 +32,19 @@ from core.technical_engine import (
     compute_all_indicators, get_oscillator_summary,
     get_ma_summary, get_overall_rating, get_support_resistance,
 )
+from core.eda_engine import universe_eda
 from core.ml_engine import get_ml_results
-from core.news_engine import fetch_ticker_news, fetch_market_news, compute_sentiment_score
+from core.training_queue import get_job, latest_result as latest_ml_result
+from core.news_engine import fetch_ticker_news, fetch_market_news, compute_sentiment_score, unique_articles
 from core.signals import generate_master_signal, get_trade_plan
-from core import charts
+from core.screener import get_screener_table
+from core import cache, charts
+from core import perf as tracing
 
 IST = pytz.timezone("Asia/Kolkata")
+run_id = tracing.begin_run()
+# Hidden diagnostics tab: open the app with ?perf=1
+show_perf = st.query_params.get("perf") == "1"
 
 
 
@@ -76,7 +84,7 @@ with st.sidebar:
     st.divider()
 
     if search_query and len(search_query.strip()) >= 2:
-        # LIVE Yahoo Finance search — covers EVERYTHING
+        # Local index first, live Yahoo Finance search for anything unknown
         results = search_tickers(search_query.strip())
 
         if results:
@@ -143,6 +151,18 @@ with st.sidebar:
     st.markdown(f"**🕒 {now_ist.strftime('%H:%M:%S IST')}**")
     st.caption(now_ist.strftime("%A, %d %b %Y"))
 
+    with st.expander("🧮 Cache diagnostics"):
+        used = cache.store.total_bytes
+        st.progress(min(used / CACHE_MAX_BYTES, 1.0),
+                    text=f"{used / 2**20:,.1f} / {CACHE_MAX_BYTES / 2**20:,.0f} MB")
+        cache_stats = pd.DataFrame(cache.store.stats())
+        if not cache_stats.empty:
+            cache_stats["MB"] = (cache_stats.pop("bytes") / 2**20).round(2)
+            cache_stats["quota MB"] = (cache_stats.pop("quota") / 2**20).round(0)
+            st.dataframe(cache_stats.set_index("namespace"))
+        else:
+            st.caption("Nothing cached yet.")
+
 
 # ═══════════════════════════════════════════════════════════════
 # HEADER — Live Indices Bar
@@ -224,13 +244,14 @@ if is_gold or is_silver:
         st.caption('💡 Separate tickers for India MCX and Dubai Spot rates.')
 # TABS
 # ═══════════════════════════════════════════════════════════════
-tab1, tab2, tab3, tab4, tab5 = st.tabs([
+tab1, tab2, tab3, tab4, tab5, tab6, *perf_tab = st.tabs([
     "📊 Dashboard",
     "🤖 AI & ML Analysis",
     "📰 News & Sentiment",
     "📐 Technicals",
     "🗂️ EDA Report",
-])
+    "🔭 Screener",
+] + (["⚙️ Performance"] if show_perf else []))
 
 
 # ─── TAB 1: DASHBOARD ────────────────────────────────────────
@@ -304,20 +325,43 @@ with tab1:
 
 
 # ─── TAB 2: AI & ML ANALYSIS ────────────────────────────────
+ml_training = False
 with tab2:
     st.markdown(f"### 🤖 AI Analysis — {selected_name}")
     st.caption("EDA runs first → best models selected automatically → full metrics reported")
 
     if st.button("🚀 Run Full AI Analysis", type="primary"):
-        with st.spinner("Running EDA + training ML models... (30–60s)"):
-            ml_data = get_ml_results(df)
-            st.session_state["ml_data"] = ml_data
+        st.session_state["ml_job"] = get_ml_results(df, selected_ticker, background=True)
+        st.session_state["ml_job_ticker"] = selected_ticker
+
+    # Background training: poll the job, show the last completed result meanwhile
+    job = None
+    if st.session_state.get("ml_job_ticker") == selected_ticker:
+        job = get_job(st.session_state.get("ml_job"))
+    if job and job["status"] == "done":
+        st.session_state["ml_data"] = job["result"]
+        st.session_state["ml_ticker"] = selected_ticker
+        st.session_state.pop("ml_job", None)
+    elif job and job["status"] == "failed":
+        st.error(f"❌ Training failed: {job['error']}")
+        st.session_state.pop("ml_job", None)
+    elif job:
+        ml_training = True
+        st.progress(job["progress"], text=f"⏳ {job['stage']}… ({time.time() - job['submitted']:.0f}s)")
+
+    if st.session_state.get("ml_ticker") != selected_ticker:
+        last = latest_ml_result(selected_ticker)
+        if last:
+            st.session_state["ml_data"] = last
             st.session_state["ml_ticker"] = selected_ticker
 
     ml_data = st.session_state.get("ml_data")
     if not ml_data or st.session_state.get("ml_ticker") != selected_ticker:
-        st.info("👆 Click **Run Full AI Analysis** to start.")
+        if not ml_training:
+            st.info("👆 Click **Run Full AI Analysis** to start.")
     else:
+        if ml_training:
+            st.caption("Showing the last completed analysis while a fresh one trains.")
         eda = ml_data.get("eda", {})
         models = ml_data.get("models", {})
         ensemble = models.get("_ensemble", {})
@@ -383,8 +427,13 @@ with tab2:
                         "ROC-AUC": m.get("roc_auc", 0),
                         "CV Acc %": f"{m.get('cv_accuracy_mean',0)} ± {m.get('cv_accuracy_std',0)}",
                         "CV AUC": m.get("cv_auc_mean", 0),
+                        "CV from": m.get("cv_from", "this fit"),
                         "Prob UP %": f"{m.get('prob_up',0)*100:.1f}",
                         "Signal": m.get("prediction", "–"),
+                        "Fit": m.get("source", "trained"),
+                        "Wall s": m.get("timing", {}).get("wall_s", "–"),
+                        "CPU s": m.get("timing", {}).get("cpu_s", "–"),
+                        "Jobs": m.get("timing", {}).get("n_jobs", "–"),
                     })
             if rows:
                 st.dataframe(pd.DataFrame(rows).set_index("Model"))
@@ -444,7 +493,7 @@ with tab3:
         ticker_articles = fetch_ticker_news(selected_ticker)
         market_articles = fetch_market_news(market_type)
 
-    all_articles = ticker_articles + market_articles[:5]
+    all_articles = unique_articles(ticker_articles + market_articles[:5])
     sentiment_score, sentiment_label, sentiment_counts = compute_sentiment_score(all_articles)
 
     col_news, col_sent = st.columns([2, 1])
@@ -561,9 +610,13 @@ with tab5:
         if tf:
             import plotly.graph_objects as go
             feat_df = pd.DataFrame(tf, columns=["Feature", "MI Score"])
+            bounds = pd.DataFrame(eda.get("feature_ranking", []), columns=["feature", "mi", "mi_low", "mi_high"])
+            bounds = bounds.set_index("feature").reindex(feat_df["Feature"])
             fi2 = go.Figure(go.Bar(
                 y=feat_df["Feature"], x=feat_df["MI Score"],
                 orientation="h", marker_color="#00D2FF",
+                error_x=dict(type="data", array=(bounds["mi_high"] - bounds["mi"]).tolist(),
+                             arrayminus=(bounds["mi"] - bounds["mi_low"]).tolist(), color="#8B949E"),
                 text=[f"{v:.3f}" for v in feat_df["MI Score"]], textposition="outside",
             ))
             fi2.update_layout(
@@ -587,11 +640,94 @@ with tab5:
                 pd.DataFrame(ms.items(), columns=["Model", "Score"]).sort_values("Score", ascending=False)
             )
 
+    st.divider()
+    st.markdown("#### 🌐 Universe Regimes")
+    st.caption("Return moments, volatility regime, class balance and autocorrelation for every asset, in one batch.")
+    if st.button("📊 Compare All Markets"):
+        with st.spinner("Running batch EDA across all markets..."):
+            st.session_state["universe_eda"] = universe_eda(period=chart_period)
+    regimes = st.session_state.get("universe_eda")
+    if regimes is not None and not regimes.empty:
+        st.dataframe(
+            regimes[["ticker", "name", "market", "n_samples", "mean_return_pct", "std_pct",
+                     "skewness", "kurtosis", "volatility_regime", "majority_ratio",
+                     "acf_1", "ljungbox_p", "has_autocorrelation"]].round(4).set_index("ticker"),
+            height=400,
+        )
+
+
+# ─── TAB 6: MARKET SCREENER ──────────────────────────────────
+with tab6:
+    st.markdown("### 🔭 Market Screener")
+    st.caption("Technical rating + master signal for every asset in every market, ranked. ML and sentiment are neutral here.")
+
+    if st.button("🔎 Scan All Markets", type="primary"):
+        with st.spinner("Scanning the full universe..."):
+            st.session_state["screener"] = get_screener_table(chart_period)
+
+    scan = st.session_state.get("screener")
+    if scan is None:
+        st.info("👆 Click **Scan All Markets** to rank every asset.")
+    elif scan.empty:
+        st.warning("Screener returned no data.")
+    else:
+        market_filter = st.multiselect("Markets", list(MARKETS.keys()), default=list(MARKETS.keys()))
+        view = scan[scan["market"].isin(market_filter)]
+        st.dataframe(
+            view.rename(columns={
+                "rank": "Rank", "symbol": "Symbol", "name": "Name", "market": "Market",
+                "price": "Price", "change_pct": "Change %", "rating": "Rating",
+                "tech_score": "Tech Score", "buy": "Buy", "neutral": "Neutral", "sell": "Sell",
+                "signal": "Signal", "score": "Master Score", "rsi": "RSI", "adx": "ADX",
+            }).set_index("Rank"),
+            height=600,
+        )
+
+
+# ─── TAB 7: PERFORMANCE (hidden, ?perf=1) ────────────────────
+if perf_tab:
+    with perf_tab[0]:
+        st.markdown("### ⚙️ Performance")
+        st.caption("Latency of traced core calls across recent reruns (all sessions in this process).")
+
+        this_run = tracing.spans(run_id)
+        c1, c2, c3 = st.columns(3)
+        elapsed = time.perf_counter() - min(r["start"] for r in this_run) if this_run else 0.0
+        c1.metric("This rerun (so far)", f"{elapsed * 1000:,.0f} ms")
+        c2.metric("Traced calls", len(this_run))
+        c3.metric("Spans buffered", len(tracing.spans()))
+
+        stage_summary = tracing.summary()
+        if stage_summary.empty:
+            st.info("No traced calls recorded yet.")
+        else:
+            st.dataframe(stage_summary.set_index(["stage", "name"]))
+
+        run_counts = tracing.runs()
+        if run_counts:
+            trace_run = st.selectbox(
+                "Rerun to export",
+                list(run_counts),
+                format_func=lambda r: f"#{r} ({run_counts[r]} spans){' — current' if r == run_id else ''}",
+                index=1 if len(run_counts) > 1 else 0,
+            )
+            st.download_button(
+                "⬇️ Chrome trace (JSON)",
+                json.dumps(tracing.chrome_trace(trace_run)),
+                file_name=f"tradeintel-run-{trace_run}.json",
+                mime="application/json",
+            )
+            st.caption("Open in chrome://tracing or ui.perfetto.dev.")
+
 
 # ═══════════════════════════════════════════════════════════════
 # AUTO REFRESH
 # ═══════════════════════════════════════════════════════════════
-if auto_refresh:
+if ml_training:
+    # Poll the background training job
+    time.sleep(2)
+    st.rerun()
+elif auto_refresh:
     st.caption(f"Auto-refreshing in {REFRESH_INTERVAL}s...")
     time.sleep(REFRESH_INTERVAL)
     st.rerun()
@@ -0,0 +1 @@
+# TradeIntel Pro - Benchmarks
@@ -0,0 +1,69 @@
+"""
+TradeIntel Pro - Indicator Benchmark
+Fused NumPy kernel vs the `ta` object pipeline, with a parity check.
+
+Run: python -m benchmarks.bench_indicators [--sizes 10000 1000000] [--skip-ta-above N]
+
+Residual differences on long series (~1e-6 on the Bollinger bands) come from
+pandas' online rolling variance drifting; the kernel uses an exact two-pass std.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.synthetic import synthetic_ohlcv
+from core import cache
+from core.technical_engine import compute_all_indicators, compute_all_indicators_ta
+
+
+def _timed(fn, df, repeat):
+    best = float("inf")
+    out = None
+    for _ in range(repeat):
+        cache.store.clear("indicators")   # time the kernel, not a memo hit
+        t0 = time.perf_counter()
+        out = fn(df)
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def max_rel_diff(a, b):
+    """Largest relative difference over columns added by the indicator pipeline."""
+    worst = 0.0
+    for col in b.columns:
+        if col in ("Date", "Open", "High", "Low", "Close", "Volume"):
+            continue
+        x = a[col].to_numpy(dtype=float)
+        y = b[col].to_numpy(dtype=float)
+        if not np.array_equal(np.isnan(x), np.isnan(y)):
+            return float("inf")
+        ok = ~np.isnan(y) & np.isfinite(y) & np.isfinite(x)
+        if ok.any():
+            worst = max(worst, float(np.max(np.abs(x[ok] - y[ok]) / (1 + np.abs(y[ok])))))
+    return worst
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--skip-ta-above", type=int, default=None,
+                        help="only time the kernel for sizes above this (ta is very slow at 1M rows)")
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'kernel s':>10} {'ta s':>10} {'speedup':>9} {'max rel diff':>13}")
+    for n in args.sizes:
+        df = synthetic_ohlcv(n)
+        t_fast, fast = _timed(compute_all_indicators, df, args.repeat)
+        if args.skip_ta_above is not None and n > args.skip_ta_above:
+            print(f"{n:>10} {t_fast:>10.4f} {'–':>10} {'–':>9} {'–':>13}")
+            continue
+        t_ta, ref = _timed(compute_all_indicators_ta, df, 1)
+        diff = max_rel_diff(fast, ref)
+        print(f"{n:>10} {t_fast:>10.4f} {t_ta:>10.4f} {t_ta / t_fast:>8.1f}x {diff:>13.2e}")
+
+
+if __name__ == "__main__":
+    main()
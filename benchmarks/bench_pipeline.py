@@ -0,0 +1,213 @@
+"""
+TradeIntel Pro - Pipeline Benchmark
+Times every stage of the analysis pipeline on synthetic history and writes
+the results as JSON, so runs from different commits can be compared.
+
+Run:
+    python -m benchmarks.bench_pipeline [--sizes 250 2000 20000 200000]
+                                        [--out results.json] [--compare base.json]
+
+Stages: offline store load, compute_all_indicators, technical rating,
+run_eda, run_ml_analysis (the uncached pipeline), generate_master_signal +
+get_trade_plan, and each core.charts builder. ML training is skipped above
+--ml-max-bars since the app itself only trains on the last 500 rows, and
+run_eda above --eda-max-bars. Memoized stages (indicators, charts, run_eda's
+test cache) are timed cold: their cache is cleared before every repeat.
+Skipped stages are listed in the JSON with a reason.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timezone
+
+# Keep the store and model registry out of the user's data dir
+# (config reads this at import time, so it must be set first)
+os.environ.setdefault("TRADEINTEL_DATA_DIR", tempfile.mkdtemp(prefix="tradeintel-bench-"))
+
+import numpy as np
+import pandas as pd
+
+from benchmarks import offline
+from benchmarks.synthetic import synthetic_ohlcv
+from core import cache, charts, ohlcv_store
+from core.eda_engine import FEATURE_COLUMNS, run_eda
+from core.feature_matrix import FeatureMatrix
+from core.ml_engine import run_ml_pipeline
+from core.signals import generate_master_signal, get_trade_plan
+from core.technical_engine import (
+    compute_all_indicators, get_oscillator_summary, get_ma_summary, get_overall_rating,
+)
+
+DEFAULT_SIZES = [250, 2_000, 20_000, 200_000]
+
+
+# ═══════════════════════════════════════════════════════════════
+# TIMING
+# ═══════════════════════════════════════════════════════════════
+def _time(fn, repeat):
+    """Run fn `repeat` times; return (timings, last result)."""
+    times, out = [], None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        times.append(time.perf_counter() - t0)
+    return times, out
+
+
+def _record(results, stage, bars, times):
+    results.append({
+        "stage": stage,
+        "bars": bars,
+        "repeat": len(times),
+        "best_s": round(min(times), 6),
+        "median_s": round(statistics.median(times), 6),
+    })
+    print(f"{stage:<28} {bars:>8} {min(times):>10.4f} {statistics.median(times):>10.4f}")
+
+
+def _skip(results, stage, bars, reason):
+    results.append({"stage": stage, "bars": bars, "skipped": reason})
+    print(f"{stage:<28} {bars:>8} {'skipped':>10}")
+
+
+def bench_size(n, repeat, ml_max_bars, eda_max_bars, results):
+    """Time each pipeline stage on `n` synthetic bars."""
+    ticker = f"BENCH{n}"
+    # A new ticker each repeat: always the cold path (full download + write).
+    # Stub frames are generated up front so only the store is timed.
+    tickers = [f"{ticker}-{i}" for i in range(repeat)]
+    for t in tickers:
+        offline.OfflineTicker(t, bars=n).history(period="max")
+    fresh = iter(tickers)
+    with offline.install(bars=n):
+        times, _ = _time(lambda: ohlcv_store.update(next(fresh)), repeat)
+    _record(results, "ohlcv_store.update", n, times)
+
+    raw = synthetic_ohlcv(n)
+    times, df = _time(lambda: (cache.store.clear("indicators"), compute_all_indicators(raw))[1], repeat)
+    _record(results, "compute_all_indicators", n, times)
+
+    def rating():
+        osc, ma = get_oscillator_summary(df), get_ma_summary(df)
+        return osc, ma, get_overall_rating(osc, ma)
+    times, (osc, ma, tech_rating) = _time(rating, repeat)
+    _record(results, "technical_rating", n, times)
+
+    if n <= eda_max_bars:
+        times, _ = _time(lambda: (cache.store.clear("eda"), run_eda(df)), repeat)
+        _record(results, "run_eda", n, times)
+    else:
+        _skip(results, "run_eda", n, f"above --eda-max-bars={eda_max_bars}")
+
+    ml_models = None
+    if n <= ml_max_bars:
+        times, ml = _time(lambda: run_ml_pipeline(FeatureMatrix.from_frame(df, FEATURE_COLUMNS)), 1)
+        ml_models = ml.get("models")
+        _record(results, "run_ml_analysis", n, times)
+    else:
+        _skip(results, "run_ml_analysis", n, f"above --ml-max-bars={ml_max_bars}")
+
+    price = float(df["Close"].iloc[-1])
+    atr = float(df["ATR"].iloc[-1])
+
+    def signal():
+        sig = generate_master_signal(tech_rating, ml_models, 0.1)
+        return get_trade_plan(sig, price, atr)
+    times, _ = _time(signal, repeat)
+    _record(results, "generate_master_signal", n, times)
+
+    perf = {"1D": 0.4, "1W": -1.2, "1M": 2.5, "3M": 5.1, "6M": -3.3, "1Y": 12.0}
+    chart_calls = {
+        "charts.candlestick_chart": lambda: charts.candlestick_chart(df, ticker),
+        "charts.rsi_chart": lambda: charts.rsi_chart(df),
+        "charts.signal_gauge": lambda: charts.signal_gauge(0.42),
+        "charts.performance_chart": lambda: charts.performance_chart(perf),
+        "charts.ml_comparison_chart": lambda: charts.ml_comparison_chart(ml_models or {}),
+        "charts.sentiment_donut": lambda: charts.sentiment_donut(12, 5, 8),
+    }
+    for stage, fn in chart_calls.items():
+        times, _ = _time(lambda: (cache.store.clear("charts"), fn()), repeat)
+        _record(results, stage, n, times)
+
+
+# ═══════════════════════════════════════════════════════════════
+# REPORTING
+# ═══════════════════════════════════════════════════════════════
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+
+def compare(current, baseline_path, threshold):
+    """Print per-stage ratios against a previous run; returns the number of regressions."""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    base = {(r["stage"], r["bars"]): r["best_s"] for r in baseline["results"] if "best_s" in r}
+    print(f"\nvs {baseline_path} ({baseline['meta'].get('commit')})")
+    print(f"{'stage':<28} {'bars':>8} {'base s':>10} {'now s':>10} {'ratio':>7}")
+    regressions = 0
+    for r in current["results"]:
+        old = base.get((r["stage"], r["bars"]))
+        if not old or "best_s" not in r:
+            continue
+        ratio = r["best_s"] / old
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  ← slower"
+            regressions += 1
+        print(f"{r['stage']:<28} {r['bars']:>8} {old:>10.4f} {r['best_s']:>10.4f} {ratio:>6.2f}x{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--ml-max-bars", type=int, default=2_000)
+    parser.add_argument("--eda-max-bars", type=int, default=1_000_000)
+    parser.add_argument("--out", default=None, help="JSON output path (default: bench-<commit>.json)")
+    parser.add_argument("--compare", default=None, help="previous JSON run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="relative slowdown reported as a regression (default 0.10)")
+    args = parser.parse_args()
+
+    commit = _git_commit()
+    print(f"{'stage':<28} {'bars':>8} {'best s':>10} {'median s':>10}")
+    results = []
+    for n in args.sizes:
+        bench_size(n, args.repeat, args.ml_max_bars, args.eda_max_bars, results)
+
+    report = {
+        "meta": {
+            "commit": commit,
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    out = args.out or f"bench-{commit or 'local'}.json"
+    with open(out, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nWrote {out}")
+
+    if args.compare:
+        compare(report, args.compare, args.threshold)
+
+
+if __name__ == "__main__":
+    main()
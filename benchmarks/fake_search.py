@@ -0,0 +1,91 @@
+"""
+TradeIntel Pro - Fake Search Server
+Local stand-in for Yahoo's ticker search endpoint, answering from config
+MARKETS/INDICES with an optional artificial latency. Point the app (or the
+async I/O layer) at it to work on search offline:
+
+    python -m benchmarks.fake_search --port 8765 --delay 0.3
+    TRADEINTEL_SEARCH_URL=http://127.0.0.1:8765/v1/finance/search streamlit run app.py
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from config import MARKETS, INDICES
+
+
+def _universe():
+    rows = [(sym, name) for market in MARKETS.values() for sym, name in market.items()]
+    rows += [(sym, name) for sym, name in INDICES.items()]
+    return rows
+
+
+class FakeSearchServer(ThreadingHTTPServer):
+    """Threaded HTTP server; `hits` counts requests and `connections` distinct client sockets."""
+
+    daemon_threads = True
+
+    def __init__(self, address, delay=0.0):
+        super().__init__(address, _Handler)
+        self.delay = delay
+        self.hits = 0
+        self.connections = set()
+        self.universe = _universe()
+        self._lock = threading.Lock()
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1/finance/search"
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   # keep-alive, so connection reuse is observable
+
+    def do_GET(self):
+        server = self.server
+        with server._lock:
+            server.hits += 1
+            server.connections.add(self.client_address)
+        parts = urlsplit(self.path)
+        params = parse_qs(parts.query)
+        query = params.get("q", [""])[0].lower()
+        limit = int(params.get("quotesCount", ["20"])[0])
+        if server.delay:
+            time.sleep(server.delay)
+        quotes = [{"symbol": sym, "shortname": name, "quoteType": "EQUITY", "exchange": "FAKE"}
+                  for sym, name in server.universe
+                  if query in sym.lower() or query in name.lower()][:limit]
+        body = json.dumps({"quotes": quotes}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--delay", type=float, default=0.0, help="seconds added to every response")
+    args = parser.parse_args()
+    server = FakeSearchServer((args.host, args.port), delay=args.delay)
+    print(f"Serving fake search on {server.url}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+TradeIntel Pro - Synthetic Market Data
+Deterministic OHLCV generator for benchmarks and offline runs.
+
+Close follows geometric Brownian motion; intraday range and volume scale with
+the size of each day's move, so indicators and EDA see realistic structure.
+The same (n, seed) always yields the same frame.
+"""
+
+import numpy as np
+import pandas as pd
+
+TRADING_DAYS = 252
+
+
+def synthetic_ohlcv(n, seed=42, start_price=100.0, mu=0.08, sigma=0.25,
+                    base_volume=1_000_000, start="1990-01-01"):
+    """
+    `n` business-day bars with Date/Open/High/Low/Close/Volume columns,
+    shaped like fetch_stock_data output. `mu`/`sigma` are annualised.
+    """
+    rng = np.random.default_rng(seed)
+    dt = 1.0 / TRADING_DAYS
+    z = rng.standard_normal(n)
+    log_ret = (mu - 0.5 * sigma ** 2) * dt + sigma * np.sqrt(dt) * z
+    close = start_price * np.exp(np.cumsum(log_ret))
+
+    gap = rng.normal(0, 0.25 * sigma * np.sqrt(dt), n)
+    open_ = np.empty(n)
+    open_[0] = start_price
+    open_[1:] = close[:-1] * np.exp(gap[1:])
+
+    # Intraday excursions beyond the open/close body
+    wick = np.abs(rng.normal(0, 0.5 * sigma * np.sqrt(dt), (2, n)))
+    high = np.maximum(open_, close) * np.exp(wick[0])
+    low = np.minimum(open_, close) * np.exp(-wick[1])
+
+    # Volume: lognormal noise, heavier on large moves
+    shock = np.abs(z)
+    volume = np.round(base_volume * np.exp(rng.normal(0, 0.35, n)) * (0.6 + 0.4 * shock))
+
+    dates = pd.date_range(start, periods=n, freq="B", name="Date")
+    return pd.DataFrame({"Date": dates, "Open": open_, "High": high,
+                         "Low": low, "Close": close, "Volume": volume.astype(float)})
@@ -3,6 +3,8 @@ TradeIntel Pro - Configuration
 All stock tickers, commodities, indices, and settings.
 """
 
+import os
+
 # ═══════════════════════════════════════════════════════════════
 # INDIAN MARKET STOCKS (NSE)
 # ═══════════════════════════════════════════════════════════════
@@ -176,6 +178,90 @@ CURRENCY_SYMBOLS = {
 # ═══════════════════════════════════════════════════════════════
 REFRESH_INTERVAL = 60  # seconds
 MAX_WORKERS = 10
+QUOTE_TIMEOUT = 8  # seconds to wait for a batch of live quotes
+
+# ═══════════════════════════════════════════════════════════════
+# NETWORK
+# ═══════════════════════════════════════════════════════════════
+SEARCH_URL = os.environ.get("TRADEINTEL_SEARCH_URL", "https://query2.finance.yahoo.com/v1/finance/search")
+HTTP_TIMEOUT = 5            # seconds per HTTP request
+HTTP_POOL_SIZE = 20         # keep-alive connections per host in the shared session
+HTTP_MAX_CONCURRENCY = 8    # HTTP requests in flight across all sessions
+HOST_RATE_LIMIT = 5.0       # sustained requests per second per host
+HOST_RATE_BURST = 10        # requests a host may receive back-to-back
+
+# ═══════════════════════════════════════════════════════════════
+# LOCAL DATA STORE
+# ═══════════════════════════════════════════════════════════════
+DATA_DIR = os.environ.get(
+    "TRADEINTEL_DATA_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".tradeintel"),
+)
+STORE_BASE_PERIOD = "2y"       # history downloaded the first time a ticker is seen
+STORE_REFRESH_INTERVAL = 60    # seconds before the stored tail is re-fetched
+STALE_WHILE_REVALIDATE = 600   # seconds an expired history may be served while one refresh runs
+
+# ═══════════════════════════════════════════════════════════════
+# IN-MEMORY CACHE
+# ═══════════════════════════════════════════════════════════════
+_MB = 1024 * 1024
+CACHE_MAX_BYTES = 512 * _MB        # total budget for cached results in this process
+CACHE_POLICY = "lru"               # "lru" or "lfu" (approximate, sampled)
+CACHE_QUOTAS = {                   # per-namespace byte caps (within the total)
+    "history": 192 * _MB,
+    "indicators": 64 * _MB,
+    "charts": 32 * _MB,
+    "market": 64 * _MB,
+    "ml": 128 * _MB,
+    "news": 32 * _MB,
+    "eda": 16 * _MB,
+    "screener": 32 * _MB,
+    "search": 8 * _MB,
+}
+
+PERF_RING_SIZE = 20000             # traced calls kept for the Performance tab
+
+# ═══════════════════════════════════════════════════════════════
+# NEWS & SENTIMENT
+# ═══════════════════════════════════════════════════════════════
+NEWS_TIMEOUT = 15                  # seconds to wait for all keyword searches of one market
+SENTIMENT_MEMO_SIZE = 50000        # headline scores kept in memory in front of the SQLite store
+SENTIMENT_BACKEND = os.environ.get("TRADEINTEL_SENTIMENT_BACKEND", "textblob")  # "textblob" or "lexicon" (opt-in, faster)
+NEWS_DEDUP_THRESHOLD = 0.6         # estimated Jaccard similarity at which headlines are the same story
+NEWS_DEDUP_CAPACITY = 50000        # stories kept in the cross-ticker dedup index
+
+# ═══════════════════════════════════════════════════════════════
+# EDA
+# ═══════════════════════════════════════════════════════════════
+EDA_BUDGETS = {                    # seconds per statistic before its cheaper fallback is used
+    "adf": 0.25,
+    "mutual_info": 0.5,
+    "ljung_box": 0.05,
+    "normality": 0.02,
+}
+EDA_FALLBACK_SAMPLES = 2000        # most recent rows the fallbacks look at
+EDA_INCREMENTAL_MAX_BARS = 5       # reuse test results when the data moved by at most this many bars
+EDA_REUSE_P_BAND = (0.01, 0.20)    # ...and the previous p-value was outside this band (can't flip at 0.05)
+UNIVERSE_FETCH_TIMEOUT = 60        # seconds to wait for all histories of the universe EDA table
+FEATURE_RANK_METHOD = "histogram"  # mutual-information estimator: "histogram" (quantile bins) or "knn" (sklearn)
+FEATURE_RANK_BINS = 16             # quantile bins per feature for the histogram estimator
+FEATURE_RANK_MAX_ROWS = 20000      # rows scored per feature (random subsample beyond this; None = all)
+ML_TOP_K_FEATURES = None           # train on only the k best-ranked base features (None = all)
+
+# ═══════════════════════════════════════════════════════════════
+# ML MODEL REGISTRY
+# ═══════════════════════════════════════════════════════════════
+WARM_START_MAX_BARS = 10           # warm-start instead of refitting when at most this many bars are new
+WARM_START_EXTRA_ESTIMATORS = 25   # trees / boosting rounds added per warm start
+WARM_START_MAX_GROWTH = 2.0        # refit from scratch once an ensemble has grown this much
+TRAINING_WORKERS = 2               # background ML training processes
+TRAINING_JOB_RETENTION = 3600      # seconds a finished job (and its result) is kept
+
+# ═══════════════════════════════════════════════════════════════
+# BACKTEST
+# ═══════════════════════════════════════════════════════════════
+BACKTEST_MAX_HOLD = 20     # bars a position is held before a time exit
+BACKTEST_COST_BPS = 5.0    # cost per side (commission + slippage), basis points
 
 COLORS = {
     "buy": "#00C896", "sell": "#FF4757", "hold": "#FFA502",
@@ -0,0 +1,220 @@
+"""
+TradeIntel Pro - Async I/O Layer
+asyncio front-end for network access, shared by every Streamlit session.
+
+One event loop runs on a daemon thread; sync code (app.py, data_engine)
+submits coroutines to it with `run()`. All HTTP goes through one pooled
+keep-alive `requests.Session`, behind a global concurrency limit and a
+per-host token-bucket rate limit. Blocking library calls (yfinance) run
+on the loop's thread pool under their own concurrency limit.
+
+Ticker search is cancel-on-supersede: a new query on the same channel
+(one per browser session) cancels the previous one, so only the latest
+keystroke's result is awaited.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config import (
+    SEARCH_URL, HTTP_TIMEOUT, HTTP_POOL_SIZE, HTTP_MAX_CONCURRENCY,
+    HOST_RATE_LIMIT, HOST_RATE_BURST, MAX_WORKERS,
+)
+
+_lock = threading.Lock()
+_loop = None
+_session = None
+
+# Loop-thread state (only touched from coroutines, so no locks needed)
+_http_slots = None
+_blocking_slots = None
+_limiters = {}
+_searches = {}             # channel → in-flight search task
+_superseded = set()        # search tasks cancelled by a newer query on their channel
+
+
+# ═══════════════════════════════════════════════════════════════
+# EVENT LOOP & SESSION
+# ═══════════════════════════════════════════════════════════════
+def _get_loop():
+    global _loop
+    with _lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="tradeintel-io", daemon=True).start()
+            _loop = loop
+        return _loop
+
+
+def get_session():
+    """Process-wide pooled HTTP session (keep-alive, HTTP_POOL_SIZE connections per host)."""
+    global _session
+    with _lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers["User-Agent"] = "Mozilla/5.0"
+            _session = session
+        return _session
+
+
+def run(coro, timeout=None):
+    """Run a coroutine on the I/O loop from synchronous code and return its result."""
+    future = asyncio.run_coroutine_threadsafe(coro, _get_loop())
+    try:
+        return future.result(timeout)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise
+
+
+def spawn(coro):
+    """Schedule a coroutine on the I/O loop without waiting (returns a concurrent Future)."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop())
+
+
+# ═══════════════════════════════════════════════════════════════
+# LIMITS
+# ═══════════════════════════════════════════════════════════════
+class _TokenBucket:
+    """`rate` requests/second sustained, up to `burst` at once."""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    async def acquire(self):
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+def _limits():
+    global _http_slots, _blocking_slots
+    if _http_slots is None:
+        _http_slots = asyncio.Semaphore(HTTP_MAX_CONCURRENCY)
+        _blocking_slots = asyncio.Semaphore(MAX_WORKERS)
+    return _http_slots, _blocking_slots
+
+
+def _limiter(host):
+    if host not in _limiters:
+        _limiters[host] = _TokenBucket(HOST_RATE_LIMIT, HOST_RATE_BURST)
+    return _limiters[host]
+
+
+# ═══════════════════════════════════════════════════════════════
+# PRIMITIVES
+# ═══════════════════════════════════════════════════════════════
+async def get_json(url, params=None, timeout=HTTP_TIMEOUT):
+    """GET `url` on the shared session and decode JSON (rate- and concurrency-limited)."""
+    http_slots, _ = _limits()
+    async with http_slots:
+        await _limiter(urlsplit(url).netloc).acquire()
+        resp = await asyncio.to_thread(get_session().get, url, params=params, timeout=timeout)
+    resp.raise_for_status()
+    return resp.json()
+
+
+async def call_blocking(fn, *args, **kwargs):
+    """Run a blocking call (e.g. yfinance) on the I/O thread pool, at most MAX_WORKERS at once."""
+    _, blocking_slots = _limits()
+    async with blocking_slots:
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+
+def _non_empty(result):
+    """Truthiness that also works for DataFrames (empty frames count as no result)."""
+    empty = getattr(result, "empty", None)
+    return not empty if isinstance(empty, bool) else bool(result)
+
+
+async def gather_partial(calls, timeout):
+    """
+    Await {key: coroutine} concurrently for at most `timeout` seconds.
+    Returns {key: result} for calls that finished without error and with a
+    non-empty result; the rest are cancelled and omitted.
+    """
+    tasks = {key: asyncio.ensure_future(coro) for key, coro in calls.items()}
+    if not tasks:
+        return {}
+    done, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+    for task in pending:
+        task.cancel()
+    if pending:
+        print(f"I/O timeout for: {', '.join(str(k) for k, t in tasks.items() if t in pending)}")
+    results = {}
+    for key, task in tasks.items():
+        if task in done and not task.exception() and _non_empty(task.result()):
+            results[key] = task.result()
+    return results
+
+
+# ═══════════════════════════════════════════════════════════════
+# TICKER SEARCH
+# ═══════════════════════════════════════════════════════════════
+def _parse_quotes(data):
+    return [{
+        "symbol": q.get("symbol", ""),
+        "name": q.get("shortname") or q.get("longname") or q.get("symbol", ""),
+        "type": q.get("quoteType", "").capitalize(),
+        "exchange": q.get("exchange", ""),
+    } for q in data.get("quotes", [])]
+
+
+async def fetch_search(query, max_results=20):
+    """Remote ticker search: list of {symbol, name, type, exchange}."""
+    data = await get_json(SEARCH_URL, params={
+        "q": query,
+        "quotesCount": max_results,
+        "newsCount": 0,
+        "listsCount": 0,
+    })
+    return _parse_quotes(data)
+
+
+async def search(query, max_results=20, channel="default"):
+    """
+    Latest-wins search: cancels any search still in flight on `channel`.
+    Returns the results, or None if this query was itself superseded.
+    """
+    previous = _searches.get(channel)
+    if previous is not None and not previous.done():
+        _superseded.add(previous)
+        previous.cancel()
+    task = asyncio.ensure_future(fetch_search(query, max_results))
+    _searches[channel] = task
+    try:
+        return await task
+    except asyncio.CancelledError:
+        if task not in _superseded:
+            raise  # we were cancelled, not superseded
+        return None
+    finally:
+        _superseded.discard(task)
+        if _searches.get(channel) is task:
+            del _searches[channel]
+
+
+def search_sync(query, max_results=20, channel="default"):
+    """Blocking wrapper for `search`; [] on error, None if superseded."""
+    try:
+        return run(search(query, max_results, channel), timeout=HTTP_TIMEOUT + 1)
+    except Exception as e:
+        print(f"Search error: {e}")
+        return []
@@ -0,0 +1,229 @@
+"""
+TradeIntel Pro - Backtest Engine
+Walk-forward replay of the master signal and ATR trade plan over history.
+
+Every bar is scored at once with array ops — technical rating, 40/40/20
+master score, signal class and get_trade_plan levels — then orders are
+simulated with sliding windows over the following bars:
+  - BUY / STRONG BUY place a buy-stop at the plan entry for the next bar,
+    SELL / STRONG SELL a sell-stop; unfilled orders are cancelled
+  - a stop touched on the fill bar itself closes the trade at the stop (the
+    target is not counted on that bar: the intrabar order is unknown)
+  - after that, the first bar touching stop or target_1 closes the trade
+    (stop first if both are hit in one bar; gaps fill at the open)
+  - otherwise the position is closed at the close after BACKTEST_MAX_HOLD bars
+One position at a time: the only Python loop is over trades taken.
+"""
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from config import BACKTEST_MAX_HOLD, BACKTEST_COST_BPS
+from core import ohlcv_store
+from core.technical_engine import (
+    compute_all_indicators, get_oscillator_summary_series, get_ma_summary_series,
+    get_overall_rating_series,
+)
+
+# Signal classes (generate_master_signal thresholds)
+STRONG_SELL, SELL, HOLD, BUY, STRONG_BUY = -2, -1, 0, 1, 2
+SIGNAL_NAMES = {STRONG_SELL: "STRONG SELL", SELL: "SELL", HOLD: "HOLD",
+                BUY: "BUY", STRONG_BUY: "STRONG BUY"}
+
+
+# ═══════════════════════════════════════════════════════════════
+# PER-BAR SIGNALS
+# ═══════════════════════════════════════════════════════════════
+def master_scores(tech_score, ml_prob=0.5, sentiment=0.0):
+    """40% technical + 40% ML + 20% sentiment per bar, as in generate_master_signal."""
+    tech_normalized = (np.asarray(tech_score, dtype=np.float64) + 1) / 2
+    sentiment_normalized = (np.asarray(sentiment, dtype=np.float64) + 1) / 2
+    score = tech_normalized * 0.40 + np.asarray(ml_prob, dtype=np.float64) * 0.40 + sentiment_normalized * 0.20
+    return np.clip(score, 0, 1)
+
+
+def signal_classes(score):
+    """Signal class per bar (STRONG_SELL … STRONG_BUY) from master scores."""
+    return np.select(
+        [score > 0.70, score > 0.58, score < 0.30, score < 0.42],
+        [STRONG_BUY, BUY, STRONG_SELL, SELL],
+        default=HOLD,
+    )
+
+
+def trade_plans(close, atr, side):
+    """Vectorized get_trade_plan: entry, target_1, stop_loss per bar for side ±1 (0 = flat)."""
+    atr = np.where(atr == 0, close * 0.02, atr)  # Default 2% of price
+    entry = np.round(np.where(side > 0, close * 1.002, np.where(side < 0, close * 0.998, close)), 2)
+    target = np.round(close + np.where(side == 0, 1.0, side * 1.5) * atr, 2)
+    stop = np.round(close - np.where(side == 0, 1, side) * atr * 1.0, 2)
+    return entry, target, stop
+
+
+# ═══════════════════════════════════════════════════════════════
+# SIMULATION
+# ═══════════════════════════════════════════════════════════════
+def _first(mask):
+    """Index of the first True per row, or the row length if none."""
+    return np.where(mask.any(axis=1), mask.argmax(axis=1), mask.shape[1])
+
+
+def _simulate(df, side, entry, target, stop, max_hold, allow_short):
+    """Candidate trades for every signal bar, before the one-position rule."""
+    n = len(df)
+    o, h, l, c = (df[k].to_numpy(dtype=np.float64) for k in ("Open", "High", "Low", "Close"))
+
+    wanted = (side > 0) | ((side < 0) & allow_short)
+    t = np.flatnonzero(wanted[:-1])           # signal at close of t, order live on t+1
+    if len(t) == 0:
+        return None
+    s = side[t].astype(np.float64)
+    f = t + 1
+
+    # Stop-order fill on the next bar, gapping through the level at the open
+    long_ = s > 0
+    filled = np.where(long_, h[f] >= entry[t], l[f] <= entry[t])
+    fill_px = np.where(long_, np.maximum(o[f], entry[t]), np.minimum(o[f], entry[t]))
+    # Conservatively, a stop inside the fill bar's range was hit after the fill
+    stop_on_fill = np.where(long_, l[f] <= stop[t], h[f] >= stop[t])
+
+    # Exit windows: bars f+1 … f+max_hold (NaN-padded past the end of data)
+    pad = np.full(max_hold + 1, np.nan)
+    hw = sliding_window_view(np.concatenate([h, pad]), max_hold)[f + 1]
+    lw = sliding_window_view(np.concatenate([l, pad]), max_hold)[f + 1]
+    ow = sliding_window_view(np.concatenate([o, pad]), max_hold)[f + 1]
+    tgt, stp = target[t][:, None], stop[t][:, None]
+    with np.errstate(invalid="ignore"):
+        stop_hit = np.where(long_[:, None], lw <= stp, hw >= stp)
+        tgt_hit = np.where(long_[:, None], hw >= tgt, lw <= tgt)
+    k_stop, k_tgt = _first(stop_hit), _first(tgt_hit)
+    k = np.minimum(k_stop, k_tgt)
+    hit = k < max_hold
+    by_stop = hit & (k_stop <= k_tgt)
+
+    rows = np.arange(len(t))
+    k_safe = np.minimum(k, max_hold - 1)
+    open_at = ow[rows, k_safe]
+    stop_px = np.where(long_, np.minimum(open_at, stop[t]), np.maximum(open_at, stop[t]))
+    tgt_px = np.where(long_, np.maximum(open_at, target[t]), np.minimum(open_at, target[t]))
+
+    time_idx = np.minimum(f + max_hold, n - 1)
+    exit_idx = np.where(stop_on_fill, f, np.where(hit, f + 1 + k, time_idx))
+    exit_px = np.where(stop_on_fill, stop[t],
+                       np.where(by_stop, stop_px, np.where(hit, tgt_px, c[time_idx])))
+    reason = np.where(stop_on_fill | by_stop, "stop", np.where(hit, "target",
+                      np.where(f + max_hold <= n - 1, "time", "end")))
+
+    keep = filled
+    return {
+        "signal_idx": t[keep], "entry_idx": f[keep], "exit_idx": exit_idx[keep],
+        "side": s[keep], "entry": fill_px[keep], "target": target[t][keep],
+        "stop": stop[t][keep], "exit": exit_px[keep], "reason": reason[keep],
+    }
+
+
+def _one_at_a_time(cand):
+    """Chain candidates so a new order is only placed once the last trade has exited."""
+    nxt = np.searchsorted(cand["signal_idx"], cand["exit_idx"], side="left")
+    taken, i = [], 0
+    while i < len(nxt):
+        taken.append(i)
+        i = nxt[i]
+    return {k: v[taken] for k, v in cand.items()}
+
+
+def _summary(trades, close, n_bars):
+    if trades.empty:
+        return {"trades": 0, "hit_rate": 0.0, "total_return": 0.0, "avg_trade": 0.0,
+                "max_drawdown": 0.0, "profit_factor": 0.0, "avg_bars_held": 0.0,
+                "exposure": 0.0, "buy_hold": round(float(close[-1] / close[0] - 1) * 100, 2)}
+    r = trades["return_pct"].to_numpy() / 100
+    equity = np.concatenate([[1.0], np.cumprod(1 + r)])
+    drawdown = equity / np.maximum.accumulate(equity) - 1
+    gains, losses = r[r > 0].sum(), -r[r < 0].sum()
+    return {
+        "trades": int(len(r)),
+        "hit_rate": round(float((r > 0).mean()) * 100, 2),
+        "total_return": round(float(equity[-1] - 1) * 100, 2),
+        "avg_trade": round(float(r.mean()) * 100, 3),
+        "max_drawdown": round(float(drawdown.min()) * 100, 2),
+        "profit_factor": round(float(gains / losses), 2) if losses > 0 else float("inf"),
+        "avg_bars_held": round(float(trades["bars_held"].mean()), 1),
+        "exposure": round(float(trades["bars_held"].sum()) / n_bars * 100, 2),
+        "buy_hold": round(float(close[-1] / close[0] - 1) * 100, 2),
+    }
+
+
+# ═══════════════════════════════════════════════════════════════
+# PUBLIC API
+# ═══════════════════════════════════════════════════════════════
+def run_backtest(df, ml_prob=0.5, sentiment=0.0, max_hold=BACKTEST_MAX_HOLD,
+                 cost_bps=BACKTEST_COST_BPS, allow_short=True):
+    """
+    Backtest the master signal on one OHLCV (or indicator) frame.
+    `ml_prob` / `sentiment` may be scalars or per-bar arrays; the defaults are
+    what the app uses when no ML run or news is available.
+    Returns {"summary": dict, "trades": DataFrame, "signals": DataFrame}.
+    """
+    if df.empty or len(df) < 50:
+        return {"summary": _summary(pd.DataFrame(), np.array([1.0, 1.0]), 1),
+                "trades": pd.DataFrame(), "signals": pd.DataFrame()}
+    if "RSI" not in df.columns:
+        df = compute_all_indicators(df)
+    df = df.reset_index(drop="Date" in df.columns)
+    dates = df["Date"] if "Date" in df.columns else df.index.to_series()
+
+    close = df["Close"].to_numpy(dtype=np.float64)
+    rating = get_overall_rating_series(get_oscillator_summary_series(df), get_ma_summary_series(df))
+    tech = rating["score"].to_numpy()
+    score = master_scores(tech, ml_prob, sentiment)
+    cls = signal_classes(score)
+    side = np.sign(cls)
+    entry, target, stop = trade_plans(close, df["ATR"].to_numpy(dtype=np.float64), side)
+
+    signals = pd.DataFrame({"Date": dates.to_numpy(), "tech_score": tech, "score": score,
+                            "signal": pd.Categorical.from_codes(cls + 2, list(SIGNAL_NAMES.values())),
+                            "entry": entry, "target_1": target, "stop_loss": stop})
+
+    cand = _simulate(df, side, entry, target, stop, max_hold, allow_short)
+    trades = pd.DataFrame()
+    if cand is not None and len(cand["signal_idx"]):
+        tk = _one_at_a_time(cand)
+        cost = 2 * cost_bps / 10_000
+        ret = tk["side"] * (tk["exit"] / tk["entry"] - 1) - cost
+        trades = pd.DataFrame({
+            "entry_date": dates.to_numpy()[tk["entry_idx"]],
+            "exit_date": dates.to_numpy()[tk["exit_idx"]],
+            "side": np.where(tk["side"] > 0, "Long", "Short"),
+            "entry": tk["entry"], "target_1": tk["target"], "stop_loss": tk["stop"],
+            "exit": tk["exit"], "reason": tk["reason"],
+            "bars_held": tk["exit_idx"] - tk["entry_idx"] + 1,
+            "return_pct": ret * 100,
+        })
+
+    return {"summary": _summary(trades, close, len(df)), "trades": trades, "signals": signals}
+
+
+def run_backtest_universe(tickers, period="2y", **kwargs):
+    """
+    Backtest many tickers (stored history from ohlcv_store, or a dict of
+    ticker → frame). Returns (summary DataFrame, all trades DataFrame).
+    """
+    frames = tickers if isinstance(tickers, dict) else {
+        t: ohlcv_store.get_history(t, period) for t in tickers}
+    rows, all_trades = [], []
+    for ticker, df in frames.items():
+        try:
+            res = run_backtest(df, **kwargs)
+        except Exception as e:
+            print(f"Backtest error for {ticker}: {e}")
+            continue
+        rows.append({"ticker": ticker, **res["summary"]})
+        if not res["trades"].empty:
+            all_trades.append(res["trades"].assign(ticker=ticker))
+    summary = pd.DataFrame(rows)
+    if not summary.empty:
+        summary = summary.sort_values("total_return", ascending=False).reset_index(drop=True)
+    trades = pd.concat(all_trades, ignore_index=True) if all_trades else pd.DataFrame()
+    return summary, trades
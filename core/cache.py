@@ -0,0 +1,266 @@
+"""
+TradeIntel Pro - Memory-Bounded Cache
+Process-wide result cache with a byte budget, replacing st.cache_data.
+
+Every entry is sized when stored (DataFrames by their deep memory usage,
+arrays by nbytes, containers recursively). Each namespace ("history",
+"ml", "news", ...) may have its own byte quota on top of the global
+CACHE_MAX_BYTES budget; whichever limit is exceeded, entries of that scope
+are evicted LRU (or approximate-LFU) until it fits. Hits, misses, expiries
+and evictions are counted per namespace for the diagnostics panel.
+
+    @memoize("news", ttl=900)
+    def fetch_ticker_news(ticker): ...
+
+Arguments are keyed by content: DataFrames, Series and arrays by their
+core.fingerprint, so a key changes exactly when the data does.
+"""
+
+import copy
+import functools
+import inspect
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from config import CACHE_MAX_BYTES, CACHE_QUOTAS, CACHE_POLICY
+from core import fingerprint, perf
+
+LFU_SAMPLE = 16            # oldest entries considered when evicting under LFU
+_MISSING = object()
+
+
+# ═══════════════════════════════════════════════════════════════
+# SIZE ACCOUNTING
+# ═══════════════════════════════════════════════════════════════
+def sizeof(value, _depth=0):
+    """Approximate retained bytes of a cached value."""
+    if isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum() if hasattr(usage, "sum") else usage)
+    if isinstance(value, np.ndarray):
+        if value.dtype == object and _depth < 3:
+            return value.nbytes + sum(sizeof(v, _depth + 1) for v in value.flat)
+        return int(value.nbytes)
+    if isinstance(value, (str, bytes, bytearray, int, float, bool)) or value is None:
+        return sys.getsizeof(value)
+    if _depth >= 6:
+        return sys.getsizeof(value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(sizeof(k, _depth + 1) + sizeof(v, _depth + 1)
+                                          for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(sizeof(v, _depth + 1) for v in value)
+    if hasattr(value, "__dict__"):
+        return sys.getsizeof(value) + sizeof(vars(value), _depth + 1)
+    return sys.getsizeof(value)
+
+
+# ═══════════════════════════════════════════════════════════════
+# CACHE
+# ═══════════════════════════════════════════════════════════════
+class _Entry:
+    __slots__ = ("value", "size", "stored", "expires", "hits")
+
+    def __init__(self, value, size, ttl):
+        self.value = value
+        self.size = size
+        self.stored = time.time()
+        self.expires = self.stored + ttl if ttl else float("inf")
+        self.hits = 0
+
+
+class MemoryCache:
+    """LRU/LFU cache bounded by total bytes and optional per-namespace byte quotas."""
+
+    def __init__(self, max_bytes, quotas=None, policy="lru"):
+        self.max_bytes = max_bytes
+        self.quotas = dict(quotas or {})
+        self.policy = policy
+        self._entries = OrderedDict()      # (namespace, key) → _Entry, oldest use first
+        self._bytes = {}                   # namespace → bytes held
+        self._stats = {}                   # namespace → counters
+        self._lock = threading.Lock()
+
+    def _counters(self, ns):
+        if ns not in self._stats:
+            self._stats[ns] = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0, "rejected": 0}
+        return self._stats[ns]
+
+    # ── Lookup ──
+    def get(self, ns, key, default=None):
+        """Fresh value for (ns, key), or `default` on a miss/expiry."""
+        with self._lock:
+            entry = self._entries.get((ns, key))
+            counters = self._counters(ns)
+            if entry is None:
+                counters["misses"] += 1
+                return default
+            if time.time() >= entry.expires:
+                self._drop((ns, key))
+                counters["expired"] += 1
+                counters["misses"] += 1
+                return default
+            entry.hits += 1
+            counters["hits"] += 1
+            self._entries.move_to_end((ns, key))
+            return entry.value
+
+    def get_with_age(self, ns, key):
+        """(value, age seconds) of a live entry, or None; counted like get()."""
+        with self._lock:
+            entry = self._entries.get((ns, key))
+            counters = self._counters(ns)
+            if entry is None or time.time() >= entry.expires:
+                if entry is not None:
+                    self._drop((ns, key))
+                    counters["expired"] += 1
+                counters["misses"] += 1
+                return None
+            entry.hits += 1
+            counters["hits"] += 1
+            self._entries.move_to_end((ns, key))
+            return entry.value, time.time() - entry.stored
+
+    # ── Store ──
+    def put(self, ns, key, value, ttl=None):
+        """Store a value for `ttl` seconds (None = until evicted). Returns False if it can't fit."""
+        size = sizeof(value)
+        limit = min(self.max_bytes, self.quotas.get(ns, self.max_bytes))
+        with self._lock:
+            # Drop the old value first: a rejected overwrite must not leave it behind
+            if (ns, key) in self._entries:
+                self._drop((ns, key))
+            if size > limit:
+                self._counters(ns)["rejected"] += 1
+                return False
+            self._entries[(ns, key)] = _Entry(value, size, ttl)
+            self._bytes[ns] = self._bytes.get(ns, 0) + size
+            self._counters(ns)
+            self._evict(ns)
+            return True
+
+    def clear(self, ns=None, match=None):
+        """Drop everything, one namespace, or the keys in it for which match(key) is true."""
+        with self._lock:
+            for k in [k for k in self._entries
+                      if (ns is None or k[0] == ns) and (match is None or match(k[1]))]:
+                self._drop(k)
+
+    # ── Eviction ──
+    def _drop(self, k):
+        entry = self._entries.pop(k)
+        self._bytes[k[0]] -= entry.size
+
+    def _victim(self, ns=None):
+        now = time.time()
+        candidates = []
+        for k, entry in self._entries.items():   # oldest use first
+            if ns is not None and k[0] != ns:
+                continue
+            if now >= entry.expires:
+                return k                          # expired entries go first
+            candidates.append((entry.hits, len(candidates), k))
+            if self.policy != "lfu" or len(candidates) >= LFU_SAMPLE:
+                break
+        return min(candidates)[2] if candidates else None
+
+    def _evict(self, ns):
+        quota = self.quotas.get(ns)
+        while quota is not None and self._bytes.get(ns, 0) > quota:
+            self._drop_victim(self._victim(ns))
+        while sum(self._bytes.values()) > self.max_bytes:
+            self._drop_victim(self._victim())
+
+    def _drop_victim(self, k):
+        expired = time.time() >= self._entries[k].expires
+        self._drop(k)
+        self._counters(k[0])["expired" if expired else "evictions"] += 1
+
+    # ── Diagnostics ──
+    def stats(self):
+        """One row per namespace: entries, bytes, quota, hits, misses, hit rate, evictions."""
+        with self._lock:
+            counts = {}
+            for ns, _ in self._entries:
+                counts[ns] = counts.get(ns, 0) + 1
+            rows = []
+            for ns in sorted(set(self._stats) | set(self._bytes)):
+                c = self._counters(ns)
+                lookups = c["hits"] + c["misses"]
+                rows.append({
+                    "namespace": ns,
+                    "entries": counts.get(ns, 0),
+                    "bytes": self._bytes.get(ns, 0),
+                    "quota": self.quotas.get(ns),
+                    **c,
+                    "hit_rate": round(c["hits"] / lookups * 100, 1) if lookups else 0.0,
+                })
+            return rows
+
+    @property
+    def total_bytes(self):
+        with self._lock:
+            return sum(self._bytes.values())
+
+
+store = MemoryCache(CACHE_MAX_BYTES, CACHE_QUOTAS, CACHE_POLICY)
+
+
+# ═══════════════════════════════════════════════════════════════
+# MEMOIZE DECORATOR
+# ═══════════════════════════════════════════════════════════════
+def _key_part(value):
+    """Hashable, content-based stand-in for an argument."""
+    if isinstance(value, (pd.DataFrame, pd.Series, pd.Index, np.ndarray)):
+        return ("fp", fingerprint.of(value))
+    if isinstance(value, dict):
+        return ("dict", tuple(sorted((_key_part(k), _key_part(v)) for k, v in value.items())))
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(_key_part(v) for v in value))
+    if isinstance(value, set):
+        return ("set", tuple(sorted(_key_part(v) for v in value)))
+    return value
+
+
+def _detach(value):
+    """Deep copy so callers can't mutate the cached object in place (as st.cache_data)."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy(deep=True)
+    if isinstance(value, (dict, list, tuple)):
+        return copy.deepcopy(value)
+    return value
+
+
+def memoize(namespace, ttl=None, cache=None):
+    """
+    Cache a function's results in `namespace` for `ttl` seconds.
+    Arguments are keyed by content (DataFrames and arrays by hash); like
+    st.cache_data, parameters whose name starts with "_" are left out of the
+    key. Adds `.clear()` to drop this function's entries.
+    """
+    def decorator(fn):
+        sig = inspect.signature(fn)
+        target = cache or store
+        name = (fn.__module__, fn.__qualname__)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (name,) + tuple(
+                (arg, _key_part(v)) for arg, v in bound.arguments.items() if not arg.startswith("_"))
+            value = target.get(namespace, key, _MISSING)
+            perf.note(cache="miss" if value is _MISSING else "hit")
+            if value is _MISSING:
+                value = fn(*args, **kwargs)
+                target.put(namespace, key, value, ttl)
+            return _detach(value)
+
+        wrapper.clear = lambda: target.clear(namespace, lambda key: key[0] == name)
+        return wrapper
+    return decorator
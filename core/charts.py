@@ -8,6 +8,8 @@ from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
 
+from core import cache, perf
+
 DARK_THEME = dict(
     plot_bgcolor="#0D1117", paper_bgcolor="#0D1117",
     font=dict(color="#E6EDF3", family="Inter, sans-serif"),
@@ -25,6 +27,8 @@ def _apply_dark(fig, title="", height=400):
     return fig
 
 
+@perf.traced("charts")
+@cache.memoize("charts", ttl=600)
 def candlestick_chart(df, ticker_name="", show_bb=True, show_ema=True, show_volume=True):
     """Full candlestick with Bollinger Bands, EMA, MACD, Volume subplots."""
     if df.empty or len(df) < 5:
@@ -86,6 +90,7 @@ def candlestick_chart(df, ticker_name="", show_bb=True, show_ema=True, show_volu
     return fig
 
 
+@perf.traced("charts")
 def signal_gauge(score, title="Signal"):
     """Semicircle signal gauge (score: 0 to 1)."""
     value = round((score - 0.5) * 200, 1)
@@ -117,6 +122,8 @@ def signal_gauge(score, title="Signal"):
     return fig
 
 
+@perf.traced("charts")
+@cache.memoize("charts", ttl=600)
 def rsi_chart(df):
     """RSI with overbought/oversold zones."""
     if df.empty or 'RSI' not in df.columns:
@@ -134,6 +141,7 @@ def rsi_chart(df):
     return _apply_dark(fig, "RSI (14)", height=200)
 
 
+@perf.traced("charts")
 def performance_chart(perf_dict):
     """Colored bar chart for multi-timeframe performance."""
     if not perf_dict:
@@ -149,6 +157,7 @@ def performance_chart(perf_dict):
     return fig
 
 
+@perf.traced("charts")
 def ml_comparison_chart(ml_results):
     """Side-by-side ML accuracy and probability bars."""
     if not ml_results:
@@ -169,6 +178,7 @@ def ml_comparison_chart(ml_results):
     return fig
 
 
+@perf.traced("charts")
 def sentiment_donut(pos, neg, neu, title="News Sentiment"):
     """Sentiment breakdown donut."""
     total = pos + neg + neu or 1
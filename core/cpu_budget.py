@@ -0,0 +1,80 @@
+"""
+TradeIntel Pro - CPU Budget Scheduler
+Central core accounting for ML training.
+
+Every training step leases cores from one process-wide budget, so concurrent
+sessions share the machine instead of each spawning cpu_count() workers.
+Inside a lease the cores are split between outer CV folds and the inner
+estimator threads (outer × inner ≤ leased), which removes the folds × trees
+oversubscription of nesting n_jobs=-1 inside n_jobs=-1. Background training
+processes each get an equal slice of the machine via `configure()`.
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+_cond = threading.Condition()
+_total = os.cpu_count() or 1
+_available = _total
+
+
+def configure(cores):
+    """Set this process's core budget (called in each training worker)."""
+    global _total, _available
+    with _cond:
+        in_use = _total - _available
+        _total = max(1, int(cores))
+        _available = max(0, _total - in_use)
+        _cond.notify_all()
+
+
+def total():
+    return _total
+
+
+@contextmanager
+def lease(want=None, minimum=1):
+    """
+    Reserve up to `want` cores (default: the whole budget), blocking until at
+    least `minimum` are free. Yields the number granted.
+    """
+    global _available
+    want = _total if want is None else max(1, min(want, _total))
+    minimum = min(minimum, want)
+    with _cond:
+        while _available < minimum:
+            _cond.wait()
+        granted = min(want, _available)
+        _available -= granted
+    try:
+        yield granted
+    finally:
+        with _cond:
+            _available += granted
+            _cond.notify_all()
+
+
+def split(cores, n_folds, threaded_estimator):
+    """
+    Divide `cores` into (outer, inner): parallel CV folds × threads per fit.
+    Estimators without their own threading get one thread per fold.
+    """
+    outer = max(1, min(n_folds, cores))
+    inner = max(1, cores // outer) if threaded_estimator else 1
+    return outer, inner
+
+
+class Stopwatch:
+    """Wall and CPU seconds for a block (CPU covers all threads of this process)."""
+
+    def __enter__(self):
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+        return self
+
+    def __exit__(self, *exc):
+        self.wall = time.perf_counter() - self._wall
+        self.cpu = time.process_time() - self._cpu
+        return False
@@ -8,42 +8,112 @@ import numpy as np
 import yfinance as yf
 from datetime import datetime, timedelta
 import threading
-import streamlit as st
+from concurrent.futures import Future
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from config import QUOTE_TIMEOUT, STORE_REFRESH_INTERVAL, STALE_WHILE_REVALIDATE
+from core import async_io, cache, ohlcv_store, perf, search_index
 
 # ═══════════════════════════════════════════════════════════════
-# CACHING LAYER
+# CACHING LAYER (single-flight + stale-while-revalidate)
 # ═══════════════════════════════════════════════════════════════
-_cache = {}
+# Entries live in the shared memory-bounded cache, namespaced by key[0]
 _cache_lock = threading.Lock()
+_inflight = {}             # key → Future of the one fetch running for it
 CACHE_TTL = timedelta(minutes=5)
 
 
-def _get_cached(key):
-    with _cache_lock:
-        if key in _cache:
-            data, ts = _cache[key]
-            if datetime.now() - ts < CACHE_TTL:
-                return data
+def _get_cached(key, ttl=CACHE_TTL):
+    hit = cache.store.get_with_age(key[0], key)
+    if hit and hit[1] < ttl.total_seconds():
+        return hit[0]
     return None
 
 
-def _set_cached(key, data):
+def _set_cached(key, data, lifetime=CACHE_TTL):
+    cache.store.put(key[0], key, data, ttl=lifetime.total_seconds())
+
+
+def _fetch_into_cache(key, fetch, future, lifetime):
+    try:
+        data = fetch()
+        # An empty frame means the fetch failed (the store swallows errors):
+        # hand it to the waiting callers but don't cache it, so the next call retries
+        if not (isinstance(data, pd.DataFrame) and data.empty):
+            _set_cached(key, data, lifetime)
+        future.set_result(data)
+    except Exception as e:
+        future.set_exception(e)
+    finally:
+        with _cache_lock:
+            _inflight.pop(key, None)
+
+
+async def _revalidate(key, fetch, future, lifetime):
+    try:
+        await async_io.call_blocking(_fetch_into_cache, key, fetch, future, lifetime)
+    except Exception:
+        pass
+    if future.exception() is not None:
+        print(f"Background refresh failed for {key}: {future.exception()}")
+
+
+def _single_flight(key, fetch, ttl=CACHE_TTL, stale=timedelta(0)):
+    """
+    Cached `fetch()` for `key`, with at most one fetch per key in flight:
+    concurrent callers on a miss wait for the same call and share its result.
+    Within `stale` after expiry the old value is returned at once while a
+    single background refresh runs. Empty DataFrames are never cached.
+    """
+    lifetime = ttl + stale
     with _cache_lock:
-        _cache[key] = (data, datetime.now())
+        hit = cache.store.get_with_age(key[0], key)
+        if hit and hit[1] < ttl.total_seconds():
+            perf.note(cache="hit")
+            return hit[0]
+        perf.note(cache="stale" if hit else "miss")
+        future = _inflight.get(key)
+        leader = future is None
+        if leader:
+            future = Future()
+            _inflight[key] = future
+        if hit:
+            if leader:
+                async_io.spawn(_revalidate(key, fetch, future, lifetime))
+            return hit[0]
+    if leader:
+        _fetch_into_cache(key, fetch, future, lifetime)
+    return future.result()
+
+
+# ═══════════════════════════════════════════════════════════════
+# SHARED HISTORY PROVIDER
+# ═══════════════════════════════════════════════════════════════
+@perf.traced("fetch")
+def load_history(ticker):
+    """
+    Full stored daily history for a ticker (Date-indexed).
+    Chart data, live quote, performance and commodity conversion are all
+    derived from this one series, so a render costs one upstream call per ticker.
+    Shared by all sessions: one refresh per ticker at a time, and an expired
+    series is served while it refreshes in the background.
+    """
+    return _single_flight(("history", ticker), lambda: ohlcv_store.update(ticker),
+                          ttl=timedelta(seconds=STORE_REFRESH_INTERVAL),
+                          stale=timedelta(seconds=STALE_WHILE_REVALIDATE))
 
 
 # ═══════════════════════════════════════════════════════════════
 # DATA FETCHING
 # ═══════════════════════════════════════════════════════════════
-@st.cache_data(ttl=300, show_spinner=False)
+@perf.traced("fetch")
+@cache.memoize("market", ttl=300)
 def fetch_stock_data(ticker, period="1y"):
-    """Fetch historical OHLCV data for any ticker."""
+    """Fetch historical OHLCV data for any ticker (served from the local bar store)."""
     try:
-        stock = yf.Ticker(ticker)
-        df = stock.history(period=period)
+        df = ohlcv_store.slice_period(load_history(ticker), period)
         if df.empty:
             return pd.DataFrame()
-        df.index = df.index.tz_localize(None)
         df = df.reset_index()
         return df
     except Exception as e:
@@ -51,12 +121,12 @@ def fetch_stock_data(ticker, period="1y"):
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=60, show_spinner=False)
+@perf.traced("fetch")
+@cache.memoize("market", ttl=60)
 def fetch_live_price(ticker):
     """Get the latest price info for a ticker."""
     try:
-        stock = yf.Ticker(ticker)
-        hist = stock.history(period="5d")
+        hist = ohlcv_store.slice_period(load_history(ticker), "5d")
         if hist.empty:
             return None
 
@@ -91,12 +161,12 @@ def fetch_live_price(ticker):
         return None
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@perf.traced("fetch")
+@cache.memoize("market", ttl=300)
 def fetch_performance(ticker):
     """Calculate performance over multiple timeframes."""
     try:
-        stock = yf.Ticker(ticker)
-        hist = stock.history(period="1y")
+        hist = ohlcv_store.slice_period(load_history(ticker), "1y")
         if hist.empty or len(hist) < 5:
             return {}
 
@@ -131,21 +201,36 @@ def fetch_performance(ticker):
         return {}
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@perf.traced("fetch")
+def fetch_live_prices(tickers, timeout=QUOTE_TIMEOUT):
+    """
+    Fetch live quotes for many tickers concurrently (bounded by MAX_WORKERS).
+    Returns {ticker: quote}; tickers that fail or miss the deadline are omitted,
+    so the batch takes about as long as its slowest ticker, capped at `timeout`.
+    """
+    tickers = list(tickers)
+    if not tickers:
+        return {}
+    calls = {t: async_io.call_blocking(fetch_live_price, t) for t in tickers}
+    try:
+        quotes = async_io.run(async_io.gather_partial(calls, timeout))
+    except Exception as e:
+        print(f"Quote batch error: {e}")
+        return {}
+    # Keep the caller's ordering
+    return {t: quotes[t] for t in tickers if t in quotes}
+
+
+@perf.traced("fetch")
+@cache.memoize("market", ttl=300)
 def fetch_indices_data(indices_dict):
     """Fetch live data for market indices."""
-    results = {}
-    for ticker, name in indices_dict.items():
-        try:
-            data = fetch_live_price(ticker)
-            if data:
-                results[name] = data
-        except Exception:
-            pass
-    return results
-
-
-@st.cache_data(ttl=60, show_spinner=False)
+    quotes = fetch_live_prices(indices_dict.keys())
+    return {indices_dict[t]: data for t, data in quotes.items()}
+
+
+@perf.traced("fetch")
+@cache.memoize("market", ttl=60)
 def fetch_stock_info(ticker):
     """Get company info and metadata."""
     try:
@@ -177,7 +262,8 @@ INDIA_GST = 0.03             # 3%
 RETAIL_MARGIN = 0.015        # 1.5%
 BASIS_ADJUSTMENT = 0.925     # Calibrated to Landed
 
-@st.cache_data(ttl=300, show_spinner=False)
+@perf.traced("fetch")
+@cache.memoize("market", ttl=300)
 def get_commodity_in_local_currencies(commodity_ticker="GC=F", is_dubai=False):
     """
     Returns gold rates. 
@@ -185,13 +271,12 @@ def get_commodity_in_local_currencies(commodity_ticker="GC=F", is_dubai=False):
     If is_dubai=False: Returns India MCX/Retail rates.
     """
     try:
-        stock = yf.Ticker(commodity_ticker)
-        hist = stock.history(period="5d").dropna(subset=["Close"])
+        hist = ohlcv_store.slice_period(load_history(commodity_ticker), "5d").dropna(subset=["Close"])
         if hist.empty: return None
         usd_per_oz = float(hist["Close"].iloc[-1])
 
-        usdinr = yf.Ticker("USDINR=X").history(period="5d").dropna(subset=["Close"])
-        usdaed = yf.Ticker("USDAED=X").history(period="5d").dropna(subset=["Close"])
+        usdinr = ohlcv_store.slice_period(load_history("USDINR=X"), "5d").dropna(subset=["Close"])
+        usdaed = ohlcv_store.slice_period(load_history("USDAED=X"), "5d").dropna(subset=["Close"])
         inr_rate = float(usdinr["Close"].iloc[-1]) if not usdinr.empty else 83.5
         aed_rate = float(usdaed["Close"].iloc[-1]) if not usdaed.empty else 3.67
 
@@ -227,34 +312,36 @@ def get_commodity_in_local_currencies(commodity_ticker="GC=F", is_dubai=False):
 # ═══════════════════════════════════════════════════════════════
 # DYNAMIC TICKER SEARCH (like TradingView)
 # ═══════════════════════════════════════════════════════════════
-@st.cache_data(ttl=600, show_spinner=False)
+def _session_channel():
+    """Per-browser-session key, so one user's typing never cancels another's search."""
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx else "default"
+
+
+@perf.traced("search")
 def search_tickers(query, max_results=20):
     """
-    Search Yahoo Finance for matching tickers.
+    Search tickers: the local index answers known assets instantly (exact or
+    prefix matches); otherwise Yahoo Finance is queried, and local fuzzy
+    (typo) matches are listed after its results.
     Returns list of dicts: {symbol, name, type, exchange}
+    A newer query from the same session cancels a remote one (returns []).
     """
-    import requests
-    try:
-        url = f"https://query2.finance.yahoo.com/v1/finance/search"
-        params = {
-            "q": query,
-            "quotesCount": max_results,
-            "newsCount": 0,
-            "listsCount": 0,
-        }
-        headers = {"User-Agent": "Mozilla/5.0"}
-        resp = requests.get(url, params=params, headers=headers, timeout=5)
-        data = resp.json()
-
-        results = []
-        for q in data.get("quotes", []):
-            results.append({
-                "symbol": q.get("symbol", ""),
-                "name": q.get("shortname") or q.get("longname") or q.get("symbol", ""),
-                "type": q.get("quoteType", "").capitalize(),
-                "exchange": q.get("exchange", ""),
-            })
-        return results
-    except Exception as e:
-        print(f"Search error: {e}")
-        return []
+    local = search_index.search(query, max_results, fuzzy=False)
+    if local:
+        perf.note(cache="hit")
+        return local
+    fuzzy = search_index.search(query, max_results)
+
+    key = ("search", query.strip().lower(), max_results)
+    remote = _get_cached(key)
+    perf.note(cache="miss" if remote is None else "hit")
+    if remote is None:
+        remote = async_io.search_sync(query, max_results, channel=_session_channel())
+        if remote is None:
+            return []  # superseded by a newer query
+        if remote:
+            search_index.learn(remote)
+            _set_cached(key, remote)
+    seen = {r["symbol"] for r in remote}
+    return (remote + [r for r in fuzzy if r["symbol"] not in seen])[:max_results]
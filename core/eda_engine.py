@@ -10,7 +10,13 @@ Checks performed:
   4. Autocorrelation (Ljung-Box)
   5. Return distribution (skew, kurtosis, normality)
   6. Volatility regime (rolling std)
-  7. Feature importance ranking via mutual information
+  7. Feature importance ranking via mutual information (core.feature_rank)
+
+Tests are cached by a fingerprint of their input and parameters, each has
+a time budget (predicted from its measured cost) past which a cheaper
+approximation on the most recent EDA_FALLBACK_SAMPLES rows is used, and,
+given a `key`, results are carried over from the previous run when the data
+only moved by a few bars and the conclusion could not flip.
 
 Model selection rules derived from EDA:
   - High autocorrelation  -> favour Gradient Boosting (handles sequential patterns)
@@ -20,12 +26,23 @@ Model selection rules derived from EDA:
   - Low feature count     -> fallback to simpler models
 """
 
+import threading
+import time
+
 import numpy as np
 import pandas as pd
 from scipy import stats
-from sklearn.feature_selection import mutual_info_classif
 from sklearn.preprocessing import StandardScaler
 import warnings
+
+from config import (
+    MARKETS, EDA_BUDGETS, EDA_FALLBACK_SAMPLES, EDA_INCREMENTAL_MAX_BARS, EDA_REUSE_P_BAND,
+    FEATURE_RANK_METHOD, ML_TOP_K_FEATURES, UNIVERSE_FETCH_TIMEOUT,
+)
+from core import async_io, cache, fingerprint, ohlcv_store, perf
+from core.feature_matrix import FeatureMatrix
+from core.feature_rank import rank_features, top_k
+
 warnings.filterwarnings("ignore")
 
 try:
@@ -45,15 +62,117 @@ FEATURE_COLUMNS = [
 ]
 
 
+# ═══════════════════════════════════════════════════════════════
+# STAT CACHE, BUDGETS & INCREMENTAL REUSE
+# ═══════════════════════════════════════════════════════════════
+# Cost model per stat: seconds ≈ rate × size ** exponent, where size is the
+# row count the full test sees. Rates start from priors measured on one
+# core and track the observed cost afterwards.
+_COST_EXPONENT = {"adf": 1.5, "mutual_info": 1.1, "ljung_box": 0.0, "normality": 0.0}
+_rates = {"adf": 5e-7, "mutual_info": 4e-6, "ljung_box": 2e-3, "normality": 5e-4}
+_rates_lock = threading.Lock()
+
+
+def _run_stat(name, params, arrays, size, full, fallback):
+    """
+    Value of one statistical test: from the EDA cache when this exact input
+    was seen, else `full()` if its predicted cost fits EDA_BUDGETS[name],
+    else `fallback()`. Returns (value, {"mode", "ms"}).
+    """
+    key = (name, params, fingerprint.of(*arrays))
+    hit = cache.store.get("eda", key)
+    if hit is not None:
+        return hit, {"mode": "cached", "ms": 0.0}
+
+    exponent = _COST_EXPONENT[name]
+    with _rates_lock:
+        predicted = _rates[name] * size ** exponent
+    mode = "full" if predicted <= EDA_BUDGETS[name] else "fallback"
+    start = time.perf_counter()
+    value = full() if mode == "full" else fallback()
+    elapsed = time.perf_counter() - start
+    if mode == "full":
+        with _rates_lock:
+            _rates[name] = 0.7 * _rates[name] + 0.3 * elapsed / max(size, 1) ** exponent
+    cache.store.put("eda", key, value)
+    return value, {"mode": mode, "ms": round(elapsed * 1000, 2)}
+
+
+def _row_hashes(df):
+    cols = [c for c in ("Close", "Volume") if c in df.columns]
+    return pd.util.hash_pandas_object(df[cols], index=False).to_numpy()
+
+
+def _bars_moved(old, new):
+    """Bars dropped from the head + appended to the tail between two windows, or None."""
+    if not len(old) or not len(new):
+        return None
+    for d in np.flatnonzero(old[:EDA_INCREMENTAL_MAX_BARS + 1] == new[0]):
+        overlap = len(old) - d
+        if overlap <= len(new) and np.array_equal(old[d:], new[:overlap]):
+            return int(d + len(new) - overlap)
+    return None
+
+
+def _p_settled(p_value):
+    """True when a p-value is far enough from 0.05 that a few bars can't flip the test."""
+    low, high = EDA_REUSE_P_BAND
+    return p_value < low or p_value > high
+
+
+# ── Tests (full version + budget fallback) ──
+def _adf(close):
+    def full():
+        adf_stat, p = adfuller(close, autolag='AIC')[:2]
+        return {"adf_stat": float(adf_stat), "adf_p": float(p)}
+
+    def fallback():   # fixed lag order: one regression instead of an AIC search
+        adf_stat, p = adfuller(close[-EDA_FALLBACK_SAMPLES:], autolag=None)[:2]
+        return {"adf_stat": float(adf_stat), "adf_p": float(p)}
+
+    return _run_stat("adf", ("AIC",), [close], len(close), full, fallback)
+
+
+def _ljung_box(returns):
+    def test(window):
+        lb_result = acorr_ljungbox(returns[-window:], lags=[10], return_df=True)
+        return {"ljungbox_p": float(lb_result['lb_pvalue'].values[0])}
+
+    return _run_stat("ljung_box", (200, 10), [returns[-200:]], 1,
+                     lambda: test(200), lambda: test(100))
+
+
+def _normality(returns):
+    tail = returns[-100:]  # limit to 100 for speed
+    return _run_stat("normality", (100,), [tail], 1,
+                     lambda: {"shapiro_p": float(stats.shapiro(tail)[1])},
+                     lambda: {"shapiro_p": float(stats.jarque_bera(tail)[1])})
+
+
+def _mutual_info(X, y, feature_names):
+    def result(ranking):
+        return {"features": tuple(feature_names), "ranking": ranking}
+
+    return _run_stat("mutual_info", (tuple(feature_names), FEATURE_RANK_METHOD), [X, y], len(y),
+                     lambda: result(rank_features(X, y, feature_names)),
+                     lambda: result(rank_features(X, y, feature_names, max_rows=EDA_FALLBACK_SAMPLES)))
+
+
 # ═══════════════════════════════════════════════════════════════
 # MAIN EDA FUNCTION
 # ═══════════════════════════════════════════════════════════════
-def run_eda(df: pd.DataFrame) -> dict:
+@perf.traced("eda")
+def run_eda(df, key=None) -> dict:
     """
-    Full EDA pipeline. Returns a dict with findings + model recommendations.
+    Full EDA pipeline on an indicator DataFrame or a FeatureMatrix built
+    from one. Returns a dict with findings + model recommendations.
+    With a `key` (e.g. the ticker), tests whose previous result for that key
+    can't have flipped are reused when the data moved by at most
+    EDA_INCREMENTAL_MAX_BARS bars.
     """
+    fm = df if isinstance(df, FeatureMatrix) else FeatureMatrix.from_frame(df, FEATURE_COLUMNS)
     result = {
-        "n_samples": len(df),
+        "n_samples": len(fm),
         "n_features": 0,
         "class_balance": {},
         "is_balanced": True,
@@ -62,21 +181,41 @@ def run_eda(df: pd.DataFrame) -> dict:
         "return_stats": {},
         "volatility_regime": "normal",
         "top_features": [],
+        "feature_ranking": [],
         "feature_corr": {},
         "recommended_models": [],
         "model_flags": {},
         "warnings": [],
+        "stat_runs": {},
     }
 
-    if df.empty or len(df) < 60:
+    if len(fm) < 60:
         result["warnings"].append("Too few samples (<60) for reliable EDA.")
         result["recommended_models"] = ["Random Forest", "Extra Trees"]
         return result
 
-    available_features = [c for c in FEATURE_COLUMNS if c in df.columns]
+    available_features = [c for c in FEATURE_COLUMNS if c in fm.columns]
     result["n_features"] = len(available_features)
 
-    df_clean = df[available_features + ['Target']].dropna() if 'Target' in df.columns else df[available_features].dropna()
+    df_clean = fm.frame(available_features, require_target=fm.target is not None)
+
+    # Incremental: results of earlier runs for this key, each with the rows it
+    # was computed on (drift is measured from there, so reuse can't chain)
+    rows = _row_hashes(df_clean)
+    previous = (cache.store.get("eda", ("previous", key)) if key is not None else None) or {}
+    computed = {}
+
+    def stat(name, run, settled):
+        old = previous.get(name)
+        if old is not None and settled(old["value"]):
+            moved = _bars_moved(old["rows"], rows)
+            if moved is not None and moved <= EDA_INCREMENTAL_MAX_BARS:
+                result["stat_runs"][name] = {"mode": "reused", "ms": 0.0}
+                computed[name] = old
+                return old["value"]
+        value, result["stat_runs"][name] = run()
+        computed[name] = {"value": value, "rows": rows}
+        return value
 
     # ── 1. Class Balance ──────────────────────────────────────
     if 'Target' in df_clean.columns:
@@ -98,7 +237,8 @@ def run_eda(df: pd.DataFrame) -> dict:
         if len(returns) > 10:
             skewness  = float(returns.skew())
             kurt      = float(returns.kurtosis())
-            _, p_norm = stats.shapiro(returns.tail(100))  # limit to 100 for speed
+            p_norm = stat("normality", lambda: _normality(returns.to_numpy()),
+                          lambda old: _p_settled(old["shapiro_p"]))["shapiro_p"]
             result["return_stats"] = {
                 "mean_return_pct": round(float(returns.mean() * 100), 4),
                 "std_pct":  round(float(returns.std() * 100), 4),
@@ -132,13 +272,14 @@ def run_eda(df: pd.DataFrame) -> dict:
     # ── 3. Stationarity (ADF Test) ────────────────────────────
     if HAS_STATSMODELS and 'Close' in df_clean.columns and len(df_clean) > 30:
         try:
-            adf_result  = adfuller(df_clean['Close'].dropna(), autolag='AIC')
-            result["adf_stat"]    = round(float(adf_result[0]), 4)
-            result["adf_p"]       = round(float(adf_result[1]), 4)
-            result["is_stationary"] = bool(adf_result[1] < 0.05)
+            adf_result  = stat("adf", lambda: _adf(df_clean['Close'].dropna().to_numpy()),
+                               lambda old: _p_settled(old["adf_p"]))
+            result["adf_stat"]    = round(adf_result["adf_stat"], 4)
+            result["adf_p"]       = round(adf_result["adf_p"], 4)
+            result["is_stationary"] = bool(adf_result["adf_p"] < 0.05)
             if not result["is_stationary"]:
                 result["warnings"].append(
-                    f"Price series is non-stationary (ADF p={adf_result[1]:.3f}). "
+                    f"Price series is non-stationary (ADF p={adf_result['adf_p']:.3f}). "
                     "Tree models are preferred (no stationarity assumption)."
                 )
         except Exception:
@@ -147,9 +288,9 @@ def run_eda(df: pd.DataFrame) -> dict:
     # ── 4. Autocorrelation (Ljung-Box) ────────────────────────
     if HAS_STATSMODELS and 'Close' in df_clean.columns and len(df_clean) > 30:
         try:
-            returns_for_lb = df_clean['Close'].pct_change().dropna().tail(200)
-            lb_result = acorr_ljungbox(returns_for_lb, lags=[10], return_df=True)
-            lb_p = float(lb_result['lb_pvalue'].values[0])
+            returns_for_lb = df_clean['Close'].pct_change().dropna().to_numpy()
+            lb_p = stat("ljung_box", lambda: _ljung_box(returns_for_lb),
+                        lambda old: _p_settled(old["ljungbox_p"]))["ljungbox_p"]
             result["has_autocorrelation"] = bool(lb_p < 0.05)
             result["ljungbox_p"] = round(lb_p, 4)
             if result["has_autocorrelation"]:
@@ -163,14 +304,15 @@ def run_eda(df: pd.DataFrame) -> dict:
     # ── 5. Feature Mutual Information ────────────────────────
     if 'Target' in df_clean.columns and len(available_features) >= 3:
         try:
-            X = df_clean[available_features].fillna(0).values
-            y = df_clean['Target'].values
-            mi = mutual_info_classif(X, y, random_state=42)
-            feat_mi = sorted(zip(available_features, mi), key=lambda x: x[1], reverse=True)
-            result["top_features"] = [(f, round(float(s), 4)) for f, s in feat_mi[:10]]
+            X, y = fm.rows(available_features)
+            ranking = stat("mutual_info", lambda: _mutual_info(X, y, available_features),
+                           lambda old: old["features"] == tuple(available_features))["ranking"]
+            result["feature_ranking"] = ranking.round(4).to_dict("records")
+            result["top_features"] = [(f, round(float(s), 4)) for f, s in
+                                      zip(ranking["feature"].head(10), ranking["mi"].head(10))]
 
             # Feature correlation (top features vs each other)
-            top_names = [f for f, _ in feat_mi[:8]]
+            top_names = top_k(ranking, 8)
             corr_matrix = df_clean[top_names].corr()
             result["feature_corr"] = corr_matrix.round(3).to_dict()
 
@@ -189,12 +331,127 @@ def run_eda(df: pd.DataFrame) -> dict:
         except Exception:
             pass
 
+    if key is not None:
+        cache.store.put("eda", ("previous", key), computed)
+
     # ── 6. MODEL SELECTION LOGIC ─────────────────────────────
     result["recommended_models"], result["model_flags"] = _select_models(result)
 
     return result
 
 
+# ═══════════════════════════════════════════════════════════════
+# PANEL EDA (many tickers at once)
+# ═══════════════════════════════════════════════════════════════
+def build_panel(frames, column="Close"):
+    """(dates × tickers) matrix of one column from {ticker: OHLCV frame}, aligned on calendar date."""
+    series = {}
+    for ticker, df in frames.items():
+        if df is None or df.empty or column not in df.columns:
+            continue
+        s = df.set_index("Date")[column] if "Date" in df.columns else df[column]
+        idx = pd.DatetimeIndex(s.index)
+        s.index = (idx.tz_localize(None) if idx.tz is not None else idx).normalize()
+        series[ticker] = s[~s.index.duplicated(keep="last")]
+    return pd.DataFrame(series).sort_index()
+
+
+def _right_align(values):
+    """Shift each column's valid values to the bottom, in order (NaNs first)."""
+    order = np.argsort(~np.isnan(values), axis=0, kind="stable")
+    return np.take_along_axis(values, order, axis=0)
+
+
+@perf.traced("eda")
+def run_eda_panel(close, features=None, lags=10, lb_window=200):
+    """
+    Batch EDA over a (dates × tickers) close matrix: return moments,
+    volatility regime, class balance, lag-1..`lags` autocorrelation and a
+    Ljung-Box test per ticker, computed column-wise for all tickers at once.
+    Each column is first packed onto its own trading calendar (markets with
+    different holidays don't leave gaps). `features` ({name: dates × tickers
+    matrix}, e.g. RSI) adds each indicator's latest value and its z-score
+    against that ticker's own history.
+    Returns a tidy DataFrame, one row per ticker.
+    """
+    tickers = list(close.columns)
+    C = _right_align(close.to_numpy(dtype=float))
+    R = C[1:] / C[:-1] - 1                               # leading NaNs stay NaN
+    returns = pd.DataFrame(R, columns=tickers)
+    n_returns = np.count_nonzero(~np.isnan(R), axis=0)
+
+    out = pd.DataFrame({"ticker": tickers, "n_samples": np.count_nonzero(~np.isnan(C), axis=0)})
+    out["mean_return_pct"] = returns.mean().to_numpy() * 100
+    out["std_pct"] = returns.std().to_numpy() * 100
+    out["skewness"] = returns.skew().to_numpy()
+    out["kurtosis"] = returns.kurt().to_numpy()
+
+    # Volatility regime: last 10 values of the 20-bar rolling std vs its mean
+    roll = returns.rolling(20).std()
+    recent = roll.tail(10).mean().to_numpy()
+    full = roll.mean().to_numpy()
+    out["recent_vol_pct"] = recent * 100
+    out["full_vol_pct"] = full * 100
+    out["volatility_regime"] = np.select([recent > full * 1.5, recent < full * 0.6], ["high", "low"], "normal")
+    out.loc[np.isnan(recent) | np.isnan(full), "volatility_regime"] = None
+
+    # Class balance of Target = next close above this close
+    up = np.where(np.isnan(R), np.nan, (R > 0).astype(float))
+    up_share = np.nanmean(up, axis=0) if len(R) else np.full(len(tickers), np.nan)
+    out["up_share"] = up_share
+    out["majority_ratio"] = np.maximum(up_share, 1 - up_share)
+    out["is_balanced"] = out["majority_ratio"] < 0.60
+
+    # Autocorrelation of the last `lb_window` returns, Ljung-Box Q over `lags`
+    X = R[-lb_window:]
+    valid = ~np.isnan(X)
+    n = valid.sum(axis=0)
+    Xc = np.where(valid, X - np.nanmean(np.where(valid, X, np.nan), axis=0), 0.0)
+    denom = (Xc * Xc).sum(axis=0)
+    Q = np.zeros(len(tickers))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for k in range(1, lags + 1):
+            rho = (Xc[k:] * Xc[:-k]).sum(axis=0) / denom
+            out[f"acf_{k}"] = rho
+            Q += rho * rho / (n - k)
+        Q *= n * (n + 2)
+    out["ljungbox_p"] = np.where(n > lags + 1, stats.chi2.sf(Q, lags), np.nan)
+    out["has_autocorrelation"] = out["ljungbox_p"] < 0.05
+
+    for name, matrix in (features or {}).items():
+        m = matrix.reindex(columns=tickers)
+        last = m.ffill().iloc[-1] if len(m) else pd.Series(np.nan, index=tickers)
+        out[f"{name}_last"] = last.to_numpy()
+        out[f"{name}_z"] = ((last - m.mean()) / m.std()).to_numpy()
+
+    out["enough_data"] = n_returns >= 60
+    return out
+
+
+@cache.memoize("eda", ttl=300)
+def universe_eda(markets=None, period="1y"):
+    """
+    run_eda_panel over every ticker in `markets` (default: config.MARKETS), with
+    name + market columns. Histories are fetched concurrently (bounded by
+    MAX_WORKERS); tickers that fail or miss UNIVERSE_FETCH_TIMEOUT are left out.
+    """
+    markets = markets or MARKETS
+    labels = {sym: (name, market) for market, assets in markets.items() for sym, name in assets.items()}
+    calls = {sym: async_io.call_blocking(ohlcv_store.get_history, sym, period) for sym in labels}
+    try:
+        frames = async_io.run(async_io.gather_partial(calls, UNIVERSE_FETCH_TIMEOUT))
+    except Exception as e:
+        print(f"Universe fetch error: {e}")
+        return pd.DataFrame()
+    close = build_panel(frames)
+    if close.empty:
+        return pd.DataFrame()
+    table = run_eda_panel(close)
+    table.insert(1, "name", table["ticker"].map(lambda t: labels[t][0]))
+    table.insert(2, "market", table["ticker"].map(lambda t: labels[t][1]))
+    return table
+
+
 def _select_models(eda: dict) -> tuple:
     """
     Rule-based model selection from EDA findings.
@@ -210,6 +467,8 @@ def _select_models(eda: dict) -> tuple:
     flags = {
         "class_weight": "balanced" if not eda.get("is_balanced", True) else None,
         "use_lag_features": not eda.get("is_stationary", True),
+        "feature_order": [r["feature"] for r in eda.get("feature_ranking", [])],
+        "top_k_features": ML_TOP_K_FEATURES,
     }
 
     # Autocorrelation → GB & XGB handle sequential data better → boost them
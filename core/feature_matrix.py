@@ -0,0 +1,156 @@
+"""
+TradeIntel Pro - Feature Matrix
+Typed numeric view of an indicator DataFrame, shared by EDA, training and
+inference.
+
+The feature columns are converted once into one C-contiguous float array
+(no object-dtype `df.values` round trip), with the Target labels and a
+mask of the rows where they are present. Derived products (valid-row
+views, lagged design matrices, fitted scalers) are built on first use and
+kept in the "ml" cache as their own entries, keyed by the matrix's content
+fingerprint, so run_eda, feature preparation and the models all read the
+same arrays instead of each doing its own dropna/copy/scale, and each
+product counts against the "ml" quota when it is stored.
+
+    fm = feature_matrix.build(df, FEATURE_COLUMNS)
+    X, y, names = fm.design(["RSI", "MACD", "Close"], lag_columns=["Close"])
+    X_scaled, scaler = fm.scaled(["RSI", "MACD", "Close"], lag_columns=["Close"])
+
+`build` keeps one matrix per content fingerprint in the "ml" cache too.
+"""
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+from core import cache, fingerprint
+
+LAGS = (1, 2)
+
+
+class FeatureMatrix:
+    """Feature values (rows × columns), Target labels and per-column-set valid rows."""
+
+    def __init__(self, values, columns, target=None, dtype=np.float64):
+        self.values = np.ascontiguousarray(values, dtype=dtype)
+        self.columns = pd.Index(columns)
+        if target is None:
+            self.target = None
+            self.has_target = np.zeros(len(self.values), dtype=bool)
+        else:
+            target = np.asarray(target, dtype=np.float64)
+            self.has_target = ~np.isnan(target)
+            self.target = np.where(self.has_target, target, 0).astype(np.int64)
+        self._fingerprint = None
+
+    @classmethod
+    def from_frame(cls, df, columns, dtype=np.float64):
+        """Matrix of the `columns` present in df, plus its Target column if any."""
+        cols = [c for c in columns if c in df.columns]
+        values = df[cols].to_numpy(dtype=dtype, na_value=np.nan)
+        target = df["Target"].to_numpy(dtype=np.float64, na_value=np.nan) if "Target" in df.columns else None
+        return cls(values, cols, target, dtype)
+
+    def __len__(self):
+        return len(self.values)
+
+    @property
+    def fingerprint(self):
+        """Content hash of values, columns and labels."""
+        if self._fingerprint is None:
+            self._fingerprint = fingerprint.of(self.values, list(self.columns), self.target, self.has_target)
+        return self._fingerprint
+
+    def _memo(self, key, make):
+        """Derived product `key`: a cache entry of its own, sized when stored."""
+        key = ("feature_matrix", self.fingerprint, key)
+        value = cache.store.get("ml", key)
+        if value is None:
+            value = make()
+            cache.store.put("ml", key, value)
+        return value
+
+    def col(self, name):
+        """One column over all rows (a view)."""
+        return self.values[:, self.columns.get_loc(name)]
+
+    # ═══════════════════════════════════════════════════════════
+    # VALID ROWS
+    # ═══════════════════════════════════════════════════════════
+    def valid(self, features, require_target=True):
+        """Mask of rows where every one of `features` (and Target) is present."""
+        features = tuple(features)
+
+        def make():
+            idx = self.columns.get_indexer(features)
+            mask = ~np.isnan(self.values[:, idx]).any(axis=1)
+            return mask & self.has_target if require_target else mask
+        return self._memo(("valid", features, require_target), make)
+
+    def rows(self, features, require_target=True):
+        """(X, y) over the valid rows of `features`: the dropna'd feature table."""
+        features = tuple(features)
+
+        def make():
+            mask = self.valid(features, require_target)
+            X = np.ascontiguousarray(self.values[mask][:, self.columns.get_indexer(features)])
+            y = self.target[mask] if self.target is not None else None
+            return X, y
+        return self._memo(("rows", features, require_target), make)
+
+    def frame(self, features, require_target=True):
+        """DataFrame of the valid rows of `features` (+ Target), for pandas-side analysis."""
+        X, y = self.rows(features, require_target)
+        df = pd.DataFrame(X, columns=list(features), copy=False)
+        if y is not None and require_target:
+            df["Target"] = y
+        return df
+
+    # ═══════════════════════════════════════════════════════════
+    # DESIGN MATRICES
+    # ═══════════════════════════════════════════════════════════
+    def design(self, features, lag_columns=(), lags=LAGS):
+        """
+        Unscaled (X, y, names): the valid rows of `features` plus, for each of
+        `lag_columns`, its values `lags` valid rows back (the first max(lags)
+        rows, which have no history, are dropped).
+        """
+        features = tuple(features)
+        lag_columns = tuple(c for c in lag_columns if c in features)
+
+        def make():
+            X, y = self.rows(features)
+            names = list(features)
+            if not lag_columns:
+                return X, y, names
+            skip = max(lags)
+            n = len(X)
+            blocks = [X[skip:]]
+            for c in lag_columns:
+                j = features.index(c)
+                for lag in lags:
+                    blocks.append(X[skip - lag:n - lag, j:j + 1])
+                    names.append(f"{c}_lag{lag}")
+            return np.ascontiguousarray(np.hstack(blocks)), y[skip:], names
+        return self._memo(("design", features, lag_columns, tuple(lags)), make)
+
+    def scaled(self, features, lag_columns=(), lags=LAGS):
+        """(standardized X, fitted StandardScaler) of `design(...)`."""
+        key = ("scaled", tuple(features), tuple(c for c in lag_columns if c in features), tuple(lags))
+
+        def make():
+            X, _, _ = self.design(features, lag_columns, lags)
+            scaler = StandardScaler()
+            return scaler.fit_transform(X), scaler
+        return self._memo(key, make)
+
+
+def build(df, columns, dtype=np.float64):
+    """Shared matrix for df: one per content fingerprint."""
+    fm = FeatureMatrix.from_frame(df, columns, dtype)
+    key = ("feature_matrix", fm.fingerprint)
+    shared = cache.store.get("ml", key)
+    if shared is None:
+        cache.store.put("ml", key, fm)
+        shared = fm
+    return shared
@@ -0,0 +1,128 @@
+"""
+TradeIntel Pro - Feature Ranking
+Mutual-information ranking of ML features against the Target class.
+
+The default estimator bins every feature into quantile bins and reads MI
+off the (bin × class) contingency table: all features are binned and
+counted together with one bincount, much faster than sklearn's kNN
+estimator, with the Miller-Madow bias correction so scores from different
+sample sizes compare. Long inputs can be subsampled; the rows used are
+split into SPLITS disjoint parts whose spread gives a confidence bound.
+
+Scores are cached per feature column (by a fingerprint of the column, the
+target and the settings), so a rerun only scores columns whose data changed.
+"""
+
+import numpy as np
+import pandas as pd
+from scipy.stats import rankdata
+from sklearn.feature_selection import mutual_info_classif
+
+from config import FEATURE_RANK_METHOD, FEATURE_RANK_BINS, FEATURE_RANK_MAX_ROWS
+from core import cache, fingerprint, perf
+
+SPLITS = 4                 # disjoint row groups behind the confidence bound
+Z = 1.96                   # ~95% bound
+
+
+# ═══════════════════════════════════════════════════════════════
+# ESTIMATORS
+# ═══════════════════════════════════════════════════════════════
+def quantile_bins(X, bins=FEATURE_RANK_BINS):
+    """Per-column quantile bin index 0..bins-1 (ties share a bin)."""
+    n = len(X)
+    ranks = rankdata(X, method="min", axis=0) - 1
+    return (ranks * bins // max(n, 1)).astype(np.int64)
+
+
+def histogram_mi(X, y, bins=FEATURE_RANK_BINS):
+    """
+    MI (nats) between each column of X and the discrete labels y, from
+    quantile-binned contingency tables, Miller-Madow corrected (>= 0).
+    """
+    X = np.asarray(X, dtype=float)
+    n, f = X.shape
+    classes, y_codes = np.unique(y, return_inverse=True)
+    k = len(classes)
+    if n == 0 or k < 2:
+        return np.zeros(f)
+
+    codes = quantile_bins(X, bins) * k + y_codes[:, None] + np.arange(f) * bins * k
+    joint = np.bincount(codes.ravel(), minlength=f * bins * k).reshape(f, bins, k) / n
+    px = joint.sum(axis=2, keepdims=True)
+    py = joint.sum(axis=1, keepdims=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        terms = np.where(joint > 0, joint * np.log(joint / (px * py)), 0.0)
+    mi = terms.sum(axis=(1, 2))
+
+    # Miller-Madow: plug-in MI is biased up by ~(Bx-1)(By-1)/2n
+    occupied_x = (px[:, :, 0] > 0).sum(axis=1)
+    mi -= (occupied_x - 1) * (k - 1) / (2 * n)
+    return np.maximum(mi, 0.0)
+
+
+def _estimate(X, y, method, bins):
+    if method == "knn":
+        return mutual_info_classif(X, y, random_state=42)
+    return histogram_mi(X, y, bins)
+
+
+def _score_columns(X, y, method, bins, max_rows, seed):
+    """(mi, mi_low, mi_high) arrays for every column of X."""
+    n = len(y)
+    rows = np.arange(n)
+    if max_rows and n > max_rows:
+        rows = np.sort(np.random.default_rng(seed).choice(n, max_rows, replace=False))
+    Xs, ys = X[rows], y[rows]
+
+    mi = _estimate(Xs, ys, method, bins)
+    parts = np.array_split(np.random.default_rng(seed + 1).permutation(len(rows)), SPLITS)
+    if min(map(len, parts)) < 2 * bins:
+        return mi, mi, mi
+    per_part = np.array([_estimate(Xs[p], ys[p], method, bins) for p in parts])
+    # Each part has 1/SPLITS of the rows: the full estimate's spread is std / sqrt(SPLITS)
+    half = Z * per_part.std(axis=0, ddof=1) / np.sqrt(SPLITS)
+    return mi, np.maximum(mi - half, 0.0), mi + half
+
+
+# ═══════════════════════════════════════════════════════════════
+# RANKING
+# ═══════════════════════════════════════════════════════════════
+@perf.traced("eda")
+def rank_features(X, y, feature_names, method=FEATURE_RANK_METHOD, bins=FEATURE_RANK_BINS,
+                  max_rows=FEATURE_RANK_MAX_ROWS, seed=42):
+    """
+    Features by MI with y, best first: DataFrame of feature, mi, mi_low,
+    mi_high. `method` is "histogram" or "knn" (sklearn).
+    Rows beyond `max_rows` are subsampled (None = use all).
+    """
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y)
+    settings = ("feature_mi", method, bins, max_rows, seed, fingerprint.of(y))
+    keys = [(settings, fingerprint.of(col)) for col in np.ascontiguousarray(X.T)]
+
+    scores = {}
+    missing = []
+    for j, name in enumerate(feature_names):
+        hit = cache.store.get("eda", keys[j])
+        if hit is None:
+            missing.append(j)
+        else:
+            scores[name] = hit
+
+    if missing:
+        mi, low, high = _score_columns(X[:, missing], y, method, bins, max_rows, seed)
+        for i, j in enumerate(missing):
+            scores[feature_names[j]] = (float(mi[i]), float(low[i]), float(high[i]))
+            cache.store.put("eda", keys[j], scores[feature_names[j]])
+
+    ranking = pd.DataFrame(
+        [(name, *scores[name]) for name in feature_names],
+        columns=["feature", "mi", "mi_low", "mi_high"],
+    )
+    return ranking.sort_values("mi", ascending=False, kind="stable").reset_index(drop=True)
+
+
+def top_k(ranking, k):
+    """Names of the k best-ranked features."""
+    return list(ranking["feature"].head(k))
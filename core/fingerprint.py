@@ -0,0 +1,123 @@
+"""
+TradeIntel Pro - Fingerprints
+Content-addressed keys for arrays, Series and DataFrames: the one key
+scheme behind the data, indicator, EDA, ML and chart caches.
+
+A fingerprint covers everything that can change a result: dtype, shape,
+column names, index and every value, not just a tail sample. It is
+computed straight from the column buffers (no `tobytes()` copies, no
+object-dtype round trips); strided arrays are fed to the hash in
+CHUNK_BYTES pieces so memory stays flat. Values that aren't plain numbers
+(strings, categoricals, nullable dtypes) go through pandas' vectorized
+per-element hash first.
+
+    key = fingerprint.of(df)                      # 32 hex chars
+    key = fingerprint.of(X, y, ("bins", 16))      # several parts, one key
+
+    h = fingerprint.Hasher()                      # incremental
+    for chunk in chunks:
+        h.update(chunk)
+    key = h.hexdigest()
+
+xxHash (xxh3-128) is used when the `xxhash` package is installed, else
+blake2b-128. Keys are stable across processes and restarts on the same
+install; switching hashers just misses persisted keys once.
+"""
+
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
+CHUNK_BYTES = 1 << 20      # bytes copied at a time from non-contiguous arrays
+
+
+def _new_hash():
+    return xxhash.xxh3_128() if HAS_XXHASH else hashlib.blake2b(digest_size=16)
+
+
+class Hasher:
+    """Incremental fingerprint: `update()` any number of parts, then `hexdigest()`."""
+
+    __slots__ = ("_h",)
+
+    def __init__(self):
+        self._h = _new_hash()
+
+    def _tag(self, *parts):
+        self._h.update(repr(parts).encode())
+
+    def _buffer(self, a):
+        if a.dtype.kind in "mM":
+            a = a.view(np.int64)
+        if a.flags.c_contiguous:
+            self._h.update(a.reshape(-1).view(np.uint8))
+            return
+        rows = max(1, CHUNK_BYTES // max(a[:1].nbytes, 1))
+        for i in range(0, len(a), rows):
+            self._h.update(np.ascontiguousarray(a[i:i + rows]).reshape(-1).view(np.uint8))
+
+    def _values(self, values):
+        """Numeric buffer of a Series/Index's values (hashed per element if not plain numbers)."""
+        dtype = values.dtype
+        if isinstance(dtype, np.dtype) and dtype.kind in "biufcmM":
+            return np.asarray(values)
+        if hasattr(values, "asi8"):            # tz-aware datetimes, periods (tz is in the tag)
+            return values.asi8
+        return pd.util.hash_array(np.asarray(values, dtype=object))
+
+    def _index(self, index):
+        if isinstance(index, pd.RangeIndex):
+            self._tag("range", index.start, index.stop, index.step)
+        else:
+            self._tag("index", str(index.dtype), len(index))
+            self._buffer(self._values(index))
+
+    def update(self, value):
+        """Add one part: ndarray, Series, DataFrame, Index, or a plain (nested) Python value."""
+        if isinstance(value, pd.DataFrame):
+            self._tag("frame", value.shape, tuple(map(str, value.columns)),
+                      tuple(map(str, value.dtypes)))
+            self._index(value.index)
+            for _, col in value.items():
+                self._buffer(self._values(col))
+        elif isinstance(value, pd.Series):
+            self._tag("series", str(value.name), str(value.dtype), len(value))
+            self._index(value.index)
+            self._buffer(self._values(value))
+        elif isinstance(value, pd.Index):
+            self._index(value)
+        elif isinstance(value, np.ndarray):
+            self._tag("nd", str(value.dtype), value.shape)
+            if value.dtype == object:
+                value = pd.util.hash_array(value.ravel())
+            self._buffer(value)
+        elif isinstance(value, (list, tuple)):
+            self._tag(type(value).__name__, len(value))
+            for v in value:
+                self.update(v)
+        elif isinstance(value, dict):
+            self._tag("dict", len(value))
+            for k in sorted(value, key=repr):
+                self.update(k)
+                self.update(value[k])
+        else:
+            self._tag(type(value).__name__, value)
+        return self
+
+    def hexdigest(self):
+        return self._h.hexdigest()
+
+
+def of(*values):
+    """Fingerprint (32 hex chars) of one or more parts."""
+    h = Hasher()
+    for v in values:
+        h.update(v)
+    return h.hexdigest()
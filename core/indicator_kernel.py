@@ -0,0 +1,291 @@
+"""
+TradeIntel Pro - Fused Indicator Kernel
+NumPy/SciPy implementation of every column produced by compute_all_indicators.
+
+Works on contiguous float64 arrays and shares intermediates instead of
+building one `ta` object per indicator:
+  - one windowed mean/std pass on Close → SMA_20, BB_Middle/Upper/Lower
+  - the same windowed pass on the typical price → CCI (mean + mean abs dev)
+  - one true-range array → ATR and ADX
+  - one EMA pass per span → EMA_12/EMA_26, reused by MACD
+Recursive smoothers (EMA, Wilder) run through scipy.signal.lfilter, so there
+are no Python-level loops over bars. Outputs match the `ta` 0.11 semantics
+(including its ADX warm-up quirks) to floating-point tolerance.
+"""
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import lfilter
+
+_CHUNK = 1 << 16  # rows per block for windowed stats (bounds temp memory)
+
+
+# ═══════════════════════════════════════════════════════════════
+# PRIMITIVES
+# ═══════════════════════════════════════════════════════════════
+def _shift(x, k=1):
+    out = np.empty_like(x)
+    out[:k] = np.nan
+    out[k:] = x[:-k]
+    return out
+
+
+def _ewm(x, alpha, min_periods):
+    """pandas `ewm(alpha, min_periods, adjust=False).mean()` for a float array."""
+    out = np.full_like(x, np.nan)
+    valid = ~np.isnan(x)
+    if not valid.any():
+        return out
+    start = int(valid.argmax())
+    seg = x[start:]
+    if np.isnan(seg).any():
+        # Interior gaps re-weight the recursion; defer to pandas for exactness
+        return pd.Series(x).ewm(alpha=alpha, min_periods=min_periods, adjust=False).mean().to_numpy()
+    r = 1.0 - alpha
+    y = np.empty_like(seg)
+    y[0] = seg[0]
+    if len(seg) > 1:
+        y[1:], _ = lfilter([alpha], [1.0, -r], seg[1:], zi=[r * seg[0]])
+    out[start:] = y
+    out[:start + min_periods - 1] = np.nan
+    return out
+
+
+def _ema(x, span):
+    return _ewm(x, 2.0 / (span + 1), span)
+
+
+def _rolling_sum(x, w):
+    """Rolling sum with min_periods=w (NaN if any value in the window is NaN)."""
+    n = len(x)
+    out = np.full(n, np.nan)
+    if n < w:
+        return out
+    nan_mask = np.isnan(x)
+    cs = np.concatenate(([0.0], np.cumsum(np.where(nan_mask, 0.0, x))))
+    cn = np.concatenate(([0], np.cumsum(nan_mask)))
+    s = cs[w:] - cs[:-w]
+    s[(cn[w:] - cn[:-w]) > 0] = np.nan
+    out[w - 1:] = s
+    return out
+
+
+def _rolling_mean(x, w):
+    # Centre on a reference value so long prefix sums keep their precision
+    valid = x[~np.isnan(x)]
+    ref = valid[0] if len(valid) else 0.0
+    return _rolling_sum(x - ref, w) / w + ref
+
+
+def _rolling_max(x, w):
+    out = np.full(len(x), np.nan)
+    if len(x) >= w:
+        out[w - 1:] = sliding_window_view(x, w).max(axis=1)
+    return out
+
+
+def _rolling_min(x, w):
+    out = np.full(len(x), np.nan)
+    if len(x) >= w:
+        out[w - 1:] = sliding_window_view(x, w).min(axis=1)
+    return out
+
+
+def _window_stats(x, w, std=False, mad=False):
+    """
+    One pass over length-w windows returning (mean, std[ddof=0], mean abs dev).
+    Done in row blocks so the (rows × w) temporaries stay small.
+    """
+    n = len(x)
+    mean = np.full(n, np.nan)
+    sd = np.full(n, np.nan) if std else None
+    md = np.full(n, np.nan) if mad else None
+    if n < w:
+        return mean, sd, md
+    view = sliding_window_view(x, w)
+    for a in range(0, len(view), _CHUNK):
+        block = view[a:a + _CHUNK]
+        m = block.mean(axis=1)
+        mean[w - 1 + a:w - 1 + a + len(block)] = m
+        if std or mad:
+            dev = block - m[:, None]
+            if std:
+                sd[w - 1 + a:w - 1 + a + len(block)] = np.sqrt((dev * dev).mean(axis=1))
+            if mad:
+                md[w - 1 + a:w - 1 + a + len(block)] = np.abs(dev).mean(axis=1)
+    return mean, sd, md
+
+
+def _nancumsum(x):
+    """pandas-style cumsum: NaN positions stay NaN, accumulation skips them."""
+    nan_mask = np.isnan(x)
+    out = np.cumsum(np.where(nan_mask, 0.0, x))
+    out[nan_mask] = np.nan
+    return out
+
+
+def _wilder_from(seed, x, w):
+    """y[0] = seed; y[i] = y[i-1] * (1 - 1/w) + x[i-1] (running Wilder sum)."""
+    r = 1.0 - 1.0 / w
+    y = np.empty(len(x) + 1)
+    y[0] = seed
+    if len(x):
+        y[1:], _ = lfilter([1.0], [1.0, -r], x, zi=[r * seed])
+    return y
+
+
+def _wilder_avg_from(seed, x, w):
+    """y[0] = seed; y[i] = (y[i-1] * (w - 1) + x[i-1]) / w (Wilder average)."""
+    r = (w - 1.0) / w
+    y = np.empty(len(x) + 1)
+    y[0] = seed
+    if len(x):
+        y[1:], _ = lfilter([1.0 / w], [1.0, -r], x, zi=[r * seed])
+    return y
+
+
+# ═══════════════════════════════════════════════════════════════
+# INDICATORS
+# ═══════════════════════════════════════════════════════════════
+def _rsi(close, w=14):
+    diff = close - _shift(close)
+    up = np.where(diff > 0, diff, 0.0)
+    down = -np.where(diff < 0, diff, 0.0)
+    emaup = _ewm(up, 1.0 / w, w)
+    emadn = _ewm(down, 1.0 / w, w)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(emadn == 0, 100.0, 100 - (100 / (1 + emaup / emadn)))
+
+
+def _adx(high, low, tr, w=14):
+    """ADX, +DI, -DI with `ta`'s exact warm-up/alignment (tr NaN at bar 0)."""
+    n = len(tr)
+    m = n - (w - 1)
+    adx = np.zeros(n)
+    adx_pos = np.zeros(n)
+    adx_neg = np.zeros(n)
+    if m <= w + 1:
+        return adx, adx_pos, adx_neg
+
+    diff_up = high - _shift(high)
+    diff_down = _shift(low) - low
+    with np.errstate(invalid="ignore"):
+        pos = np.abs(((diff_up > diff_down) & (diff_up > 0)) * diff_up)
+        neg = np.abs(((diff_down > diff_up) & (diff_down > 0)) * diff_down)
+
+    def smoothed(x):
+        out = np.zeros(m)
+        seed = x[~np.isnan(x)][:w].sum()
+        out[:m - 1] = _wilder_from(seed, x[w + 1:n], w)
+        return out  # last slot stays 0, as in ta
+
+    trs, dip, din = smoothed(tr), smoothed(pos), smoothed(neg)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        di_p = np.where(trs != 0, 100 * dip / trs, 0.0)
+        di_n = np.where(trs != 0, 100 * din / trs, 0.0)
+        dx = np.where(di_p + di_n != 0, 100 * np.abs((di_p - di_n) / (di_p + di_n)), 0.0)
+
+    adx_s = np.zeros(m)
+    adx_s[w:] = _wilder_avg_from(dx[:w].mean(), dx[w:m - 1], w)
+    adx[w - 1:] = adx_s
+
+    adx_pos[w + 1:n] = di_p[1:m - 1]
+    adx_neg[w + 1:n] = di_n[1:m - 1]
+    return adx, adx_pos, adx_neg
+
+
+def _atr(tr, w=14):
+    n = len(tr)
+    atr = np.zeros(n)
+    if n < w:
+        return atr
+    atr[w - 1:] = _wilder_avg_from(np.nanmean(tr[:w]), tr[w:], w)
+    return atr
+
+
+def _mfi(tp, volume, w=14):
+    prev = _shift(tp)
+    up_down = np.where(tp > prev, 1.0, np.where(tp < prev, -1.0, 0.0))
+    mfr = tp * volume * up_down
+    pos = _rolling_sum(np.where(mfr >= 0, mfr, np.where(np.isnan(mfr), np.nan, 0.0)), w)
+    neg = np.abs(_rolling_sum(np.where(mfr < 0, mfr, np.where(np.isnan(mfr), np.nan, 0.0)), w))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return 100 - (100 / (1 + pos / neg))
+
+
+# ═══════════════════════════════════════════════════════════════
+# FUSED ENTRY POINT
+# ═══════════════════════════════════════════════════════════════
+def compute_indicator_arrays(high, low, close, volume):
+    """
+    Compute every indicator column from raw OHLCV arrays.
+    Returns an ordered dict of column name → float64 array (same length as input).
+    """
+    high = np.ascontiguousarray(high, dtype=np.float64)
+    low = np.ascontiguousarray(low, dtype=np.float64)
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    volume = np.ascontiguousarray(volume, dtype=np.float64)
+    prev_close = _shift(close)
+
+    # ── Shared intermediates ──
+    tp = (high + low + close) / 3.0
+    tr = np.maximum(high, prev_close) - np.minimum(low, prev_close)   # NaN at bar 0
+    ema_12 = _ema(close, 12)
+    ema_26 = _ema(close, 26)
+    sma_20, std_20, _ = _window_stats(close, 20, std=True)
+    tp_mean, _, tp_mad = _window_stats(tp, 20, mad=True)
+
+    out = {}
+
+    # ── Momentum ──
+    rsi = _rsi(close, 14)
+    out['RSI'] = rsi
+    lo_rsi = _rolling_min(rsi, 14)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        stoch = (rsi - lo_rsi) / (_rolling_max(rsi, 14) - lo_rsi)
+    stoch_k = _rolling_mean(stoch, 3)
+    out['Stoch_K'] = stoch_k * 100
+    out['Stoch_D'] = _rolling_mean(stoch_k, 3) * 100
+
+    hh = _rolling_max(high, 14)
+    ll = _rolling_min(low, 14)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out['Williams_R'] = -100 * (hh - close) / (hh - ll)
+
+    # ── Trend ──
+    macd = ema_12 - ema_26
+    macd_signal = _ema(macd, 9)
+    out['MACD'] = macd
+    out['MACD_Signal'] = macd_signal
+    out['MACD_Hist'] = macd - macd_signal
+
+    out['ADX'], out['ADX_Pos'], out['ADX_Neg'] = _adx(high, low, tr, 14)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out['CCI'] = (tp - tp_mean) / (0.015 * tp_mad)
+
+    # ── Moving Averages ──
+    out['EMA_12'] = ema_12
+    out['EMA_26'] = ema_26
+    out['SMA_10'] = _rolling_mean(close, 10)
+    out['SMA_20'] = sma_20
+    out['SMA_50'] = _rolling_mean(close, 50)
+    out['SMA_100'] = _rolling_mean(close, 100)
+    out['SMA_200'] = _rolling_mean(close, 200)
+
+    # ── Volatility ──
+    out['BB_Upper'] = sma_20 + 2 * std_20
+    out['BB_Middle'] = sma_20
+    out['BB_Lower'] = sma_20 - 2 * std_20
+
+    atr_tr = tr.copy()
+    if len(atr_tr):
+        atr_tr[0] = high[0] - low[0]
+    out['ATR'] = _atr(atr_tr, 14)
+
+    # ── Volume ──
+    out['OBV'] = _nancumsum(np.where(close < prev_close, -volume, volume))
+    out['MFI'] = _mfi(tp, volume, 14)
+
+    return out
@@ -0,0 +1,362 @@
+"""
+TradeIntel Pro - Streaming Indicators
+Stateful, bar-by-bar version of compute_all_indicators for live updates.
+
+`StreamingIndicators.update(bar)` folds one new bar into every indicator in
+O(1) (fixed-size window work only, never a pass over history). Sending a bar
+with the same Date as the last one revises it instead of appending — the
+partial intraday candle case — by rolling every indicator back one step
+first. Values match compute_all_indicators row-for-row, warm-up included.
+
+Library-only for now: the app's refresh path still calls
+compute_all_indicators, because on daily bars the fused batch kernel
+recomputes a full history in a few milliseconds, about what the frame
+bookkeeping around a streamed bar costs. This is meant for intraday/tick
+feeds, where bars arrive faster than a batch pass is worth repeating.
+"""
+
+import math
+from collections import deque
+
+import numpy as np
+
+NaN = float("nan")
+
+
+# ═══════════════════════════════════════════════════════════════
+# PRIMITIVES (each supports push + one-step rollback)
+# ═══════════════════════════════════════════════════════════════
+class _EWM:
+    """pandas ewm(alpha, min_periods, adjust=False) over non-NaN inputs."""
+
+    def __init__(self, alpha, min_periods):
+        self.alpha = alpha
+        self.min_periods = min_periods
+        self.value = NaN
+        self.count = 0
+        self._undo = None
+
+    def push(self, x):
+        self._undo = (self.value, self.count)
+        if math.isnan(x):
+            return self.get()
+        self.value = x if self.count == 0 else self.alpha * x + (1 - self.alpha) * self.value
+        self.count += 1
+        return self.get()
+
+    def rollback(self):
+        self.value, self.count = self._undo
+
+    def get(self):
+        return self.value if self.count >= self.min_periods else NaN
+
+
+class _Window:
+    """Fixed-length window with running sum; NaN until full or if it holds a NaN."""
+
+    def __init__(self, size):
+        self.size = size
+        self.buf = deque()
+        self.total = 0.0
+        self.n_nan = 0
+        self.pushes = 0
+        self._undo = None
+
+    def push(self, x):
+        evicted = self.buf.popleft() if len(self.buf) == self.size else None
+        self._undo = (evicted, self.total, self.n_nan)
+        self.buf.append(x)
+        for v, sign in ((x, 1), (evicted, -1)):
+            if v is None:
+                continue
+            if math.isnan(v):
+                self.n_nan += sign
+            else:
+                self.total += sign * v
+        self.pushes += 1
+        if self.pushes % self.size == 0:
+            # Re-sum periodically so add/subtract drift cannot accumulate
+            self.total = math.fsum(v for v in self.buf if not math.isnan(v))
+
+    def rollback(self):
+        evicted, self.total, self.n_nan = self._undo
+        self.buf.pop()
+        if evicted is not None:
+            self.buf.appendleft(evicted)
+        self.pushes -= 1
+
+    @property
+    def ready(self):
+        return len(self.buf) == self.size and self.n_nan == 0
+
+    def mean(self):
+        return self.total / self.size if self.ready else NaN
+
+    def max(self):
+        return max(self.buf) if self.ready else NaN
+
+    def min(self):
+        return min(self.buf) if self.ready else NaN
+
+    def std(self):
+        if not self.ready:
+            return NaN
+        m = self.mean()
+        return math.sqrt(sum((v - m) ** 2 for v in self.buf) / self.size)
+
+    def mad(self):
+        if not self.ready:
+            return NaN
+        m = self.mean()
+        return sum(abs(v - m) for v in self.buf) / self.size
+
+
+class _Wilder:
+    """
+    Wilder smoother with `ta`'s seeding: the first `size` inputs are summed
+    (or averaged), then y = y*(1 - 1/size) + x  (or (y*(size-1) + x)/size).
+    """
+
+    def __init__(self, size, average):
+        self.size = size
+        self.average = average
+        self.seed = []
+        self.value = NaN
+        self._undo = None
+
+    def push(self, x):
+        self._undo = (self.value, len(self.seed))
+        if len(self.seed) < self.size:
+            self.seed.append(x)
+            if len(self.seed) == self.size:
+                s = sum(self.seed)
+                self.value = s / self.size if self.average else s
+        elif self.average:
+            self.value = (self.value * (self.size - 1) + x) / self.size
+        else:
+            self.value = self.value - self.value / self.size + x
+        return self.value
+
+    def rollback(self):
+        self.value, n_seed = self._undo
+        del self.seed[n_seed:]
+
+    @property
+    def ready(self):
+        return len(self.seed) == self.size
+
+
+def _ratio(num, den):
+    """num / den with NumPy semantics (±inf for x/0, NaN for 0/0 or NaN input)."""
+    if den == 0:
+        if num == 0 or math.isnan(num):
+            return NaN
+        return math.copysign(math.inf, num) * math.copysign(1.0, den)
+    return num / den
+
+
+# ═══════════════════════════════════════════════════════════════
+# STREAMING INDICATOR SET
+# ═══════════════════════════════════════════════════════════════
+class StreamingIndicators:
+    """
+    Incremental indicator state for one ticker.
+
+        stream = StreamingIndicators.from_frame(df)    # seed from history
+        latest = stream.update({"Date": ts, "High": h, "Low": l,
+                                "Close": c, "Volume": v})
+    """
+
+    def __init__(self):
+        w = 14
+        self._w = w
+        # Momentum
+        self._rsi_up = _EWM(1 / w, w)
+        self._rsi_dn = _EWM(1 / w, w)
+        self._rsi_win = _Window(w)
+        self._stoch_k = _Window(3)
+        self._stoch_d = _Window(3)
+        self._hh = _Window(w)
+        self._ll = _Window(w)
+        # Trend
+        self._ema12 = _EWM(2 / 13, 12)
+        self._ema26 = _EWM(2 / 27, 26)
+        self._macd_sig = _EWM(2 / 10, 9)
+        self._trs = _Wilder(w, average=False)
+        self._dip = _Wilder(w, average=False)
+        self._din = _Wilder(w, average=False)
+        self._adx = _Wilder(w, average=True)
+        self._tp_win = _Window(20)
+        # Moving averages / volatility
+        self._sma = {n: _Window(n) for n in (10, 20, 50, 100, 200)}
+        self._atr = _Wilder(w, average=True)
+        # Volume
+        self._mf_pos = _Window(w)
+        self._mf_neg = _Window(w)
+
+        self._prev = None          # (high, low, close, tp) of the previous bar
+        self._obv = 0.0
+        self._n = 0
+        self._last_date = None
+        self._undo = None
+        self._pushed = []          # primitives touched by the last bar
+        self.latest = {}
+
+    @classmethod
+    def from_frame(cls, df):
+        """Seed state by replaying a history frame (one pass, done once)."""
+        stream = cls()
+        dates = df['Date'] if 'Date' in df.columns else df.index
+        for date, h, l, c, v in zip(dates, df['High'].to_numpy(float), df['Low'].to_numpy(float),
+                                    df['Close'].to_numpy(float), df['Volume'].to_numpy(float)):
+            stream.update({"Date": date, "High": h, "Low": l, "Close": c, "Volume": v})
+        return stream
+
+    # ── Public API ──
+    def update(self, bar):
+        """
+        Fold in one bar (dict with High, Low, Close, Volume and optional Date).
+        A bar whose Date equals the last Date replaces that bar.
+        Returns a dict of indicator values for the latest bar.
+        """
+        date = bar.get("Date")
+        if date is not None and self._n and date == self._last_date:
+            self._rollback()
+        self._push(float(bar["High"]), float(bar["Low"]),
+                   float(bar["Close"]), float(bar.get("Volume", 0.0)))
+        self._last_date = date
+        return self.latest
+
+    def revise(self, bar):
+        """Replace the most recent bar (e.g. the still-forming intraday candle)."""
+        if self._n:
+            self._rollback()
+        self._push(float(bar["High"]), float(bar["Low"]),
+                   float(bar["Close"]), float(bar.get("Volume", 0.0)))
+        return self.latest
+
+    # ── Internals ──
+    def _rollback(self):
+        for part in reversed(self._pushed):
+            part.rollback()
+        self._prev, self._obv, self._n, self.latest = self._undo
+        self._pushed = []
+
+    def _push(self, h, l, c, v):
+        self._undo = (self._prev, self._obv, self._n, self.latest)
+        pushed = []
+
+        def push(part, x):
+            pushed.append(part)
+            return part.push(x)
+
+        t = self._n
+        w = self._w
+        tp = (h + l + c) / 3.0
+        out = {}
+
+        if self._prev is None:
+            ph = pl = pc = ptp = NaN
+        else:
+            ph, pl, pc, ptp = self._prev
+
+        # ── Momentum ──
+        diff = c - pc
+        up = diff if diff > 0 else 0.0
+        dn = -diff if diff < 0 else 0.0
+        eu = push(self._rsi_up, up)
+        ed = push(self._rsi_dn, dn)
+        if math.isnan(ed):
+            rsi = NaN
+        elif ed == 0:
+            rsi = 100.0
+        else:
+            rsi = 100 - 100 / (1 + eu / ed)
+        out['RSI'] = rsi
+
+        push(self._rsi_win, rsi)
+        lo, hi = self._rsi_win.min(), self._rsi_win.max()
+        stoch = _ratio(rsi - lo, hi - lo)
+        push(self._stoch_k, stoch)
+        k = self._stoch_k.mean()
+        push(self._stoch_d, k)
+        out['Stoch_K'] = k * 100
+        out['Stoch_D'] = self._stoch_d.mean() * 100
+
+        push(self._hh, h)
+        push(self._ll, l)
+        hh, ll = self._hh.max(), self._ll.min()
+        out['Williams_R'] = -100 * _ratio(hh - c, hh - ll)
+
+        # ── Trend ──
+        e12 = push(self._ema12, c)
+        e26 = push(self._ema26, c)
+        macd = e12 - e26
+        sig = push(self._macd_sig, macd)
+        out['MACD'] = macd
+        out['MACD_Signal'] = sig
+        out['MACD_Hist'] = macd - sig
+
+        adx_v = adx_p = adx_n = 0.0
+        if t >= 1:
+            tr = max(h, pc) - min(l, pc)
+            d_up, d_dn = h - ph, pl - l
+            pos = d_up if (d_up > d_dn and d_up > 0) else 0.0
+            neg = d_dn if (d_dn > d_up and d_dn > 0) else 0.0
+            trs = push(self._trs, tr)
+            dip = push(self._dip, pos)
+            din = push(self._din, neg)
+            if self._trs.ready:
+                di_p = 100 * dip / trs if trs != 0 else 0.0
+                di_n = 100 * din / trs if trs != 0 else 0.0
+                dx = 100 * abs((di_p - di_n) / (di_p + di_n)) if di_p + di_n != 0 else 0.0
+                push(self._adx, dx)
+                if t >= w + 1:
+                    adx_p, adx_n = di_p, di_n
+                if self._adx.ready:
+                    adx_v = self._adx.value
+        out['ADX'] = adx_v
+        out['ADX_Pos'] = adx_p
+        out['ADX_Neg'] = adx_n
+
+        push(self._tp_win, tp)
+        out['CCI'] = _ratio(tp - self._tp_win.mean(), 0.015 * self._tp_win.mad())
+
+        # ── Moving Averages ──
+        out['EMA_12'] = e12
+        out['EMA_26'] = e26
+        for n, win in self._sma.items():
+            push(win, c)
+            out[f'SMA_{n}'] = win.mean()
+
+        # ── Volatility ──
+        mid = self._sma[20].mean()
+        sd = self._sma[20].std()
+        out['BB_Upper'] = mid + 2 * sd
+        out['BB_Middle'] = mid
+        out['BB_Lower'] = mid - 2 * sd
+
+        atr_tr = h - l if t == 0 else max(h, pc) - min(l, pc)
+        atr = push(self._atr, atr_tr)
+        out['ATR'] = atr if self._atr.ready else 0.0
+
+        # ── Volume ──
+        self._obv += -v if c < pc else v
+        out['OBV'] = self._obv
+
+        up_down = 1.0 if tp > ptp else (-1.0 if tp < ptp else 0.0)
+        mfr = tp * v * up_down
+        push(self._mf_pos, mfr if mfr >= 0 else 0.0)
+        push(self._mf_neg, mfr if mfr < 0 else 0.0)
+        pos_mf = self._mf_pos.total if self._mf_pos.ready else NaN
+        neg_mf = abs(self._mf_neg.total) if self._mf_neg.ready else NaN
+        out['MFI'] = 100 - 100 / (1 + _ratio(pos_mf, neg_mf))
+
+        self._prev = (h, l, c, tp)
+        self._n = t + 1
+        self._pushed = pushed
+        self.latest = out
+
+    def as_array(self, columns):
+        """Latest values in `columns` order (handy for appending to a frame)."""
+        return np.array([self.latest.get(c, NaN) for c in columns], dtype=float)
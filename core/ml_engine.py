@@ -17,12 +17,11 @@ from sklearn.ensemble import (
     AdaBoostClassifier, ExtraTreesClassifier,
 )
 from sklearn.model_selection import train_test_split, StratifiedKFold, cross_validate
-from sklearn.preprocessing import StandardScaler
 from sklearn.metrics import (
     accuracy_score, precision_score, recall_score, f1_score,
     roc_auc_score, confusion_matrix, classification_report,
 )
-import streamlit as st
+from joblib import parallel_config
 import warnings
 warnings.filterwarnings("ignore")
 
@@ -32,7 +31,11 @@ try:
 except ImportError:
     HAS_XGBOOST = False
 
+from config import WARM_START_EXTRA_ESTIMATORS, WARM_START_MAX_GROWTH
+from core import cache, cpu_budget, feature_matrix, model_registry, perf, training_queue
 from core.eda_engine import FEATURE_COLUMNS, run_eda
+from core.feature_matrix import FeatureMatrix
+from core.feature_rank import rank_features, top_k
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -45,12 +48,12 @@ def _build_model(name: str, flags: dict):
     if name == "Random Forest":
         return RandomForestClassifier(
             n_estimators=300, max_depth=10, min_samples_split=10,
-            class_weight=cw, random_state=42, n_jobs=-1,
+            class_weight=cw, random_state=42, n_jobs=1,
         )
     if name == "Extra Trees":
         return ExtraTreesClassifier(
             n_estimators=300, max_depth=10, min_samples_split=10,
-            class_weight=cw, random_state=42, n_jobs=-1,
+            class_weight=cw, random_state=42, n_jobs=1,
         )
     if name == "Gradient Boosting":
         return GradientBoostingClassifier(
@@ -69,60 +72,178 @@ def _build_model(name: str, flags: dict):
             subsample=0.8, colsample_bytree=0.8,
             scale_pos_weight=scale_pos,
             use_label_encoder=False, eval_metric='logloss',
-            random_state=42, verbosity=0,
+            random_state=42, verbosity=0, n_jobs=1,
         )
     # Fallback
     return RandomForestClassifier(n_estimators=100, random_state=42)
 
 
+# Models whose fit is itself multi-threaded (n_jobs); the rest get one thread per fold
+THREADED_MODELS = {"Random Forest", "Extra Trees", "XGBoost"}
+
+
+def _set_threads(model, n):
+    if "n_jobs" in model.get_params():
+        model.set_params(n_jobs=n)
+    return model
+
+
 # ═══════════════════════════════════════════════════════════════
 # FEATURE PREPARATION
 # ═══════════════════════════════════════════════════════════════
-def _prepare(df: pd.DataFrame, flags: dict):
-    """Prepare X, y with optional lag features from EDA findings."""
-    available = [c for c in FEATURE_COLUMNS if c in df.columns]
+LAG_COLUMNS = ['Close', 'RSI', 'MACD']   # lagged when EDA finds the price non-stationary
+
+
+def _select_top_k(fm: FeatureMatrix, available: list, flags: dict) -> list:
+    """The flags["top_k_features"] best base features by mutual information (all when unset)."""
+    k = flags.get("top_k_features")
+    if not k or k >= len(available):
+        return available
+    order = [f for f in flags.get("feature_order", []) if f in available]
+    if len(order) < len(available):
+        # No (matching) EDA ranking: rank on the fly
+        X, y = fm.rows(available)
+        order = top_k(rank_features(X, y, available), len(available))
+    keep = set(order[:max(k, 5)])   # never fewer than the 5 features training needs
+    return [c for c in available if c in keep]
+
+
+def _feature_spec(fm: FeatureMatrix, flags: dict):
+    """(base features, lag columns) to train on, or (None, None) if too few features."""
+    available = [c for c in FEATURE_COLUMNS if c in fm.columns]
     if len(available) < 5:
-        return None, None, None, None
+        return None, None
+    available = _select_top_k(fm, available, flags)
+    # Add lag features if price is non-stationary
+    lag_columns = [c for c in LAG_COLUMNS if c in available] if flags.get("use_lag_features") else []
+    return available, lag_columns
 
-    df_w = df[available + ['Target']].dropna().copy()
 
-    # Add lag features if price is non-stationary
-    if flags.get("use_lag_features"):
-        for col in ['Close', 'RSI', 'MACD']:
-            if col in df_w.columns:
-                df_w[f'{col}_lag1'] = df_w[col].shift(1)
-                df_w[f'{col}_lag2'] = df_w[col].shift(2)
-                available += [f'{col}_lag1', f'{col}_lag2']
-
-    df_w.dropna(inplace=True)
-    feature_names = [c for c in available if c in df_w.columns]
-    if len(df_w) < 100:
+def _prepare_features(fm: FeatureMatrix, flags: dict, spec=None):
+    """
+    Unscaled X, y and feature names, with optional lag features from EDA
+    findings, pruned to the top-k features by mutual information if set.
+    `spec` is a precomputed _feature_spec(fm, flags).
+    """
+    available, lag_columns = spec or _feature_spec(fm, flags)
+    if available is None:
+        return None, None, None
+    X, y, feature_names = fm.design(available, lag_columns)
+    if len(X) < 100:
+        return None, None, None
+    return X, y, feature_names
+
+
+def _prepare(fm: FeatureMatrix, flags: dict):
+    """Prepare scaled X, y with optional lag features from EDA findings."""
+    spec = _feature_spec(fm, flags)
+    X_raw, y, feature_names = _prepare_features(fm, flags, spec)
+    if X_raw is None:
         return None, None, None, None
+    X_sc, scaler = fm.scaled(*spec)
+    return X_sc, y, feature_names, scaler
 
-    X = df_w[feature_names].values
-    y = df_w['Target'].values
 
-    scaler = StandardScaler()
-    X_sc = scaler.fit_transform(X)
-    return X_sc, y, feature_names, scaler
+# ═══════════════════════════════════════════════════════════════
+# WARM START
+# ═══════════════════════════════════════════════════════════════
+def _warm_start(model, name: str, X_train, y_train, extra: int):
+    """Continue training a fitted ensemble on a shifted window; None if unsupported."""
+    if name in ("Random Forest", "Extra Trees", "Gradient Boosting"):
+        model.set_params(warm_start=True, n_estimators=model.n_estimators + extra)
+        model.fit(X_train, y_train)
+        return model
+    if name == "XGBoost" and HAS_XGBOOST:
+        params = model.get_params()
+        params["n_estimators"] = extra
+        continued = XGBClassifier(**params)
+        continued.fit(X_train, y_train, xgb_model=model.get_booster())
+        return continued
+    return None  # AdaBoost has no warm start → full refit
+
+
+# ═══════════════════════════════════════════════════════════════
+# METRICS
+# ═══════════════════════════════════════════════════════════════
+def _evaluate(model, X, y, split: int, feat_names):
+    """Live prediction, test-split metrics and feature importance for a fitted model."""
+    X_test, y_test = X[split:], y[split:]
+    y_pred  = model.predict(X_test)
+    y_proba = model.predict_proba(X_test)[:, 1] if hasattr(model, 'predict_proba') else y_pred.astype(float)
+
+    # Latest prediction
+    latest_x = X[[-1]]
+    latest_proba = float(model.predict_proba(latest_x)[0][1]) if hasattr(model, 'predict_proba') else 0.5
+
+    # Metrics
+    acc  = accuracy_score(y_test, y_pred)
+    prec = precision_score(y_test, y_pred, zero_division=0)
+    rec  = recall_score(y_test, y_pred, zero_division=0)
+    f1   = f1_score(y_test, y_pred, zero_division=0)
+    try:
+        auc = roc_auc_score(y_test, y_proba)
+    except Exception:
+        auc = 0.5
+    cm = confusion_matrix(y_test, y_pred).tolist()
+
+    # Feature importance
+    feat_imp = []
+    if hasattr(model, 'feature_importances_'):
+        imp = model.feature_importances_
+        feat_imp = sorted(zip(feat_names, imp), key=lambda x: x[1], reverse=True)[:12]
+        feat_imp = [(f, round(float(v), 4)) for f, v in feat_imp]
+
+    return {
+        # Live prediction
+        "prob_up":    round(latest_proba, 4),
+        "prob_down":  round(1 - latest_proba, 4),
+        "prediction": "UP" if latest_proba > 0.5 else "DOWN",
+        # Test metrics
+        "accuracy":   round(acc  * 100, 2),
+        "precision":  round(prec * 100, 2),
+        "recall":     round(rec  * 100, 2),
+        "f1_score":   round(f1   * 100, 2),
+        "roc_auc":    round(auc, 4),
+        "confusion_matrix": cm,
+        # Feature importance
+        "feature_importance": feat_imp,
+    }
+
+
+def _cv_metrics(cv_res) -> dict:
+    return {
+        "cv_accuracy_mean": round(cv_res['test_accuracy'].mean() * 100, 2),
+        "cv_accuracy_std":  round(cv_res['test_accuracy'].std()  * 100, 2),
+        "cv_f1_mean":       round(cv_res['test_f1'].mean()        * 100, 2),
+        "cv_auc_mean":      round(cv_res['test_roc_auc'].mean(), 4),
+    }
 
 
 # ═══════════════════════════════════════════════════════════════
 # TRAINING + FULL METRICS
 # ═══════════════════════════════════════════════════════════════
-@st.cache_data(ttl=600, show_spinner=False)
-def run_ml_analysis(_df_hash, df_values, col_names):
+@perf.traced("ml")
+@cache.memoize("ml", ttl=600)
+def run_ml_analysis(fingerprint, _fm, ticker=None):
+    """Cached entry point for run_ml_pipeline (keyed by the matrix fingerprint)."""
+    return run_ml_pipeline(_fm, ticker)
+
+
+def run_ml_pipeline(fm: FeatureMatrix, ticker=None, progress=None):
     """
-    Full ML pipeline:
-      1. Reconstruct DataFrame
+    Full ML pipeline on a FeatureMatrix (see core.feature_matrix):
+      1. (The matrix replaces the rebuilt DataFrame)
       2. Run EDA → get recommended models + flags
-      3. Train each recommended model
+      3. Train each recommended model (reusing / warm-starting registry
+         entries for `ticker` when the data allows)
       4. Return full metrics + EDA report
+    `progress(fraction, stage)` is called as steps complete, if given.
     """
-    df = pd.DataFrame(df_values, columns=col_names)
+    report = progress or (lambda fraction, stage: None)
 
     # Step 1 — EDA
-    eda = run_eda(df)
+    report(0.0, "Running EDA")
+    eda = run_eda(fm, key=ticker)
     recommended = eda["recommended_models"]
     flags = eda["model_flags"]
 
@@ -134,78 +255,89 @@ def run_ml_analysis(_df_hash, df_values, col_names):
         flags["scale_pos_weight"] = round(n0 / max(n1, 1), 2)
 
     # Step 2 — Feature preparation
-    X, y, feat_names, scaler = _prepare(df, flags)
-    if X is None:
+    spec = _feature_spec(fm, flags)
+    X_raw, y, feat_names = _prepare_features(fm, flags, spec)
+    if X_raw is None:
         return {"eda": eda, "models": {}, "error": "Not enough data/features."}
+    X, scaler = fm.scaled(*spec)
+
+    data_fp = model_registry.data_fingerprint(X_raw, y) if ticker else None
+    rows = model_registry.row_hashes(X_raw) if ticker else None
 
     # Step 3 — Time-series train/test split (no shuffle)
     split = int(len(X) * 0.80)
-    X_train, X_test = X[:split], X[split:]
-    y_train, y_test = y[:split], y[split:]
+    X_train = X[:split]
+    y_train = y[:split]
 
     cv = StratifiedKFold(n_splits=5, shuffle=False)
 
     model_results = {}
-    for name in recommended:
+    for i, name in enumerate(recommended):
         if name == "XGBoost" and not HAS_XGBOOST:
             continue
+        report(0.1 + 0.9 * i / len(recommended), f"Training {name}")
         try:
             model = _build_model(name, flags)
-
-            # Cross-val
-            cv_res = cross_validate(
-                model, X_train, y_train, cv=cv,
-                scoring=['accuracy', 'f1', 'roc_auc'],
-                return_train_score=False, n_jobs=-1,
-            )
-
-            # Full train
-            model.fit(X_train, y_train)
-            y_pred  = model.predict(X_test)
-            y_proba = model.predict_proba(X_test)[:, 1] if hasattr(model, 'predict_proba') else y_pred.astype(float)
-
-            # Latest prediction
-            latest_x = X[[-1]]
-            latest_proba = float(model.predict_proba(latest_x)[0][1]) if hasattr(model, 'predict_proba') else 0.5
-
-            # Metrics
-            acc  = accuracy_score(y_test, y_pred)
-            prec = precision_score(y_test, y_pred, zero_division=0)
-            rec  = recall_score(y_test, y_pred, zero_division=0)
-            f1   = f1_score(y_test, y_pred, zero_division=0)
-            try:
-                auc = roc_auc_score(y_test, y_proba)
-            except Exception:
-                auc = 0.5
-            cm = confusion_matrix(y_test, y_pred).tolist()
-
-            # Feature importance
-            feat_imp = []
-            if hasattr(model, 'feature_importances_'):
-                imp = model.feature_importances_
-                feat_imp = sorted(zip(feat_names, imp), key=lambda x: x[1], reverse=True)[:12]
-                feat_imp = [(f, round(float(v), 4)) for f, v in feat_imp]
-
-            model_results[name] = {
-                # Live prediction
-                "prob_up":    round(latest_proba, 4),
-                "prob_down":  round(1 - latest_proba, 4),
-                "prediction": "UP" if latest_proba > 0.5 else "DOWN",
-                # Test metrics
-                "accuracy":   round(acc  * 100, 2),
-                "precision":  round(prec * 100, 2),
-                "recall":     round(rec  * 100, 2),
-                "f1_score":   round(f1   * 100, 2),
-                "roc_auc":    round(auc, 4),
-                "confusion_matrix": cm,
-                # CV metrics
-                "cv_accuracy_mean": round(cv_res['test_accuracy'].mean() * 100, 2),
-                "cv_accuracy_std":  round(cv_res['test_accuracy'].std()  * 100, 2),
-                "cv_f1_mean":       round(cv_res['test_f1'].mean()        * 100, 2),
-                "cv_auc_mean":      round(cv_res['test_roc_auc'].mean(), 4),
-                # Feature importance
-                "feature_importance": feat_imp,
-            }
+            key = model_registry.params_key(model, feat_names)
+            entry = model_registry.load(ticker, name, key) if ticker else None
+
+            # Identical data → the stored fit is exactly what we'd train
+            if entry and entry["fingerprint"] == data_fp:
+                model_results[name] = {**entry["metrics"], "source": "registry",
+                                       "timing": {"wall_s": 0.0, "cpu_s": 0.0, "cores": 0, "n_jobs": "–"}}
+                continue
+
+            fitted = None
+            grown = 0
+            if entry and model_registry.new_bar_count(entry, rows) is not None:
+                grown = entry.get("extra_estimators", 0) + WARM_START_EXTRA_ESTIMATORS
+                if grown <= model.get_params().get("n_estimators", 0) * (WARM_START_MAX_GROWTH - 1):
+                    fit_scaler = entry["scaler"]
+                    X_fit = fit_scaler.transform(X_raw)
+                    with cpu_budget.lease() as cores, cpu_budget.Stopwatch() as sw:
+                        fitted = _warm_start(_set_threads(entry["model"], cores), name,
+                                             X_fit[:split], y_train, WARM_START_EXTRA_ESTIMATORS)
+                    # CV is not rerun on a warm start: label the scores as the earlier fit's
+                    cv_metrics = {**entry["cv_metrics"], "cv_from": "previous fit"}
+                    source = "warm-start"
+                    timing = {"wall_s": round(sw.wall, 3), "cpu_s": round(sw.cpu, 3),
+                              "cores": cores, "n_jobs": f"1×{cores}"}
+
+            if fitted is None:
+                # One lease per model: folds × estimator threads never exceed it
+                with cpu_budget.lease() as cores, cpu_budget.Stopwatch() as sw:
+                    outer, inner = cpu_budget.split(cores, cv.get_n_splits(), name in THREADED_MODELS)
+                    # Threads, not processes: the estimators release the GIL and
+                    # process_time() then covers the folds too
+                    with parallel_config(backend="threading"):
+                        cv_res = cross_validate(
+                            _set_threads(model, inner), X_train, y_train, cv=cv,
+                            scoring=['accuracy', 'f1', 'roc_auc'],
+                            return_train_score=False, n_jobs=outer,
+                        )
+                    # Full train
+                    _set_threads(model, cores).fit(X_train, y_train)
+                fitted, fit_scaler, X_fit = model, scaler, X
+                cv_metrics = {**_cv_metrics(cv_res), "cv_from": "this fit"}
+                grown = 0
+                source = "trained"
+                timing = {"wall_s": round(sw.wall, 3), "cpu_s": round(sw.cpu, 3),
+                          "cores": cores, "n_jobs": f"{outer}×{inner}"}
+
+            metrics = {**_evaluate(fitted, X_fit, y, split, feat_names), **cv_metrics}
+            model_results[name] = {**metrics, "source": source, "timing": timing}
+
+            if ticker:
+                model_registry.save(ticker, name, key, {
+                    "fingerprint": data_fp,
+                    "row_hashes": rows,
+                    "model": fitted,
+                    "scaler": fit_scaler,
+                    "feature_names": feat_names,
+                    "metrics": metrics,
+                    "cv_metrics": cv_metrics,
+                    "extra_estimators": grown,
+                })
 
         except Exception as e:
             model_results[name] = {"error": str(e), "prob_up": 0.5, "prediction": "N/A"}
@@ -225,15 +357,21 @@ def run_ml_analysis(_df_hash, df_values, col_names):
             "n_models":      len(valid),
         }
 
+    report(1.0, "Done")
     return {"eda": eda, "models": model_results}
 
 
-def get_ml_results(df: pd.DataFrame):
-    """Public API: run the full ML pipeline on an indicator-enriched DataFrame."""
+@perf.traced("ml")
+def get_ml_results(df: pd.DataFrame, ticker: str = None, background: bool = False):
+    """
+    Public API: run the full ML pipeline on an indicator-enriched DataFrame.
+    Pass `ticker` to persist fitted models and reuse/warm-start them later.
+    With background=True the run is queued on the training worker pool and
+    the job id is returned immediately (see core.training_queue).
+    """
     if df.empty or 'Target' not in df.columns:
         return None
-    # Build a stable hash
-    df_hash = int(pd.util.hash_pandas_object(df['Close'].tail(20)).sum())
-    cols = [c for c in df.columns if c != 'Date']
-    df_sub = df[[c for c in cols if c in df.columns]].tail(500)
-    return run_ml_analysis(df_hash, df_sub.values, list(df_sub.columns))
+    fm = feature_matrix.build(df.tail(500), FEATURE_COLUMNS)
+    if background:
+        return training_queue.submit(f"{ticker}:{fm.fingerprint}", ticker, run_ml_pipeline, fm, ticker)
+    return run_ml_analysis(fm.fingerprint, fm, ticker)
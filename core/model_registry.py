@@ -0,0 +1,99 @@
+"""
+TradeIntel Pro - Model Registry
+On-disk store of fitted estimators for run_ml_analysis.
+
+One entry per (ticker, model name, hyper-params + feature set) holding the
+fitted estimator, its scaler, feature names, metrics and fingerprints of the
+training data. The ML engine uses it to:
+  - reuse an entry untouched when the data fingerprint is identical
+  - warm-start it when the new window is the old one shifted by a few bars
+  - otherwise refit from scratch and overwrite the entry
+"""
+
+import hashlib
+import json
+import os
+import threading
+from urllib.parse import quote
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from config import DATA_DIR, WARM_START_MAX_BARS
+from core import fingerprint
+
+REGISTRY_DIR = os.path.join(DATA_DIR, "models")
+_lock = threading.Lock()
+
+
+# ═══════════════════════════════════════════════════════════════
+# KEYS & FINGERPRINTS
+# ═══════════════════════════════════════════════════════════════
+def data_fingerprint(X, y):
+    """Content hash of a feature matrix + target."""
+    return fingerprint.of(np.asarray(X, dtype=np.float64), np.asarray(y, dtype=np.int64))
+
+
+def row_hashes(X):
+    """One uint64 per feature row, used to line up an old window with a new one."""
+    return pd.util.hash_pandas_object(pd.DataFrame(X), index=False).to_numpy()
+
+
+def params_key(model, feature_names):
+    """Stable key for an estimator's hyper-params and the features it was trained on."""
+    params = {k: v for k, v in model.get_params().items() if k not in ("n_jobs", "warm_start", "verbose")}
+    blob = json.dumps({"params": params, "features": list(feature_names)}, sort_keys=True, default=str)
+    return hashlib.blake2b(blob.encode(), digest_size=8).hexdigest()
+
+
+def _path(ticker, name, key):
+    slug = name.lower().replace(" ", "_")
+    return os.path.join(REGISTRY_DIR, quote(ticker, safe=""), f"{slug}-{key}.joblib")
+
+
+# ═══════════════════════════════════════════════════════════════
+# LOAD / SAVE
+# ═══════════════════════════════════════════════════════════════
+def load(ticker, name, key):
+    """Stored entry dict for this ticker/model/params, or None."""
+    path = _path(ticker, name, key)
+    if not os.path.exists(path):
+        return None
+    try:
+        return joblib.load(path)
+    except Exception as e:
+        print(f"Discarding unreadable model entry {path}: {e}")
+        return None
+
+
+def save(ticker, name, key, entry):
+    path = _path(ticker, name, key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with _lock:
+        joblib.dump(entry, tmp, compress=3)
+        os.replace(tmp, path)
+
+
+# ═══════════════════════════════════════════════════════════════
+# WARM-START ELIGIBILITY
+# ═══════════════════════════════════════════════════════════════
+def new_bar_count(entry, rows, tolerance=2):
+    """
+    How many bars the new training window is ahead of the stored one, or None
+    if they don't line up within WARM_START_MAX_BARS. The last `tolerance`
+    stored rows may differ (the final candle and its Target get revised).
+    """
+    old = entry.get("row_hashes")
+    if old is None or len(old) <= tolerance:
+        return None
+    for k in range(0, WARM_START_MAX_BARS + 1):
+        overlap = old[k:len(old) - tolerance]
+        if len(overlap) == 0 or len(overlap) > len(rows):
+            continue
+        if np.array_equal(overlap, rows[:len(overlap)]):
+            added = len(rows) - (len(old) - k)
+            if 0 <= added <= WARM_START_MAX_BARS + tolerance:
+                return added
+    return None
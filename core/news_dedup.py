@@ -0,0 +1,160 @@
+"""
+TradeIntel Pro - Headline Deduplication
+Near-duplicate detection for news headlines (shingling + MinHash LSH).
+
+The same wire story shows up under several publishers and tickers with
+small edits ("... - Reuters", "..., shares rise"). Each headline is
+normalized, cut into character shingles and reduced to a MinHash
+signature; LSH banding puts signatures that agree on a whole band in the
+same bucket, so a lookup only compares against the few headlines sharing
+a bucket, not the whole store. A headline whose estimated Jaccard
+similarity to an indexed one reaches NEWS_DEDUP_THRESHOLD joins that
+story's cluster.
+
+One index is shared by every ticker, market and refresh in the process;
+the oldest stories are evicted beyond NEWS_DEDUP_CAPACITY.
+"""
+
+import re
+import threading
+import unicodedata
+import zlib
+from collections import deque
+
+import numpy as np
+
+from config import NEWS_DEDUP_THRESHOLD, NEWS_DEDUP_CAPACITY
+
+NUM_PERM = 64              # MinHash permutations
+BANDS = 16                 # LSH bands of NUM_PERM // BANDS rows (≈0.5 similarity knee)
+SHINGLE = 5                # characters per shingle
+
+_SUFFIX = re.compile(r"\s+[-|–—]\s+[^-|–—]{1,40}$")   # trailing " - Publisher"
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+
+def normalize(title):
+    """Lowercase, publisher suffix and punctuation stripped, single-spaced."""
+    text = unicodedata.normalize("NFKC", title).lower().strip()
+    text = _SUFFIX.sub("", text)
+    return _NON_WORD.sub(" ", text).strip()
+
+
+def shingles(text):
+    if len(text) <= SHINGLE:
+        return {text}
+    return {text[i:i + SHINGLE] for i in range(len(text) - SHINGLE + 1)}
+
+
+# ═══════════════════════════════════════════════════════════════
+# INDEX
+# ═══════════════════════════════════════════════════════════════
+class DedupIndex:
+    """MinHash LSH index mapping headlines to story cluster ids."""
+
+    def __init__(self, threshold=NEWS_DEDUP_THRESHOLD, capacity=NEWS_DEDUP_CAPACITY,
+                 num_perm=NUM_PERM, bands=BANDS, seed=1):
+        rng = np.random.default_rng(seed)
+        # multiply-shift hashing: h(x) = (a·x + b mod 2^64) >> 32, a odd
+        self._a = rng.integers(1, 2**63, num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 2**63, num_perm, dtype=np.uint64)
+        self.threshold = threshold
+        self.capacity = capacity
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._buckets = [{} for _ in range(bands)]   # band → {band bytes: [ids]}
+        self._sigs = np.zeros((capacity, num_perm), dtype=np.uint32)  # row id % capacity
+        self._exact = {}                              # normalized text → cluster id
+        self._texts = {}                              # id → normalized texts mapped to it
+        self._order = deque()                         # ids, oldest first
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._order)
+
+    def signature(self, text):
+        grams = shingles(text)
+        x = np.fromiter((zlib.crc32(g.encode()) for g in grams), dtype=np.uint64, count=len(grams))
+        return ((np.outer(x, self._a) + self._b) >> np.uint64(32)).min(axis=0).astype(np.uint32)
+
+    def _band_keys(self, sig):
+        r = self.rows
+        return [sig[i * r:(i + 1) * r].tobytes() for i in range(self.bands)]
+
+    def cluster(self, title):
+        """Cluster id of `title`: an indexed near-duplicate's, or a new one."""
+        text = normalize(title)
+        with self._lock:
+            if text in self._exact:
+                return self._exact[text]
+        sig = self.signature(text)
+        keys = self._band_keys(sig)
+        with self._lock:
+            if text in self._exact:            # clustered by another thread meanwhile
+                return self._exact[text]
+            candidates = set()
+            for band, key in zip(self._buckets, keys):
+                candidates.update(band.get(key, ()))
+            best = None
+            if candidates:
+                ids = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+                sims = (self._sigs[ids % self.capacity] == sig).mean(axis=1)
+                if sims.max() >= self.threshold:
+                    best = int(ids[sims.argmax()])
+            if best is not None:
+                self._exact[text] = best
+                self._texts[best].append(text)
+                return best
+
+            cid = self._next
+            self._next += 1
+            while len(self._order) >= self.capacity:
+                self._evict()
+            self._sigs[cid % self.capacity] = sig
+            for band, key in zip(self._buckets, keys):
+                band.setdefault(key, []).append(cid)
+            self._exact[text] = cid
+            self._texts[cid] = [text]
+            self._order.append(cid)
+            return cid
+
+    def _evict(self):
+        cid = self._order.popleft()
+        for band, key in zip(self._buckets, self._band_keys(self._sigs[cid % self.capacity])):
+            ids = band[key]
+            ids.remove(cid)
+            if not ids:
+                del band[key]
+        for text in self._texts.pop(cid):
+            self._exact.pop(text, None)
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_index():
+    """Process-wide index shared across tickers and refreshes."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = DedupIndex()
+        return _index
+
+
+def dedupe(articles):
+    """
+    Tag each article with its story "cluster" (if not already tagged) and
+    return the first article of every cluster, in order.
+    """
+    index = get_index()
+    seen = set()
+    unique = []
+    for a in articles:
+        if "cluster" not in a:
+            a["cluster"] = index.cluster(a["title"])
+        if a["cluster"] not in seen:
+            seen.add(a["cluster"])
+            unique.append(a)
+    return unique
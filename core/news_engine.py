@@ -3,15 +3,31 @@ TradeIntel Pro - News & Sentiment Engine
 Fetches news and analyzes sentiment for stocks, commodities, and markets.
 """
 
-import streamlit as st
-from textblob import TextBlob
+import abc
+import re
+from itertools import chain
+
 import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from config import NEWS_TIMEOUT, SENTIMENT_BACKEND
+from core import async_io, cache, news_dedup, perf, sentiment_store
+from core.sentiment_lexicon import LEXICON, NEGATORS, NEGATION_SCOPE, NEGATION_FACTOR
+
+MARKET_KEYWORDS = {
+    "indian": ["India Stock Market", "Sensex Nifty", "Indian Economy"],
+    "us": ["US Stock Market", "Wall Street", "Robinhood Stocks", "S&P 500"],
+    "commodities": ["Gold Price", "Silver Price", "Crude Oil", "Commodity Market"],
+}
+RESULTS_PER_KEYWORD = 5
 
 
 # ═══════════════════════════════════════════════════════════════
 # NEWS FETCHING
 # ═══════════════════════════════════════════════════════════════
-@st.cache_data(ttl=900, show_spinner=False)
+@perf.traced("news")
+@cache.memoize("news", ttl=900)
 def fetch_ticker_news(ticker):
     """Fetch news for a specific ticker using yfinance with smarter commodity fallback."""
     try:
@@ -38,75 +54,175 @@ def fetch_ticker_news(ticker):
                 source = source.get('displayName', 'Market News')
             
             if title:
-                sentiment = TextBlob(title).sentiment.polarity
                 articles.append({
                     "title": title,
                     "summary": summary,
                     "source": source,
                     "date": content.get('pubDate', ''),
-                    "sentiment": round(sentiment, 3),
-                    "sentiment_label": "Positive" if sentiment > 0.1 else ("Negative" if sentiment < -0.1 else "Neutral"),
                 })
 
-        return articles
+        return score_articles(articles)
     except Exception as e:
         print(f"Error fetching news for {ticker}: {e}")
         return []
 
 
-@st.cache_data(ttl=1800, show_spinner=False)
+@perf.traced("news")
+@cache.memoize("news", ttl=1800)
 def fetch_market_news(market_type="us"):
-    """Fetch general market news using GoogleNews or fallback."""
-    keywords_map = {
-        "indian": ["India Stock Market", "Sensex Nifty", "Indian Economy"],
-        "us": ["US Stock Market", "Wall Street", "Robinhood Stocks", "S&P 500"],
-        "commodities": ["Gold Price", "Silver Price", "Crude Oil", "Commodity Market"],
-    }
-
-    keywords = keywords_map.get(market_type, keywords_map["us"])
+    """Fetch general market news using GoogleNews, one concurrent search per keyword."""
+    keywords = MARKET_KEYWORDS.get(market_type, MARKET_KEYWORDS["us"])
 
     try:
-        from GoogleNews import GoogleNews
-        googlenews = GoogleNews(period='3d')
+        found = async_io.run(async_io.gather_partial(
+            {key: async_io.call_blocking(_google_search, key) for key in keywords},
+            timeout=NEWS_TIMEOUT,
+        ))
         all_articles = []
+        for key in keywords:           # keep keyword order, whatever finished first
+            for res in found.get(key, [])[:RESULTS_PER_KEYWORD]:
+                title = res.get('title', '')
+                if title:
+                    all_articles.append({
+                        "title": title,
+                        "summary": res.get('desc', title),
+                        "source": res.get('media', 'Google News'),
+                        "date": res.get('date', ''),
+                    })
 
-        for key in keywords:
-            googlenews.search(key)
-            results = googlenews.result()
-            if results:
-                for res in results[:5]:
-                    title = res.get('title', '')
-                    if title:
-                        sentiment = TextBlob(title).sentiment.polarity
-                        all_articles.append({
-                            "title": title,
-                            "summary": res.get('desc', title),
-                            "source": res.get('media', 'Google News'),
-                            "date": res.get('date', ''),
-                            "sentiment": round(sentiment, 3),
-                            "sentiment_label": "Positive" if sentiment > 0.1 else ("Negative" if sentiment < -0.1 else "Neutral"),
-                        })
-            googlenews.clear()
-
-        # Deduplicate by title
-        seen = set()
-        unique = []
-        for a in all_articles:
-            if a['title'] not in seen:
-                seen.add(a['title'])
-                unique.append(a)
-
-        return unique
+        return score_articles(all_articles)
     except Exception as e:
         print(f"Error fetching market news: {e}")
         return []
 
 
+def _google_search(keyword):
+    """One GoogleNews search (the client is stateful, so one instance per call)."""
+    from GoogleNews import GoogleNews
+    googlenews = GoogleNews(period='3d')
+    googlenews.search(keyword)
+    return googlenews.result()
+
+
+# ═══════════════════════════════════════════════════════════════
+# SENTIMENT BACKENDS
+# ═══════════════════════════════════════════════════════════════
+class SentimentBackend(abc.ABC):
+    """Scores a batch of headlines: one polarity in -1..1 per title."""
+
+    name = ""
+    memoize = True         # route through the persistent sentiment store
+
+    @abc.abstractmethod
+    def score(self, titles):
+        """Polarity array (-1..1), one per title."""
+
+
+class TextBlobBackend(SentimentBackend):
+    """TextBlob pattern polarity, one string at a time (compatibility backend)."""
+
+    name = "textblob"
+
+    def score(self, titles):
+        return np.array(sentiment_store.textblob_polarity(titles), dtype=float)
+
+
+class LexiconBackend(SentimentBackend):
+    """
+    Finance lexicon scorer, vectorized over the batch. Titles are tokenized
+    once; tokens are mapped to lexicon ids in one hash lookup, words within
+    NEGATION_SCOPE tokens after a negator are flipped, and the per-title
+    sums come from one sparse (titles × lexicon) @ weights product.
+    Sums are squashed to -1..1 with x / sqrt(x² + SATURATION).
+    """
+
+    name = "lexicon"
+    memoize = False        # scoring is cheaper than the store lookup
+    SATURATION = 1.0
+    _WORD = re.compile(r"[a-z]+(?:['\-][a-z]+)*")
+
+    def __init__(self, lexicon=LEXICON, negators=NEGATORS):
+        self.vocab = pd.Index(list(lexicon))
+        self.weights = np.array(list(lexicon.values()), dtype=float)
+        self.negators = pd.Index(list(negators))
+
+    def tokenize(self, titles):
+        return [self._WORD.findall(t.lower().replace("\u2019", "'")) for t in titles]
+
+    def score(self, titles):
+        n = len(titles)
+        tokens = self.tokenize(titles)
+        lengths = np.fromiter(map(len, tokens), dtype=np.int64, count=n)
+        flat = list(chain.from_iterable(tokens))
+        if not flat:
+            return np.zeros(n)
+        doc = np.repeat(np.arange(n), lengths)
+        ids = self.vocab.get_indexer(flat)
+        is_neg = self.negators.get_indexer(flat) >= 0
+
+        negated = np.zeros(len(flat), dtype=bool)
+        for k in range(1, NEGATION_SCOPE + 1):
+            negated[k:] |= is_neg[:-k] & (doc[k:] == doc[:-k])
+
+        hit = ids >= 0
+        sign = np.where(negated[hit], NEGATION_FACTOR, 1.0)
+        X = sparse.csr_matrix((sign, (doc[hit], ids[hit])), shape=(n, len(self.vocab)))
+        raw = X @ self.weights
+        return raw / np.sqrt(raw * raw + self.SATURATION)
+
+
+BACKENDS = {"textblob": TextBlobBackend, "lexicon": LexiconBackend}
+_backends = {}
+
+
+def get_backend(name=None):
+    """Shared instance of a sentiment backend (default: config SENTIMENT_BACKEND)."""
+    name = name or SENTIMENT_BACKEND
+    if name not in _backends:
+        if name not in BACKENDS:
+            raise ValueError(f"Unknown sentiment backend {name!r}; choose from {sorted(BACKENDS)}")
+        _backends[name] = BACKENDS[name]()
+    return _backends[name]
+
+
+def score_titles(titles, backend=None):
+    """Polarity (-1..1) for each headline, as an array, scored in one batch."""
+    titles = list(titles)
+    if not titles:
+        return np.zeros(0)
+    b = get_backend(backend)
+    if b.memoize:
+        return np.array(sentiment_store.score_titles(titles, b.name, b.score))
+    return b.score(titles)
+
+
 # ═══════════════════════════════════════════════════════════════
 # SENTIMENT ANALYSIS
 # ═══════════════════════════════════════════════════════════════
+def _label(sentiment):
+    return "Positive" if sentiment > 0.1 else ("Negative" if sentiment < -0.1 else "Neutral")
+
+
+def unique_articles(articles):
+    """
+    Articles with near-duplicate stories (same wire copy, other publisher;
+    across tickers and markets) removed. Dedupe once, where feeds are merged.
+    """
+    return news_dedup.dedupe(articles)
+
+
+def score_articles(articles, backend=None):
+    """Fill in sentiment / sentiment_label for articles, scoring all titles in one batch."""
+    scores = score_titles([a["title"] for a in articles], backend)
+    for article, sentiment in zip(articles, scores.tolist()):
+        article["sentiment"] = round(sentiment, 3)
+        article["sentiment_label"] = _label(sentiment)
+    return articles
+
+
+@perf.traced("news")
 def compute_sentiment_score(articles):
-    """Compute aggregate sentiment from articles."""
+    """Compute aggregate sentiment from articles (deduplicated with unique_articles)."""
     if not articles:
         return 0.0, "Neutral", {"positive": 0, "negative": 0, "neutral": 0}
 
@@ -133,3 +249,17 @@ def compute_sentiment_score(articles):
         "negative": negative,
         "neutral": neutral,
     }
+
+
+def compute_sentiment_scores(articles_by_key, backend=None):
+    """
+    Batch form of compute_sentiment_score for many tickers at once:
+    {key: articles} → {key: (score, label, counts)}. Each key's articles are
+    deduplicated once; those without a "sentiment" are scored together in a
+    single backend call.
+    """
+    unique = {key: unique_articles(articles) for key, articles in articles_by_key.items()}
+    unscored = [a for articles in unique.values() for a in articles if "sentiment" not in a]
+    if unscored:
+        score_articles(unscored, backend)
+    return {key: compute_sentiment_score(articles) for key, articles in unique.items()}
@@ -0,0 +1,122 @@
+"""
+TradeIntel Pro - OHLCV Store
+Persistent per-ticker daily bar store (Parquet on disk).
+
+The first request for a ticker downloads STORE_BASE_PERIOD of history; every
+later request only fetches the bars from the last stored session onwards and
+appends them. Chart periods ("3mo", "6mo", "1y", "2y") are sliced from the
+one stored series, so a process restart never re-downloads years of bars.
+"""
+
+import os
+import threading
+import time
+from urllib.parse import quote
+
+import pandas as pd
+import yfinance as yf
+
+from config import DATA_DIR, STORE_BASE_PERIOD, STORE_REFRESH_INTERVAL
+
+STORE_DIR = os.path.join(DATA_DIR, "ohlcv")
+
+PERIOD_OFFSETS = {
+    "5d": pd.DateOffset(days=5),
+    "1mo": pd.DateOffset(months=1),
+    "3mo": pd.DateOffset(months=3),
+    "6mo": pd.DateOffset(months=6),
+    "1y": pd.DateOffset(years=1),
+    "2y": pd.DateOffset(years=2),
+}
+
+_locks = {}
+_locks_guard = threading.Lock()
+
+
+def _ticker_lock(ticker):
+    with _locks_guard:
+        return _locks.setdefault(ticker, threading.Lock())
+
+
+def _path(ticker):
+    return os.path.join(STORE_DIR, f"{quote(ticker, safe='')}.parquet")
+
+
+# ═══════════════════════════════════════════════════════════════
+# DISK I/O
+# ═══════════════════════════════════════════════════════════════
+def load(ticker):
+    """Read the stored bars for a ticker (Date-indexed, empty if none)."""
+    path = _path(ticker)
+    if not os.path.exists(path):
+        return pd.DataFrame()
+    try:
+        return pd.read_parquet(path)
+    except Exception as e:
+        print(f"Corrupt store file for {ticker}, discarding: {e}")
+        return pd.DataFrame()
+
+
+def _save(ticker, df):
+    os.makedirs(STORE_DIR, exist_ok=True)
+    path = _path(ticker)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    df.to_parquet(tmp)
+    os.replace(tmp, path)  # atomic: readers never see a half-written file
+
+
+def _download(ticker, **kwargs):
+    df = yf.Ticker(ticker).history(**kwargs)
+    if df.empty:
+        return df
+    df.index = df.index.tz_localize(None)
+    df.index.name = "Date"
+    return df
+
+
+# ═══════════════════════════════════════════════════════════════
+# INCREMENTAL UPDATE
+# ═══════════════════════════════════════════════════════════════
+def update(ticker, force=False):
+    """
+    Bring the stored series up to date and return it.
+    Only bars from the last stored session onwards are downloaded; that
+    session is re-fetched too because it may have been a partial candle.
+    """
+    with _ticker_lock(ticker):
+        stored = load(ticker)
+        path = _path(ticker)
+        if not stored.empty and not force:
+            age = time.time() - os.path.getmtime(path)
+            if age < STORE_REFRESH_INTERVAL:
+                return stored
+
+        if stored.empty:
+            fresh = _download(ticker, period=STORE_BASE_PERIOD)
+            if fresh.empty:
+                return stored
+            merged = fresh
+        else:
+            start = stored.index[-1].normalize()
+            fresh = _download(ticker, start=start.strftime("%Y-%m-%d"))
+            if fresh.empty:
+                os.utime(path)  # nothing new (market closed); still counts as checked
+                return stored
+            merged = pd.concat([stored[stored.index < fresh.index[0]], fresh])
+            merged = merged[~merged.index.duplicated(keep="last")]
+
+        _save(ticker, merged)
+        return merged
+
+
+def slice_period(df, period):
+    """Return the tail of a Date-indexed frame covering a yfinance-style period."""
+    if df.empty or period not in PERIOD_OFFSETS:
+        return df
+    start = df.index[-1] - PERIOD_OFFSETS[period]
+    return df[df.index >= start]
+
+
+def get_history(ticker, period="1y"):
+    """Stored bars for `ticker`, refreshed incrementally and sliced to `period`."""
+    return slice_period(update(ticker), period)
@@ -0,0 +1,198 @@
+"""
+TradeIntel Pro - Performance Tracing
+Lightweight timing of core entry points, for the hidden Performance tab.
+
+Every traced call appends one span (stage, name, start, duration, cache
+outcome, payload bytes, thread, rerun id) to a fixed-size ring buffer, so
+memory use is bounded however long the process runs. Spans nest: an inner
+call records its own span and the outer one still covers the whole call.
+
+    @traced("indicators")
+    def compute_all_indicators(df): ...
+
+    with span("charts", "candlestick"):
+        fig = charts.candlestick_chart(df)
+
+`begin_run()` tags everything recorded afterwards in the calling context
+(the Streamlit script thread) with a rerun id; `chrome_trace(run)` exports
+one rerun in Chrome trace-event format (chrome://tracing, Perfetto).
+"""
+
+import contextvars
+import functools
+import itertools
+import os
+import threading
+import time
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from config import PERF_RING_SIZE
+
+_spans = deque(maxlen=PERF_RING_SIZE)
+_lock = threading.Lock()
+_run_ids = itertools.count(1)
+_run = contextvars.ContextVar("tradeintel_run", default=None)
+_open = threading.local()              # per-thread stack of spans being recorded
+
+
+# ═══════════════════════════════════════════════════════════════
+# RECORDING
+# ═══════════════════════════════════════════════════════════════
+def _payload_bytes(value):
+    """Cheap (shallow) size of a return value; None when it has no obvious size."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    return None
+
+
+def begin_run():
+    """Start a new rerun id for spans recorded from this context; returns it."""
+    run = next(_run_ids)
+    _run.set(run)
+    return run
+
+
+def current_run():
+    return _run.get()
+
+
+class span:
+    """Context manager recording one span; `note()` inside it adds fields."""
+
+    __slots__ = ("stage", "name", "fields", "start")
+
+    def __init__(self, stage, name=None, **fields):
+        self.stage = stage
+        self.name = name or stage
+        self.fields = fields
+
+    def __enter__(self):
+        stack = getattr(_open, "stack", None)
+        if stack is None:
+            stack = _open.stack = []
+        stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter() - self.start
+        _open.stack.pop()
+        record = {
+            "stage": self.stage,
+            "name": self.name,
+            "start": self.start,
+            "duration": duration,
+            "cache": None,
+            "bytes": None,
+            "error": exc_type.__name__ if exc_type else None,
+            "run": _run.get(),
+            "tid": threading.get_ident(),
+            "thread": threading.current_thread().name,
+            **self.fields,
+        }
+        with _lock:
+            _spans.append(record)
+        return False
+
+
+def note(**fields):
+    """Annotate the innermost open span on this thread (e.g. cache="hit"/"stale"/"miss")."""
+    stack = getattr(_open, "stack", None)
+    if stack:
+        stack[-1].fields.update(fields)
+
+
+def traced(stage, name=None):
+    """Decorator: record a span per call, with the payload size of the result."""
+    def decorator(fn):
+        label = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(stage, label) as s:
+                result = fn(*args, **kwargs)
+                if "bytes" not in s.fields:
+                    s.fields["bytes"] = _payload_bytes(result)
+                return result
+        return wrapper
+    return decorator
+
+
+# ═══════════════════════════════════════════════════════════════
+# READING
+# ═══════════════════════════════════════════════════════════════
+def spans(run=None):
+    """Recorded spans (oldest first), optionally only those of one rerun."""
+    with _lock:
+        records = list(_spans)
+    return records if run is None else [r for r in records if r["run"] == run]
+
+
+def runs():
+    """{run id: span count} for reruns still (partly) in the ring buffer, newest first."""
+    counts = {}
+    for r in spans():
+        if r["run"] is not None:
+            counts[r["run"]] = counts.get(r["run"], 0) + 1
+    return dict(sorted(counts.items(), reverse=True))
+
+
+def summary(records=None):
+    """Per stage/name: calls, p50/p95/max latency (ms), cache hit rate, mean payload."""
+    records = spans() if records is None else records
+    if not records:
+        return pd.DataFrame()
+    df = pd.DataFrame(records)
+    df["ms"] = df["duration"] * 1000
+    rows = []
+    for (stage, name), g in df.groupby(["stage", "name"], sort=False):
+        lookups = g["cache"].dropna()
+        sizes = g["bytes"].dropna()
+        rows.append({
+            "stage": stage,
+            "name": name,
+            "calls": len(g),
+            "p50_ms": round(float(np.percentile(g["ms"], 50)), 2),
+            "p95_ms": round(float(np.percentile(g["ms"], 95)), 2),
+            "max_ms": round(float(g["ms"].max()), 2),
+            "total_ms": round(float(g["ms"].sum()), 1),
+            "cache_hit_pct": round(float(lookups.isin(["hit", "stale"]).mean() * 100), 1) if len(lookups) else None,
+            "avg_kb": round(float(sizes.mean()) / 1024, 1) if len(sizes) else None,
+            "errors": int(g["error"].notna().sum()),
+        })
+    return pd.DataFrame(rows).sort_values("total_ms", ascending=False).reset_index(drop=True)
+
+
+def chrome_trace(run):
+    """Chrome trace-event JSON (dict) of one rerun's spans."""
+    records = spans(run)
+    origin = min((r["start"] for r in records), default=0.0)
+    events = [{
+        "name": r["name"],
+        "cat": r["stage"],
+        "ph": "X",
+        "ts": round((r["start"] - origin) * 1e6, 1),
+        "dur": round(r["duration"] * 1e6, 1),
+        "pid": os.getpid(),
+        "tid": r["tid"],
+        "args": {k: r[k] for k in ("cache", "bytes", "error") if r[k] is not None},
+    } for r in records]
+    threads = {r["tid"]: r["thread"] for r in records}
+    events += [{"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid,
+                "args": {"name": thread}} for tid, thread in threads.items()]
+    return {"traceEvents": events, "displayTimeUnit": "ms",
+            "otherData": {"run": run, "spans": len(records)}}
+
+
+def reset():
+    with _lock:
+        _spans.clear()
@@ -0,0 +1,130 @@
+"""
+TradeIntel Pro - Market Screener
+Scans every ticker in config.MARKETS in parallel and ranks them by master signal.
+
+Each symbol is analysed in a worker process (indicators → oscillator/MA
+summaries → overall rating → master signal). ML and news sentiment are left
+neutral here: training ~100 ensembles per scan would take minutes, so the
+screener ranks on the technical component and the full pipeline stays on
+the per-ticker dashboard.
+"""
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+import pandas as pd
+
+from config import MARKETS, MAX_WORKERS
+from core import cache, ohlcv_store, perf
+from core.technical_engine import (
+    compute_all_indicators, get_oscillator_summary,
+    get_ma_summary, get_overall_rating,
+)
+from core.signals import generate_master_signal
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool():
+    """Shared worker pool (spawned once per server process, reused by every scan)."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=MAX_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def _reset_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+# ═══════════════════════════════════════════════════════════════
+# PER-TICKER ANALYSIS (runs in a worker process)
+# ═══════════════════════════════════════════════════════════════
+def analyse_ticker(ticker, period="1y"):
+    """Technical rating + master signal for one ticker, or None if no data."""
+    df = ohlcv_store.get_history(ticker, period)
+    if df.empty or len(df) < 50:
+        return None
+    df = compute_all_indicators(df.reset_index())
+
+    osc_sum = get_oscillator_summary(df)
+    ma_sum = get_ma_summary(df)
+    rating_text, rating_score = get_overall_rating(osc_sum, ma_sum)
+    signal = generate_master_signal((rating_text, rating_score), None, 0.0)
+
+    close = df["Close"].dropna()
+    price = float(close.iloc[-1])
+    prev = float(close.iloc[-2]) if len(close) > 1 else price
+    latest = df.iloc[-1]
+    return {
+        "price": round(price, 2),
+        "change_pct": round((price / prev - 1) * 100, 2) if prev else 0.0,
+        "rating": rating_text,
+        "tech_score": round(float(rating_score), 4),
+        "buy": osc_sum[0] + ma_sum[0],
+        "neutral": osc_sum[1] + ma_sum[1],
+        "sell": osc_sum[2] + ma_sum[2],
+        "signal": signal["signal"],
+        "score": signal["score"],
+        "rsi": round(float(latest["RSI"]), 2) if not pd.isna(latest.get("RSI")) else None,
+        "adx": round(float(latest["ADX"]), 2) if not pd.isna(latest.get("ADX")) else None,
+    }
+
+
+# ═══════════════════════════════════════════════════════════════
+# UNIVERSE SCAN
+# ═══════════════════════════════════════════════════════════════
+def scan_universe(markets=None, period="1y"):
+    """
+    Analyse every ticker in `markets` (default: config.MARKETS) across the
+    worker pool. Returns a DataFrame ranked by master score, best first.
+    """
+    markets = markets or MARKETS
+    universe = [
+        (sym, name, market)
+        for market, tickers in markets.items()
+        for sym, name in tickers.items()
+    ]
+
+    pool = _get_pool()
+    futures = {pool.submit(analyse_ticker, sym, period): (sym, name, market)
+               for sym, name, market in universe}
+
+    rows = []
+    for fut in as_completed(futures):
+        sym, name, market = futures[fut]
+        try:
+            res = fut.result()
+        except BrokenProcessPool:
+            _reset_pool()
+            print("Screener worker pool died; it will be recreated on the next scan.")
+            break
+        except Exception as e:
+            print(f"Screener error for {sym}: {e}")
+            continue
+        if res:
+            rows.append({"symbol": sym, "name": name, "market": market, **res})
+
+    if not rows:
+        return pd.DataFrame()
+    table = pd.DataFrame(rows).sort_values("score", ascending=False).reset_index(drop=True)
+    table.insert(0, "rank", range(1, len(table) + 1))
+    return table
+
+
+@perf.traced("screener")
+@cache.memoize("screener", ttl=300)
+def get_screener_table(period="1y"):
+    """Cached full-universe scan for the dashboard."""
+    return scan_universe(period=period)
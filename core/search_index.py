@@ -0,0 +1,213 @@
+"""
+TradeIntel Pro - Ticker Search Index
+In-memory typeahead over every known asset, so search rarely leaves the process.
+
+Seeded from config MARKETS and INDICES plus every symbol remote search has
+ever returned (persisted to DATA_DIR/search_index.json). Lookups use a
+prefix table over symbol and name tokens, ranked exact symbol > symbol
+prefix > name prefix, with trigram fuzzy matching as the fallback for typos.
+"""
+
+import json
+import os
+import re
+import threading
+
+from config import DATA_DIR, MARKETS, INDICES
+
+INDEX_PATH = os.path.join(DATA_DIR, "search_index.json")
+MAX_PREFIX = 16            # longest token prefix stored in the prefix table
+FUZZY_MIN_SIMILARITY = 0.4
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_MARKET_TYPES = {
+    "🇮🇳 Indian Stocks": "Equity",
+    "🇺🇸 US / Robinhood": "Equity",
+    "🪙 Commodities": "Commodity",
+    "💱 Forex": "Currency",
+}
+
+
+def _exchange(symbol):
+    if symbol.startswith("^"):
+        return "INDEX"
+    for suffix, exchange in ((".NS", "NSI"), (".BO", "BSE"), ("=X", "CCY"), ("=F", "FUT")):
+        if symbol.endswith(suffix):
+            return exchange
+    return "US"
+
+
+def _symbol_tokens(symbol):
+    s = symbol.lower().lstrip("^")
+    base = re.split(r"[.=\-]", s)[0]
+    return {s, base} - {""}
+
+
+def _name_tokens(name):
+    words = _TOKEN.findall(name.lower())
+    return set(words) | ({"".join(words)} if len(words) > 1 else set())
+
+
+def _trigrams(text):
+    text = f"  {text} "
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+# ═══════════════════════════════════════════════════════════════
+# INDEX
+# ═══════════════════════════════════════════════════════════════
+class SearchIndex:
+    """Prefix + trigram index of {symbol, name, type, exchange} entries."""
+
+    def __init__(self):
+        self.entries = []
+        self._by_symbol = {}
+        self._symbol_prefix = {}   # prefix → ids (symbol tokens)
+        self._name_prefix = {}     # prefix → ids (name tokens)
+        self._trigram = {}         # trigram → ids
+        self._symbol_keys = []     # id → symbol tokens
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, symbol):
+        return symbol in self._by_symbol
+
+    def add(self, entry):
+        """Add one {symbol, name, type, exchange} entry; returns False if already known."""
+        symbol = entry.get("symbol", "")
+        with self._lock:
+            if not symbol or symbol in self._by_symbol:
+                return False
+            i = len(self.entries)
+            self.entries.append(dict(entry))
+            self._by_symbol[symbol] = i
+
+            sym_tokens = _symbol_tokens(symbol)
+            name_tokens = _name_tokens(entry.get("name", ""))
+            for table, tokens in ((self._symbol_prefix, sym_tokens), (self._name_prefix, name_tokens)):
+                for token in tokens:
+                    for k in range(1, min(len(token), MAX_PREFIX) + 1):
+                        table.setdefault(token[:k], set()).add(i)
+
+            grams = set()
+            for token in sym_tokens | name_tokens:
+                grams |= _trigrams(token)
+            for g in grams:
+                self._trigram.setdefault(g, set()).add(i)
+            self._symbol_keys.append(sym_tokens)
+            return True
+
+    def search(self, query, limit=20, fuzzy=True):
+        """
+        Best matches for `query`, as {symbol, name, type, exchange} dicts.
+        With fuzzy=False only exact/prefix matches are returned (no typo tier).
+        """
+        with self._lock:
+            return self._search(query, limit, fuzzy)
+
+    def _search(self, query, limit, fuzzy):
+        words = _TOKEN.findall(query.lower())
+        if not words:
+            return []
+        compact = "".join(words)
+        ranked = {}
+
+        def offer(ids, tier):
+            for i in ids:
+                if tier < ranked.get(i, (9,))[0]:
+                    ranked[i] = (tier, len(self.entries[i]["symbol"]), i)
+
+        # Symbol: exact, then prefix (on the query as typed, without spaces)
+        sym_hits = self._symbol_prefix.get(compact[:MAX_PREFIX], set())
+        offer((i for i in sym_hits if compact in self._symbol_keys[i]), 0)
+        offer(sym_hits, 1)
+
+        # Name: every query word must prefix some name (or symbol) token
+        name_hits = None
+        for w in words:
+            ids = self._name_prefix.get(w[:MAX_PREFIX], set()) | self._symbol_prefix.get(w[:MAX_PREFIX], set())
+            name_hits = ids if name_hits is None else name_hits & ids
+            if not name_hits:
+                break
+        offer(name_hits or (), 2)
+
+        # Fuzzy fallback for typos, only when nothing matched by prefix
+        if fuzzy and not ranked and len(compact) >= 3:
+            q_grams = _trigrams(compact)
+            counts = {}
+            for g in q_grams:
+                for i in self._trigram.get(g, ()):
+                    counts[i] = counts.get(i, 0) + 1
+            for i, shared in counts.items():
+                sim = shared / len(q_grams)
+                if sim >= FUZZY_MIN_SIMILARITY:
+                    ranked[i] = (3, -sim, i)
+
+        order = sorted(ranked.values())[:limit]
+        return [dict(self.entries[i]) for _, _, i in order]
+
+
+# ═══════════════════════════════════════════════════════════════
+# PERSISTENCE
+# ═══════════════════════════════════════════════════════════════
+def _load_remote():
+    if not os.path.exists(INDEX_PATH):
+        return []
+    try:
+        with open(INDEX_PATH) as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"Discarding unreadable search index {INDEX_PATH}: {e}")
+        return []
+
+
+def _save_remote(entries):
+    os.makedirs(os.path.dirname(INDEX_PATH), exist_ok=True)
+    tmp = f"{INDEX_PATH}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(entries, f)
+    os.replace(tmp, INDEX_PATH)
+
+
+_index = None
+_remote = []               # entries learned from remote search, in insertion order
+_index_lock = threading.Lock()
+
+
+def get_index():
+    """Process-wide index, built on first use."""
+    global _index, _remote
+    with _index_lock:
+        if _index is None:
+            index = SearchIndex()
+            for market, assets in MARKETS.items():
+                for symbol, name in assets.items():
+                    index.add({"symbol": symbol, "name": name,
+                               "type": _MARKET_TYPES.get(market, "Equity"),
+                               "exchange": _exchange(symbol)})
+            for symbol, name in INDICES.items():
+                index.add({"symbol": symbol, "name": name, "type": "Index", "exchange": "INDEX"})
+            _remote = [e for e in _load_remote() if index.add(e)]
+            _index = index
+        return _index
+
+
+def learn(results):
+    """Add remote search results to the index and persist any new symbols."""
+    global _remote
+    index = get_index()
+    new = [r for r in results if index.add(r)]
+    if new:
+        with _index_lock:
+            _remote = _remote + new
+            try:
+                _save_remote(_remote)
+            except Exception as e:
+                print(f"Search index save error: {e}")
+    return len(new)
+
+
+def search(query, limit=20, fuzzy=True):
+    return get_index().search(query, limit, fuzzy)
@@ -0,0 +1,97 @@
+"""
+TradeIntel Pro - Finance Sentiment Lexicon
+Word polarity weights (-1..1) for market headlines, used by the lexicon
+sentiment backend in news_engine.
+
+General-purpose lexicons mis-read finance copy ("liability", "tax",
+"crude" are not negative; "beat", "upgrade", "outperform" are strongly
+positive), so weights follow the Loughran-McDonald positive/negative
+word lists, graded by how strongly each word moves a headline.
+Inflected forms are listed explicitly: the scorer does no stemming.
+"""
+
+POSITIVE = {
+    # Price action
+    "surge": 0.8, "surges": 0.8, "surged": 0.8, "surging": 0.8,
+    "soar": 0.8, "soars": 0.8, "soared": 0.8, "soaring": 0.8,
+    "skyrocket": 0.9, "skyrockets": 0.9, "skyrocketed": 0.9,
+    "jump": 0.6, "jumps": 0.6, "jumped": 0.6,
+    "rally": 0.7, "rallies": 0.7, "rallied": 0.7, "rallying": 0.7,
+    "rebound": 0.5, "rebounds": 0.5, "rebounded": 0.5,
+    "recover": 0.4, "recovers": 0.4, "recovered": 0.4, "recovery": 0.4,
+    "gain": 0.5, "gains": 0.5, "gained": 0.5,
+    "rise": 0.4, "rises": 0.4, "rose": 0.4, "rising": 0.4,
+    "climb": 0.4, "climbs": 0.4, "climbed": 0.4,
+    "advance": 0.4, "advances": 0.4, "advanced": 0.3,
+    "high": 0.3, "highs": 0.4, "record": 0.4, "peak": 0.2,
+    "up": 0.2, "higher": 0.3, "green": 0.3,
+    "bull": 0.6, "bullish": 0.7, "uptrend": 0.6, "breakout": 0.6,
+    # Fundamentals
+    "beat": 0.7, "beats": 0.7, "topped": 0.6, "tops": 0.5,
+    "exceed": 0.6, "exceeds": 0.6, "exceeded": 0.6,
+    "profit": 0.5, "profits": 0.5, "profitable": 0.6, "profitability": 0.5,
+    "growth": 0.5, "grow": 0.4, "grows": 0.4, "grew": 0.4, "expansion": 0.4, "expand": 0.4,
+    "strong": 0.5, "stronger": 0.5, "strength": 0.5, "robust": 0.6, "solid": 0.4,
+    "upgrade": 0.7, "upgrades": 0.7, "upgraded": 0.7,
+    "outperform": 0.7, "outperforms": 0.7, "outperformed": 0.7, "overweight": 0.5,
+    "buy": 0.4, "accumulate": 0.4,
+    "dividend": 0.3, "buyback": 0.5, "buybacks": 0.5,
+    "approval": 0.5, "approved": 0.5, "approves": 0.5,
+    "win": 0.5, "wins": 0.5, "won": 0.5, "deal": 0.3, "partnership": 0.4,
+    "boost": 0.5, "boosts": 0.5, "boosted": 0.5,
+    "optimism": 0.6, "optimistic": 0.6, "confidence": 0.4, "confident": 0.4,
+    "improve": 0.4, "improves": 0.4, "improved": 0.4, "improvement": 0.4,
+    "positive": 0.5, "upbeat": 0.6, "favorable": 0.5, "opportunity": 0.3,
+    "success": 0.5, "successful": 0.5, "milestone": 0.4,
+    "raise": 0.3, "raises": 0.3, "raised": 0.3,
+    "easing": 0.3,
+}
+
+NEGATIVE = {
+    # Price action
+    "plunge": -0.8, "plunges": -0.8, "plunged": -0.8, "plunging": -0.8,
+    "crash": -0.9, "crashes": -0.9, "crashed": -0.9, "crashing": -0.9,
+    "tumble": -0.7, "tumbles": -0.7, "tumbled": -0.7,
+    "slump": -0.7, "slumps": -0.7, "slumped": -0.7,
+    "sink": -0.6, "sinks": -0.6, "sank": -0.6,
+    "fall": -0.4, "falls": -0.4, "fell": -0.4, "falling": -0.4,
+    "drop": -0.4, "drops": -0.4, "dropped": -0.4,
+    "decline": -0.4, "declines": -0.4, "declined": -0.4, "declining": -0.4,
+    "slide": -0.4, "slides": -0.4, "slid": -0.4,
+    "lose": -0.4, "loses": -0.4, "lost": -0.4,
+    "down": -0.2, "lower": -0.3, "low": -0.2, "lows": -0.4, "red": -0.3,
+    "selloff": -0.7, "sell-off": -0.7, "rout": -0.8, "bloodbath": -0.9,
+    "bear": -0.6, "bearish": -0.7, "downtrend": -0.6, "correction": -0.4,
+    "volatile": -0.3, "volatility": -0.2,
+    # Fundamentals
+    "miss": -0.6, "misses": -0.6, "missed": -0.6,
+    "loss": -0.6, "losses": -0.6, "deficit": -0.4,
+    "weak": -0.5, "weaker": -0.5, "weakness": -0.5, "sluggish": -0.4, "soft": -0.2,
+    "downgrade": -0.7, "downgrades": -0.7, "downgraded": -0.7,
+    "underperform": -0.7, "underperforms": -0.7, "underweight": -0.5,
+    "sell": -0.4,
+    "warning": -0.6, "warns": -0.6, "warned": -0.6, "profit-warning": -0.8,
+    "cuts": -0.2, "slash": -0.5, "slashes": -0.5, "slashed": -0.5,
+    "layoff": -0.6, "layoffs": -0.6, "job-cuts": -0.6,
+    "lawsuit": -0.5, "sued": -0.5, "probe": -0.5, "investigation": -0.5, "fraud": -0.9,
+    "fined": -0.5, "penalty": -0.5, "ban": -0.5, "banned": -0.5,
+    "default": -0.8, "defaults": -0.8, "bankruptcy": -0.9, "bankrupt": -0.9, "insolvency": -0.9,
+    "recession": -0.7, "slowdown": -0.5, "stagflation": -0.7, "inflation": -0.3,
+    "fear": -0.6, "fears": -0.6, "panic": -0.8, "worry": -0.5, "worries": -0.5,
+    "concern": -0.4, "concerns": -0.4, "uncertainty": -0.4, "risk": -0.3, "risks": -0.3,
+    "crisis": -0.8, "turmoil": -0.7, "pressure": -0.3, "headwinds": -0.5,
+    "negative": -0.5, "gloomy": -0.6, "pessimism": -0.6, "pessimistic": -0.6,
+    "fail": -0.6, "fails": -0.6, "failed": -0.6, "failure": -0.6,
+    "delay": -0.3, "delayed": -0.3, "halt": -0.5, "halted": -0.5, "suspend": -0.5, "suspended": -0.5,
+    "tariff": -0.3, "tariffs": -0.3, "sanctions": -0.4, "war": -0.5,
+    "hike": -0.2, "hikes": -0.2,
+}
+
+LEXICON = {**POSITIVE, **NEGATIVE}   # "cut" is left out: "rate cut" vs "job cut"
+
+# A negator flips the polarity of lexicon words up to NEGATION_SCOPE tokens after it
+NEGATORS = {"not", "no", "never", "without", "neither", "nor", "hardly", "barely",
+            "isn't", "aren't", "wasn't", "weren't", "don't", "doesn't", "didn't",
+            "won't", "can't", "cannot", "couldn't", "shouldn't", "fails", "failed"}
+NEGATION_SCOPE = 3
+NEGATION_FACTOR = -0.75    # "not strong" is weakly negative, not the mirror of "strong"
@@ -0,0 +1,129 @@
+"""
+TradeIntel Pro - Sentiment Store
+Persistent memo of headline sentiment scores (SQLite on disk).
+
+Headlines are normalized (Unicode NFKC, collapsed whitespace) and keyed by a
+blake2b hash of the result, so the same story syndicated across tickers,
+markets and cache refreshes is scored once per scorer, ever. Lookups go
+through a small in-process dict first, then one batched SQL query;
+only the misses are scored, and they are written back in one transaction.
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import unicodedata
+
+from textblob import TextBlob
+
+from config import DATA_DIR, SENTIMENT_MEMO_SIZE
+
+DB_PATH = os.path.join(DATA_DIR, "sentiment.sqlite")
+SQL_CHUNK = 500            # keys per IN (...) query, under SQLite's variable limit
+
+_WS = re.compile(r"\s+")
+_memo = {}                 # (scorer, key) → polarity
+_conn = None
+_lock = threading.Lock()
+
+
+def normalize(title):
+    return _WS.sub(" ", unicodedata.normalize("NFKC", title)).strip()
+
+
+def title_key(title):
+    """16-byte hash of the normalized title."""
+    return hashlib.blake2b(normalize(title).encode("utf-8"), digest_size=16).digest()
+
+
+def textblob_polarity(titles):
+    """TextBlob polarity (-1..1) for each title."""
+    return [TextBlob(t).sentiment.polarity for t in titles]
+
+
+# ═══════════════════════════════════════════════════════════════
+# DISK I/O
+# ═══════════════════════════════════════════════════════════════
+def _db():
+    global _conn
+    if _conn is None:
+        os.makedirs(DATA_DIR, exist_ok=True)
+        conn = sqlite3.connect(DB_PATH, timeout=10, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("""CREATE TABLE IF NOT EXISTS scores (
+                            scorer TEXT NOT NULL,
+                            key BLOB NOT NULL,
+                            polarity REAL NOT NULL,
+                            PRIMARY KEY (scorer, key)) WITHOUT ROWID""")
+        _conn = conn
+    return _conn
+
+
+def _load(scorer, keys):
+    found = {}
+    for i in range(0, len(keys), SQL_CHUNK):
+        chunk = keys[i:i + SQL_CHUNK]
+        rows = _db().execute(
+            f"SELECT key, polarity FROM scores WHERE scorer = ? AND key IN ({','.join('?' * len(chunk))})",
+            [scorer, *chunk],
+        )
+        found.update(rows)
+    return found
+
+
+def _save(scorer, scored):
+    with _db() as conn:
+        conn.executemany("INSERT OR REPLACE INTO scores VALUES (?, ?, ?)",
+                         [(scorer, k, p) for k, p in scored.items()])
+
+
+def _remember(scorer, scored):
+    if len(_memo) + len(scored) > SENTIMENT_MEMO_SIZE:
+        _memo.clear()
+    _memo.update(((scorer, k), p) for k, p in scored.items())
+
+
+# ═══════════════════════════════════════════════════════════════
+# SCORING
+# ═══════════════════════════════════════════════════════════════
+def score_titles(titles, scorer="textblob", score_fn=textblob_polarity):
+    """
+    Polarity for each title, in order. `score_fn(list_of_titles)` is only
+    called for normalized titles never scored before under `scorer`.
+    """
+    keys = [title_key(t) for t in titles]
+    result = {}
+    with _lock:
+        missing = []
+        for k in dict.fromkeys(keys):
+            p = _memo.get((scorer, k))
+            if p is None:
+                missing.append(k)
+            else:
+                result[k] = p
+        if missing:
+            try:
+                stored = _load(scorer, missing)
+            except sqlite3.Error as e:
+                print(f"Sentiment store read error: {e}")
+                stored = {}
+            result.update(stored)
+            _remember(scorer, stored)
+
+    todo = {}
+    for k, t in zip(keys, titles):
+        if k not in result and k not in todo:
+            todo[k] = normalize(t)
+    if todo:
+        scored = dict(zip(todo, (float(p) for p in score_fn(list(todo.values())))))
+        result.update(scored)
+        with _lock:
+            _remember(scorer, scored)
+            try:
+                _save(scorer, scored)
+            except sqlite3.Error as e:
+                print(f"Sentiment store write error: {e}")
+    return [result[k] for k in keys]
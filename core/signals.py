@@ -5,7 +5,10 @@ Fuses Technical Analysis + ML Predictions + Sentiment into a final trade signal.
 
 import numpy as np
 
+from core import perf
 
+
+@perf.traced("signals")
 def generate_master_signal(tech_rating, ml_results, sentiment_score):
     """
     Fuse all signals into a single master signal.
@@ -82,6 +85,7 @@ def generate_master_signal(tech_rating, ml_results, sentiment_score):
     }
 
 
+@perf.traced("signals")
 def get_trade_plan(signal_data, current_price, atr=None):
     """
     Generate a trade plan with entry, target, and stop-loss.
@@ -10,12 +10,38 @@ from ta.trend import MACD, ADXIndicator, CCIIndicator, EMAIndicator, SMAIndicato
 from ta.volatility import BollingerBands, AverageTrueRange
 from ta.volume import OnBalanceVolumeIndicator, MFIIndicator
 
+from core import cache, perf
+from core.indicator_kernel import compute_indicator_arrays
+
 
 # ═══════════════════════════════════════════════════════════════
 # COMPUTE ALL INDICATORS
 # ═══════════════════════════════════════════════════════════════
+@perf.traced("indicators")
+@cache.memoize("indicators", ttl=600)
 def compute_all_indicators(df):
-    """Compute comprehensive technical indicators on OHLCV data."""
+    """Compute comprehensive technical indicators on OHLCV data (fused NumPy kernel)."""
+    if df.empty or len(df) < 50:
+        return df
+
+    cols = compute_indicator_arrays(df['High'].to_numpy(), df['Low'].to_numpy(),
+                                    df['Close'].to_numpy(), df['Volume'].to_numpy())
+    close = df['Close'].to_numpy(dtype=np.float64)
+    nxt = np.empty_like(close)
+    nxt[:-1] = close[1:]
+    nxt[-1] = np.nan
+    cols['Target'] = (nxt > close).astype(int)
+
+    ind = pd.DataFrame(cols, index=df.index)
+    base = df.drop(columns=[c for c in ind.columns if c in df.columns])
+    return pd.concat([base, ind], axis=1)
+
+
+def compute_all_indicators_ta(df):
+    """
+    Reference implementation built from `ta` indicator objects.
+    Kept to validate and benchmark the fused kernel; not used by the app.
+    """
     if df.empty or len(df) < 50:
         return df
 
@@ -87,6 +113,7 @@ def compute_all_indicators(df):
 # ═══════════════════════════════════════════════════════════════
 # OSCILLATOR SUMMARY (TradingView Style)
 # ═══════════════════════════════════════════════════════════════
+@perf.traced("indicators")
 def get_oscillator_summary(df):
     """
     Returns oscillator buy/neutral/sell counts like TradingView.
@@ -194,6 +221,7 @@ def get_oscillator_summary(df):
 # ═══════════════════════════════════════════════════════════════
 # MOVING AVERAGES SUMMARY (TradingView Style)
 # ═══════════════════════════════════════════════════════════════
+@perf.traced("indicators")
 def get_ma_summary(df):
     """
     Returns moving average buy/neutral/sell counts.
@@ -237,6 +265,7 @@ def get_ma_summary(df):
 # ═══════════════════════════════════════════════════════════════
 # OVERALL TECHNICAL RATING
 # ═══════════════════════════════════════════════════════════════
+@perf.traced("indicators")
 def get_overall_rating(osc_summary, ma_summary):
     """
     Combines oscillator and MA summaries into an overall rating.
@@ -267,6 +296,93 @@ def get_overall_rating(osc_summary, ma_summary):
         return "Neutral", score
 
 
+# ═══════════════════════════════════════════════════════════════
+# RATING HISTORY (vectorized, one row per bar)
+# ═══════════════════════════════════════════════════════════════
+# (column, buy below, sell above) — the oscillator bands used above
+_OSC_BANDS = (
+    ('RSI', 30, 70), ('Stoch_K', 20, 80), ('CCI', -100, 100),
+    ('Williams_R', -80, -20), ('MFI', 20, 80),
+)
+_MA_COLUMNS = ('EMA_12', 'EMA_26', 'SMA_10', 'SMA_20', 'SMA_50', 'SMA_100', 'SMA_200')
+
+
+def _col(df, name):
+    return df[name].to_numpy(dtype=np.float64) if name in df.columns else None
+
+
+def _tally(n):
+    counts = {"buy": np.zeros(n, dtype=np.int64),
+              "neutral": np.zeros(n, dtype=np.int64),
+              "sell": np.zeros(n, dtype=np.int64)}
+
+    def vote(present, buy_mask, sell_mask):
+        b = present & buy_mask
+        s = present & sell_mask & ~b
+        counts["buy"] += b
+        counts["sell"] += s
+        counts["neutral"] += present & ~b & ~s
+
+    return counts, vote
+
+
+def get_oscillator_summary_series(df):
+    """
+    get_oscillator_summary for every bar at once.
+    Returns a DataFrame (same index as df) with buy / neutral / sell counts.
+    """
+    counts, vote = _tally(len(df))
+    with np.errstate(invalid="ignore"):
+        for name, lo, hi in _OSC_BANDS:
+            v = _col(df, name)
+            if v is not None:
+                vote(~np.isnan(v), v < lo, v > hi)
+
+        adx, pos, neg = _col(df, 'ADX'), _col(df, 'ADX_Pos'), _col(df, 'ADX_Neg')
+        if adx is not None and pos is not None and neg is not None:
+            vote(~np.isnan(adx), pos > neg, neg > pos)
+
+        macd, sig = _col(df, 'MACD'), _col(df, 'MACD_Signal')
+        if macd is not None and sig is not None:
+            up = macd > sig
+            vote(~np.isnan(macd), up, ~up)
+    return pd.DataFrame(counts, index=df.index)
+
+
+def get_ma_summary_series(df):
+    """
+    get_ma_summary for every bar at once.
+    Returns a DataFrame (same index as df) with buy / neutral / sell counts.
+    """
+    counts, vote = _tally(len(df))
+    price = _col(df, 'Close')
+    with np.errstate(invalid="ignore"):
+        for name in _MA_COLUMNS:
+            ma = _col(df, name)
+            if ma is not None:
+                vote(~np.isnan(ma), price > ma * 1.001, price < ma * 0.999)
+    return pd.DataFrame(counts, index=df.index)
+
+
+def get_overall_rating_series(osc_series, ma_series):
+    """
+    get_overall_rating for every bar at once.
+    Returns a DataFrame with buy / neutral / sell totals, score and rating text.
+    """
+    total = osc_series + ma_series
+    buy = total['buy'].to_numpy()
+    sell = total['sell'].to_numpy()
+    n = buy + total['neutral'].to_numpy() + sell
+    score = np.where(n > 0, (buy - sell) / np.maximum(n, 1), 0.0)
+    rating = np.select(
+        [n == 0, score > 0.5, score > 0.15, score < -0.5, score < -0.15],
+        ["Neutral", "Strong Buy", "Buy", "Strong Sell", "Sell"],
+        default="Neutral",
+    )
+    return total.assign(score=score, rating=rating)
+
+
+@perf.traced("indicators")
 def get_support_resistance(df, lookback=50):
     """Calculate support and resistance levels."""
     if df.empty or len(df) < lookback:
@@ -0,0 +1,169 @@
+"""
+TradeIntel Pro - Training Job Queue
+Background ML training on a process pool, decoupled from the Streamlit rerun.
+
+Jobs are keyed by content (ticker + data hash), so identical requests from
+any session share one in-flight run. Workers report progress through a
+Manager dict; the UI polls `get_job()` and meanwhile shows `latest_result()`,
+the last completed run for the ticker. Job records stay small: results live
+in the "ml" cache, within its byte budget.
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from config import TRAINING_WORKERS, TRAINING_JOB_RETENTION
+from core import cache, cpu_budget
+
+_lock = threading.Lock()
+_pool = None
+_manager = None
+_progress = None           # Manager dict: job_id → (fraction, stage)
+_jobs = {}                 # job_id → job record
+_by_key = {}               # content key → job_id
+
+
+def _ensure_pool():
+    global _pool, _manager, _progress
+    if _pool is None:
+        ctx = multiprocessing.get_context("spawn")
+        if _manager is None:
+            _manager = ctx.Manager()
+            _progress = _manager.dict()
+        # Each worker trains within its share of the machine's cores
+        cores = max(1, (os.cpu_count() or 1) // TRAINING_WORKERS)
+        _pool = ProcessPoolExecutor(max_workers=TRAINING_WORKERS, mp_context=ctx,
+                                    initializer=cpu_budget.configure, initargs=(cores,))
+    return _pool
+
+
+# ═══════════════════════════════════════════════════════════════
+# WORKER SIDE
+# ═══════════════════════════════════════════════════════════════
+def _run_job(job_id, progress, fn, args):
+    def report(fraction, stage):
+        try:
+            progress[job_id] = (float(fraction), stage)
+        except Exception:
+            pass  # progress is best-effort; never fail the job over it
+
+    return fn(*args, progress=report)
+
+
+# ═══════════════════════════════════════════════════════════════
+# PUBLIC API
+# ═══════════════════════════════════════════════════════════════
+def submit(key, ticker, fn, *args):
+    """
+    Queue `fn(*args, progress=...)` unless an identical job (same `key`) is
+    already queued, running, or recently finished. Returns the job id.
+    """
+    with _lock:
+        _prune()
+        job_id = _by_key.get(key)
+        if job_id and _jobs[job_id]["status"] != "failed":
+            return job_id
+
+        pool = _ensure_pool()
+        job_id = uuid.uuid4().hex[:12]
+        job = {
+            "id": job_id, "key": key, "ticker": ticker,
+            "status": "queued", "stage": "Queued", "progress": 0.0,
+            "submitted": time.time(), "finished": None, "error": None,
+        }
+        _jobs[job_id] = job
+        _by_key[key] = job_id
+        try:
+            future = pool.submit(_run_job, job_id, _progress, fn, args)
+        except BrokenProcessPool:
+            _reset_pool()
+            future = _ensure_pool().submit(_run_job, job_id, _progress, fn, args)
+    future.add_done_callback(lambda f: _finish(job_id, f))
+    return job_id
+
+
+def get_job(job_id):
+    """
+    Snapshot of a job record (status, stage, progress, result, error) or None.
+    A done job's result is read back from the cache (None if it was evicted).
+    """
+    with _lock:
+        job = _jobs.get(job_id)
+        if job is None:
+            return None
+        if job["status"] in ("queued", "running") and _progress is not None:
+            try:
+                fraction, stage = _progress.get(job_id, (None, None))
+            except Exception:
+                fraction = None
+            if fraction is not None:
+                job["status"] = "running"
+                job["progress"] = fraction
+                job["stage"] = stage
+        snapshot = dict(job)
+    snapshot["result"] = cache.store.get("ml", ("job_result", job_id)) if snapshot["status"] == "done" else None
+    return snapshot
+
+
+def latest_result(ticker):
+    """Most recent completed result for a ticker, from any session (or None)."""
+    job_id = cache.store.get("ml", ("latest_job", ticker))
+    return cache.store.get("ml", ("job_result", job_id)) if job_id else None
+
+
+def active_jobs():
+    """Records of all queued/running jobs (for diagnostics)."""
+    with _lock:
+        return [dict(j) for j in _jobs.values() if j["status"] in ("queued", "running")]
+
+
+# ═══════════════════════════════════════════════════════════════
+# BOOKKEEPING
+# ═══════════════════════════════════════════════════════════════
+def _finish(job_id, future):
+    with _lock:
+        job = _jobs.get(job_id)
+        if job is None:
+            return
+        job["finished"] = time.time()
+        try:
+            result = future.result()
+            job["status"] = "done"
+            job["progress"] = 1.0
+            job["stage"] = "Done"
+            # Results are bounded by the cache budget and expire with the job
+            cache.store.put("ml", ("job_result", job_id), result, ttl=TRAINING_JOB_RETENTION)
+            cache.store.put("ml", ("latest_job", job["ticker"]), job_id, ttl=TRAINING_JOB_RETENTION)
+        except BrokenProcessPool as e:
+            job["status"] = "failed"
+            job["error"] = f"Training worker crashed: {e}"
+            _reset_pool()
+        except Exception as e:
+            job["status"] = "failed"
+            job["error"] = str(e)
+        if _progress is not None:
+            try:
+                _progress.pop(job_id, None)
+            except Exception:
+                pass
+
+
+def _reset_pool():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+    _pool = None
+
+
+def _prune():
+    cutoff = time.time() - TRAINING_JOB_RETENTION
+    stale = [jid for jid, j in _jobs.items() if j["finished"] and j["finished"] < cutoff]
+    for jid in stale:
+        job = _jobs.pop(jid)
+        if _by_key.get(job["key"]) == jid:
+            del _by_key[job["key"]]
@@ -0,0 +1,13 @@
+"""
+TradeIntel Pro - Test configuration
+Tests run against a throwaway data directory (config reads it at import
+time, so it is set before any core module is imported).
+"""
+
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("TRADEINTEL_DATA_DIR", tempfile.mkdtemp(prefix="tradeintel-tests-"))
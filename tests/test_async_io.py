@@ -0,0 +1,94 @@
+"""Async I/O layer against the local fake search server."""
+
+import concurrent.futures
+import time
+
+import pytest
+
+from benchmarks.fake_search import FakeSearchServer
+from config import HOST_RATE_BURST, HOST_RATE_LIMIT, HTTP_POOL_SIZE
+from core import async_io
+
+
+@pytest.fixture
+def server(monkeypatch):
+    """A fresh server per test: its own port, so its own token bucket."""
+    srv = FakeSearchServer(("127.0.0.1", 0)).start()
+    monkeypatch.setattr(async_io, "SEARCH_URL", srv.url)
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def test_search_returns_parsed_quotes(server):
+    results = async_io.search_sync("reliance", channel="parse")
+    assert results and results[0]["symbol"] == "RELIANCE.NS"
+    assert set(results[0]) == {"symbol", "name", "type", "exchange"}
+
+
+def test_sequential_requests_reuse_one_connection(server):
+    for _ in range(5):
+        assert async_io.search_sync("tcs", channel="pool")
+    assert server.hits == 5
+    assert len(server.connections) == 1
+
+
+def test_concurrent_requests_stay_within_pool(server):
+    server.delay = 0.2
+
+    async def burst():
+        return await async_io.gather_partial(
+            {i: async_io.fetch_search("bank") for i in range(HOST_RATE_BURST)}, timeout=5)
+
+    results = async_io.run(burst(), timeout=10)
+    assert len(results) == HOST_RATE_BURST
+    assert 1 < len(server.connections) <= HTTP_POOL_SIZE
+
+
+def test_token_bucket_throttles_past_burst(server):
+    extra = 5
+
+    async def flood():
+        return await async_io.gather_partial(
+            {i: async_io.fetch_search("infosys") for i in range(HOST_RATE_BURST + extra)}, timeout=10)
+
+    start = time.monotonic()
+    results = async_io.run(flood(), timeout=15)
+    elapsed = time.monotonic() - start
+    assert len(results) == HOST_RATE_BURST + extra
+    # The burst goes out at once, the rest at HOST_RATE_LIMIT per second
+    assert elapsed >= (extra - 1) / HOST_RATE_LIMIT
+
+
+def test_newer_query_supersedes_older_on_same_channel(server):
+    server.delay = 0.5
+    older = async_io.spawn(async_io.search("hdfc", channel="typing"))
+    time.sleep(0.1)
+    newer = async_io.search_sync("icici", channel="typing")
+    assert older.result(timeout=5) is None
+    assert newer and newer[0]["symbol"] == "ICICIBANK.NS"
+
+
+def test_other_channels_are_not_cancelled(server):
+    server.delay = 0.3
+    first = async_io.spawn(async_io.search("hdfc", channel="session-a"))
+    time.sleep(0.05)
+    assert async_io.search_sync("icici", channel="session-b")
+    assert first.result(timeout=5)
+
+
+def test_cancelling_the_caller_still_raises(server):
+    server.delay = 1.0
+    future = async_io.spawn(async_io.search("wipro", channel="cancel"))
+    time.sleep(0.1)
+    future.cancel()
+    with pytest.raises(concurrent.futures.CancelledError):
+        future.result(timeout=5)
+
+
+def test_search_sync_times_out_to_empty(server, monkeypatch):
+    monkeypatch.setattr(async_io, "HTTP_TIMEOUT", 0.2)
+    server.delay = 3.0
+    start = time.monotonic()
+    assert async_io.search_sync("tata", channel="slow") == []
+    assert time.monotonic() - start < 2.5
@@ -0,0 +1,91 @@
+"""Fill and exit rules of the backtest simulator, on hand-built bars."""
+
+import numpy as np
+import pandas as pd
+
+from core.backtest import _one_at_a_time, _simulate
+
+MAX_HOLD = 3
+
+
+def _run(bars, orders, allow_short=True):
+    """bars: [(open, high, low, close)]; orders: {signal bar: (side, entry, target, stop)}."""
+    df = pd.DataFrame(bars, columns=["Open", "High", "Low", "Close"])
+    n = len(df)
+    side, entry, target, stop = np.zeros(n), np.zeros(n), np.zeros(n), np.zeros(n)
+    for i, (sd, e, tg, sp) in orders.items():
+        side[i], entry[i], target[i], stop[i] = sd, e, tg, sp
+    return _simulate(df, side, entry, target, stop, MAX_HOLD, allow_short)
+
+
+def _only(cand):
+    assert len(cand["signal_idx"]) == 1
+    return {k: v[0] for k, v in cand.items()}
+
+
+LONG = {0: (1, 101.0, 105.0, 97.0)}
+SHORT = {0: (-1, 99.0, 95.0, 103.0)}
+FLAT = (100.0, 100.5, 99.5, 100.0)
+
+
+def test_buy_stop_fills_at_entry_and_exits_at_target():
+    tr = _only(_run([FLAT, (100, 102, 99.5, 101.5), (101.5, 106, 100, 105.5), FLAT], LONG))
+    assert (tr["entry_idx"], tr["entry"]) == (1, 101.0)
+    assert (tr["exit_idx"], tr["exit"], tr["reason"]) == (2, 105.0, "target")
+
+
+def test_gap_above_buy_stop_fills_at_the_open():
+    tr = _only(_run([FLAT, (103, 104, 102.5, 103.5), (103.5, 106, 103, 105.5), FLAT], LONG))
+    assert tr["entry"] == 103.0
+
+
+def test_unfilled_order_is_cancelled():
+    assert len(_run([FLAT, FLAT, FLAT, FLAT], LONG)["signal_idx"]) == 0
+
+
+def test_stop_before_target_in_the_same_bar():
+    tr = _only(_run([FLAT, (100, 102, 99.5, 101.5), (101.5, 106, 96, 100), FLAT], LONG))
+    assert (tr["exit_idx"], tr["exit"], tr["reason"]) == (2, 97.0, "stop")
+
+
+def test_gap_through_stop_fills_at_the_open():
+    tr = _only(_run([FLAT, (100, 102, 99.5, 101.5), (95, 96, 94, 95.5), FLAT], LONG))
+    assert (tr["exit_idx"], tr["exit"], tr["reason"]) == (2, 95.0, "stop")
+
+
+def test_gap_through_target_fills_at_the_open():
+    tr = _only(_run([FLAT, (100, 102, 99.5, 101.5), (107, 108, 106, 107.5), FLAT], LONG))
+    assert (tr["exit_idx"], tr["exit"], tr["reason"]) == (2, 107.0, "target")
+
+
+def test_stop_touched_on_the_fill_bar_is_taken():
+    tr = _only(_run([FLAT, (100, 106, 96, 101), FLAT, FLAT], LONG))
+    assert (tr["entry_idx"], tr["exit_idx"], tr["exit"], tr["reason"]) == (1, 1, 97.0, "stop")
+
+
+def test_time_exit_at_the_close_after_max_hold():
+    bars = [FLAT, (100, 102, 99.5, 101.5)] + [(101, 102, 100, 101.2)] * 3 + [(101, 102, 100, 101.8)] + [FLAT]
+    tr = _only(_run(bars, LONG))
+    assert (tr["exit_idx"], tr["exit"], tr["reason"]) == (1 + MAX_HOLD, 101.2, "time")
+
+
+def test_end_of_data_exit_at_the_last_close():
+    tr = _only(_run([FLAT, (100, 102, 99.5, 101.5), (101, 102, 100, 101.3)], LONG))
+    assert (tr["exit_idx"], tr["exit"], tr["reason"]) == (2, 101.3, "end")
+
+
+def test_sell_stop_mirrors_the_long_rules():
+    tr = _only(_run([FLAT, (100, 100.5, 98, 98.5), (98.5, 99, 94, 94.5), FLAT], SHORT))
+    assert (tr["entry"], tr["exit_idx"], tr["exit"], tr["reason"]) == (99.0, 2, 95.0, "target")
+    assert _run([FLAT, (100, 100.5, 98, 98.5), FLAT, FLAT], SHORT, allow_short=False) is None
+
+
+def test_one_position_at_a_time():
+    bars = [FLAT, (100, 102, 99.5, 101.5), (101.5, 103, 101, 102), (102, 106, 101.5, 105.5),
+            (105, 106, 104.5, 105.5), (105.5, 107, 105, 106.5), FLAT, FLAT, FLAT]
+    orders = {0: (1, 101.0, 105.0, 97.0),         # fills bar 1, target on bar 3
+              1: (1, 102.5, 110.0, 99.0),         # placed while the first trade is open
+              3: (1, 105.8, 106.2, 104.0)}        # placed at the first trade's exit bar
+    taken = _one_at_a_time(_run(bars, orders))
+    assert list(taken["signal_idx"]) == [0, 3]
+    assert list(taken["exit_idx"]) == [3, 5]
@@ -0,0 +1,42 @@
+import pandas as pd
+
+from core import cache
+
+
+def test_memoized_results_are_detached_deeply():
+    store = cache.MemoryCache(1 << 20)
+
+    @cache.memoize("news", cache=store)
+    def articles():
+        return [{"title": "a", "tags": ["x"]}], pd.DataFrame({"Close": [1.0, 2.0]})
+
+    items, df = articles()
+    items[0]["cluster"] = 3
+    items[0]["tags"].append("y")
+    df.loc[0, "Close"] = 99.0
+
+    items, df = articles()
+    assert items == [{"title": "a", "tags": ["x"]}]
+    assert df["Close"].tolist() == [1.0, 2.0]
+
+
+def test_rejected_overwrite_drops_the_stale_value():
+    store = cache.MemoryCache(1 << 10)
+    assert store.put("market", "k", "small")
+    assert not store.put("market", "k", "x" * 4096)
+    assert store.get("market", "k") is None
+
+
+def test_same_named_functions_in_different_modules_do_not_share_entries():
+    store = cache.MemoryCache(1 << 20)
+
+    def make(module, value):
+        def quote():
+            return value
+        quote.__module__ = module
+        return cache.memoize("market", cache=store)(quote)
+
+    a, b = make("core.a", 1), make("core.b", 2)
+    assert (a(), b()) == (1, 2)
+    a.clear()
+    assert store.stats()[0]["entries"] == 1
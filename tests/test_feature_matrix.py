@@ -0,0 +1,26 @@
+import numpy as np
+import pandas as pd
+
+from core import cache, feature_matrix
+
+
+def _frame(n=300, seed=3):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(rng.normal(size=(n, 4)), columns=["RSI", "MACD", "ADX", "Close"])
+    df["Target"] = (rng.random(n) > 0.5).astype(float)
+    return df
+
+
+def test_derived_products_count_against_the_ml_quota(monkeypatch):
+    store = cache.MemoryCache(1 << 24)
+    monkeypatch.setattr(cache, "store", store)
+    ml_bytes = lambda: {r["namespace"]: r["bytes"] for r in store.stats()}.get("ml", 0)
+
+    fm = feature_matrix.build(_frame(), ["RSI", "MACD", "ADX", "Close"])
+    before = ml_bytes()
+    X, scaler = fm.scaled(["RSI", "MACD", "Close"], lag_columns=["Close"])
+
+    assert ml_bytes() >= before + X.nbytes
+    again, _ = feature_matrix.build(_frame(), ["RSI", "MACD", "ADX", "Close"]).scaled(
+        ["RSI", "MACD", "Close"], lag_columns=["Close"])
+    assert again is X
@@ -0,0 +1,21 @@
+"""Single-flight history cache: failed (empty) fetches are retried, not cached."""
+
+import pandas as pd
+
+from benchmarks.synthetic import synthetic_ohlcv
+from core import data_engine, ohlcv_store
+
+
+def test_empty_fetch_is_not_cached(monkeypatch):
+    frames = [pd.DataFrame(), synthetic_ohlcv(30).set_index("Date")]
+    calls = []
+
+    def fake_update(ticker):
+        calls.append(ticker)
+        return frames[min(len(calls), len(frames)) - 1]
+
+    monkeypatch.setattr(ohlcv_store, "update", fake_update)
+    assert data_engine.load_history("EMPTYFIRST").empty
+    assert len(data_engine.load_history("EMPTYFIRST")) == 30
+    assert len(data_engine.load_history("EMPTYFIRST")) == 30
+    assert calls == ["EMPTYFIRST", "EMPTYFIRST"]
@@ -0,0 +1,31 @@
+from core.news_dedup import DedupIndex
+
+
+def test_concurrent_cluster_of_same_title_registers_once():
+    index = DedupIndex(capacity=4)
+    signature = index.signature
+    raced = []
+
+    def racing_signature(text):
+        # Another thread clusters the same headline while this one hashes it
+        if not raced:
+            index.signature = signature
+            raced.append(index.cluster("Fed raises rates again"))
+        return signature(text)
+
+    index.signature = racing_signature
+    cid = index.cluster("Fed raises rates again")
+
+    assert cid == raced[0]
+    assert len(index) == 1
+    assert index._texts[cid] == ["fed raises rates again"]
+
+
+def test_eviction_drops_exact_entries():
+    index = DedupIndex(capacity=2)
+    first = index.cluster("Oil prices slump on demand worries")
+    index.cluster("Tech stocks rally after earnings beat")
+    index.cluster("Gold hits record high amid uncertainty")
+
+    assert len(index) == 2
+    assert index.cluster("Oil prices slump on demand worries") != first
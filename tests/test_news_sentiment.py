@@ -0,0 +1,23 @@
+from core import news_dedup, news_engine
+
+
+def _article(title, sentiment):
+    return {"title": title, "sentiment": sentiment}
+
+
+def test_batch_scores_dedupe_each_feed_once(monkeypatch):
+    calls = []
+    dedupe = news_dedup.dedupe
+    monkeypatch.setattr(news_dedup, "dedupe", lambda articles: calls.append(len(articles)) or dedupe(articles))
+
+    feeds = {
+        "AAA": [_article("Chipmaker beats earnings estimates on strong AI demand", 0.5),
+                _article("Chipmaker beats earnings estimates on strong AI demand", 0.5),
+                _article("Regulators open probe into chipmaker pricing", -0.5)],
+        "BBB": [_article("Oil slides as inventories climb for a third week", -0.3)],
+    }
+    scores = news_engine.compute_sentiment_scores(feeds)
+
+    assert calls == [3, 1]
+    assert scores["AAA"] == (0.0, "Neutral", {"positive": 1, "negative": 1, "neutral": 0})
+    assert scores["BBB"][1] == "Bearish"
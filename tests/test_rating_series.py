@@ -0,0 +1,49 @@
+"""The vectorized rating history must give the scalar rules' answer on every bar."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import synthetic_ohlcv
+from core.technical_engine import (
+    compute_all_indicators, get_ma_summary, get_ma_summary_series, get_oscillator_summary,
+    get_oscillator_summary_series, get_overall_rating, get_overall_rating_series,
+)
+
+
+def _assert_matches_scalar(df):
+    osc = get_oscillator_summary_series(df)
+    ma = get_ma_summary_series(df)
+    rating = get_overall_rating_series(osc, ma)
+    for i in range(len(df)):
+        upto = df.iloc[:i + 1]
+        osc_i, ma_i = get_oscillator_summary(upto), get_ma_summary(upto)
+        text, score = get_overall_rating(osc_i, ma_i)
+        assert tuple(osc[["buy", "neutral", "sell"]].iloc[i]) == osc_i[:3], i
+        assert tuple(ma[["buy", "neutral", "sell"]].iloc[i]) == ma_i[:3], i
+        assert rating["score"].iloc[i] == pytest.approx(score), i
+        assert rating["rating"].iloc[i] == text, i
+
+
+def test_every_bar_of_synthetic_history():
+    _assert_matches_scalar(compute_all_indicators(synthetic_ohlcv(400)))
+
+
+def test_edge_cases():
+    df = compute_all_indicators(synthetic_ohlcv(60, seed=2)).tail(6).reset_index(drop=True)
+    df.loc[0, "MACD_Signal"] = np.nan                        # NaN signal: MACD counts as sell
+    df.loc[1, ["ADX_Pos", "ADX_Neg"]] = 25.0                 # ADX tie: neutral
+    df.loc[2, "ADX_Pos"] = np.nan                            # NaN direction: neutral
+    df.loc[3, "MACD"] = np.nan                               # NaN MACD: no vote
+    df.loc[4, "SMA_20"] = df.loc[4, "Close"]                 # price inside the MA buffer: neutral
+    df.loc[5, df.columns.difference(["Date", "Open", "High", "Low", "Close", "Volume"])] = np.nan
+    _assert_matches_scalar(df)
+
+    osc = get_oscillator_summary_series(df)
+    assert osc.loc[5].sum() == 0
+    assert get_overall_rating_series(osc, get_ma_summary_series(df))["rating"].iloc[5] == "Neutral"
+
+
+def test_missing_columns():
+    df = compute_all_indicators(synthetic_ohlcv(80, seed=4)).drop(columns=["MFI", "ADX_Neg", "SMA_200"])
+    _assert_matches_scalar(df.tail(10))
@@ -0,0 +1,46 @@
+"""Ticker search: local index first, Yahoo for anything it only fuzzy-matches."""
+
+import pytest
+
+from core import async_io, data_engine
+
+ELXSI = {"symbol": "TATAELXSI.NS", "name": "Tata Elxsi Limited", "type": "Equity", "exchange": "NSI"}
+
+
+@pytest.fixture
+def remote(monkeypatch):
+    calls = []
+
+    def fake_search_sync(query, max_results=20, channel="default"):
+        calls.append(query)
+        return [ELXSI] if "elxsi" in query.lower() else []
+
+    monkeypatch.setattr(async_io, "search_sync", fake_search_sync)
+    return calls
+
+
+def test_prefix_match_stays_local(remote):
+    results = data_engine.search_tickers("reliance")
+    assert results[0]["symbol"] == "RELIANCE.NS"
+    assert remote == []
+
+
+def test_fuzzy_only_match_queries_remote_first(remote):
+    results = data_engine.search_tickers("tata elxsi")
+    assert remote == ["tata elxsi"]
+    assert results[0]["symbol"] == "TATAELXSI.NS"
+    # Local typo matches still follow the remote ones
+    assert any(r["symbol"].startswith("TATA") and r is not results[0] for r in results[1:])
+
+
+def test_remote_results_are_learned(remote):
+    data_engine.search_tickers("tata elxsi")
+    remote.clear()
+    assert data_engine.search_tickers("tataelxsi")[0]["symbol"] == "TATAELXSI.NS"
+    assert remote == []
+
+
+def test_fuzzy_matches_survive_remote_failure(remote):
+    results = data_engine.search_tickers("hdfc lyfe")
+    assert remote == ["hdfc lyfe"]
+    assert results and all(r["symbol"] != "TATAELXSI.NS" for r in results)
@@ -0,0 +1,31 @@
+from concurrent.futures import Future
+
+from core import cache, training_queue
+
+
+def _finished(job_id, ticker, result):
+    training_queue._jobs[job_id] = {
+        "id": job_id, "key": ("test", job_id), "ticker": ticker,
+        "status": "running", "stage": "Training", "progress": 0.5,
+        "submitted": 0.0, "finished": None, "error": None,
+    }
+    future = Future()
+    future.set_result(result)
+    training_queue._finish(job_id, future)
+
+
+def test_results_live_in_the_cache_not_the_job_record(monkeypatch):
+    monkeypatch.setattr(cache, "store", cache.MemoryCache(1 << 20))
+    monkeypatch.setattr(training_queue, "_jobs", {})
+
+    _finished("job1", "TQ", {"models": {"Random Forest": {"accuracy": 51.0}}})
+
+    assert "result" not in training_queue._jobs["job1"]
+    job = training_queue.get_job("job1")
+    assert job["status"] == "done"
+    assert job["result"] == {"models": {"Random Forest": {"accuracy": 51.0}}}
+    assert training_queue.latest_result("TQ") == job["result"]
+
+    cache.store.clear("ml")
+    assert training_queue.get_job("job1")["result"] is None
+    assert training_queue.latest_result("TQ") is None
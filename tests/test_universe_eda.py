@@ -0,0 +1,36 @@
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from core import eda_engine, ohlcv_store
+
+MARKETS = {"Test": {f"T{i}": f"Ticker {i}" for i in range(6)}}
+
+
+def _history(seed):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2024-01-01", periods=120)
+    return pd.DataFrame({"Date": dates, "Close": 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 120)))})
+
+
+def test_histories_are_fetched_concurrently(monkeypatch):
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def get_history(sym, period):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.1)
+        with lock:
+            active[0] -= 1
+        return pd.DataFrame() if sym == "T5" else _history(int(sym[1:]))
+
+    monkeypatch.setattr(ohlcv_store, "get_history", get_history)
+    table = eda_engine.universe_eda(MARKETS)
+
+    assert peak[0] > 1
+    assert sorted(table["ticker"]) == ["T0", "T1", "T2", "T3", "T4"]
+    assert set(table["market"]) == {"Test"}